@@ -55,6 +55,49 @@ class CrewAIService {
       };
     }
   }
+
+  /**
+   * Initialize content approval for many gists in one request
+   *
+   * Gists sharing a link are approved by a single backend job.
+   *
+   * @param items Gists to approve, each with its user ID, gist ID and link URL
+   * @returns Promise with per-item job IDs (in request order)
+   */
+  public async initiateBatchContentApproval(
+    items: Array<{ userId: string; gistId: string; linkUrl: string }>
+  ): Promise<any> {
+    console.log(`Initiating batch content approval for ${items.length} gists`);
+
+    try {
+      const response = await axios.post(
+        `${this.baseUrl}/api/content/approve/batch`,
+        {
+          items: items.map(({ userId, gistId, linkUrl }) => ({
+            userId,
+            gistId,
+            gistData: { link: linkUrl }
+          }))
+        },
+        {
+          headers: {
+            'X-API-Key': this.apiKey,
+            'Content-Type': 'application/json'
+          }
+        }
+      );
+
+      return response.data;
+    } catch (error) {
+      console.error('Error initiating batch content approval:', error);
+
+      return {
+        success: false,
+        error: 'Failed to initiate batch content approval',
+        details: error instanceof Error ? error.message : String(error)
+      };
+    }
+  }
 }
 
 // Export a singleton instance
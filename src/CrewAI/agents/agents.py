@@ -1,9 +1,12 @@
 from crewai import Agent
+from CrewAI.config.llm_cache import configure_llm_cache
 
 def create_content_agents():
     """
     Create and return the content creation agents
     """
+    configure_llm_cache()
+    
     planner = Agent(
         role="Content Planner",
         goal="Plan engaging and factually accurate content on {topic}",
@@ -11,6 +11,7 @@ from crewai import Agent
 from typing import List, Optional, Any
 from langchain.tools import BaseTool
 from .content_approval_tools import create_website_verification_tools
+from ....config.llm_config import get_openai_llm
 
 def create_content_validator_agent(url: Optional[str] = None) -> Agent:
     """
@@ -36,10 +37,8 @@ def create_content_validator_agent(url: Optional[str] = None) -> Agent:
         tools=tools,
         allow_delegation=True,
         verbose=True,
-        llm_config={
-            "temperature": 0.7,
-            "request_timeout": 600
-        }
+        # Deterministic decisions, and cacheable by the LLM response cache
+        llm=get_openai_llm(temperature=0, request_timeout=600)
     )
 
 def create_content_approval_agents(url: Optional[str] = None) -> dict:
@@ -12,7 +12,15 @@ from crewai import Task
 from typing import Dict, List, Optional, Any  # Keep only needed types
 import yaml
 
-def validate_content_tasks(content_validator, guidelines, content_source: str):
+def validate_content_tasks(
+    content_validator,
+    guidelines,
+    content_source: str,
+    guidelines_prompt: Optional[str] = None,
+    snapshot=None,
+    gate_findings: Optional[str] = None,
+    compiled_prompts: Optional[Dict[str, str]] = None
+):
     """
     Create tasks for content validation workflow
     
@@ -20,14 +28,40 @@ def validate_content_tasks(content_validator, guidelines, content_source: str):
         content_validator: The agent that will validate content
         guidelines: The YAML guidelines document to review
         content_source: The content to be validated
+        guidelines_prompt: Pre-serialized guidelines (e.g. from the guidelines
+            registry); dumped from ``guidelines`` when not provided
+        snapshot: Optional ContentSnapshot of the source; its fetch results
+            are given to the tasks so the content is not fetched again
+        gate_findings: Optional summary of the content gate's checks when
+            it escalated the decision to the crew
+        compiled_prompts: Optional task-specific guideline prompts keyed by
+            task name (see GuidelinesCompiler.compile_all); tasks without an
+            entry fall back to the full guidelines
     """
     # Format guidelines as a readable string
-    guidelines_str = yaml.dump(guidelines, default_flow_style=False)
+    guidelines_str = guidelines_prompt or yaml.dump(guidelines, default_flow_style=False)
+    compiled_prompts = compiled_prompts or {}
+    
+    detect_guidelines_str = ""
+    if compiled_prompts.get("detect_content_nature"):
+        detect_guidelines_str = f"Relevant guidelines:\n{compiled_prompts['detect_content_nature']}\n\n"
+    
+    validate_guidelines_str = ""
+    if compiled_prompts.get("validate_content_quality"):
+        validate_guidelines_str = f"Relevant guidelines:\n{compiled_prompts['validate_content_quality']}\n"
+    
+    snapshot_str = ""
+    if snapshot is not None:
+        snapshot_str = (
+            "The content has already been fetched once for this review. "
+            "Use these fetch results and the content reading tool; do not fetch it again:\n"
+            f"{snapshot.describe()}\n\n"
+        )
     
     read_guidelines = Task(
         description=(
             "Review and understand these content approval guidelines:\n\n"
-            f"{guidelines_str}\n\n"
+            f"{compiled_prompts.get('read_guidelines') or guidelines_str}\n\n"
             "Analyze and confirm understanding of:\n"
             "1. Content Acceptance Criteria\n"
             "   - Accepted content types\n"
@@ -56,6 +90,8 @@ def validate_content_tasks(content_validator, guidelines, content_source: str):
         description=(
             "Analyze the provided content source and determine its nature:\n"
             f"Content source: {content_source}\n\n"
+            f"{snapshot_str}"
+            f"{detect_guidelines_str}"
             "Determine:\n"
             "1. Content Type:\n"
             "   - Is it a URL? (starts with http/https)\n"
@@ -86,6 +122,10 @@ def validate_content_tasks(content_validator, guidelines, content_source: str):
             description=f"""
             Using the content approval guidelines you just reviewed, validate the content at {content_source}.
             
+            {validate_guidelines_str}
+            {snapshot_str}
+            {gate_findings or ""}
+            
             Focus on:
             1. Content accessibility and readability
             2. Content type matches accepted types
@@ -42,16 +42,24 @@ from pathlib import Path
 from dotenv import load_dotenv
 import os
 import requests
-import yaml
+import threading
 
 # Update imports to be relative
 from .content_approval_tasks import validate_content_tasks
+from .guidelines_compiler import get_guidelines_compiler
+from .guidelines_registry import get_guidelines_registry
 from .content_approval_agents import create_content_validator_agent as validator_creator
+from .content_approval_tools import create_website_verification_tools
+from .content_snapshot import ContentSnapshot
 
 # Original imports - kept for reference
 # from crewai_tools import WebsiteSearchTool, ScrapeWebsiteTool
 # from .content_approval_tools import create_directory_verification_tools
 
+# The .env file only needs to be loaded once per process
+_environment_loaded = False
+_environment_lock = threading.Lock()
+
 class ContentApprovalTeam:
     """
     Wrapper class for content approval crew and its operations.
@@ -73,15 +81,27 @@ class ContentApprovalTeam:
         self.tasks = []
         self.crew = None
         self.task_callback: Optional[Callable[[Any], None]] = None
+        self.guidelines_prompt: Optional[str] = None
         
-        # Load guidelines
+        # Load guidelines (refreshed from the registry on every flow start)
         self.guidelines = self._load_approval_guidelines()
         
         # Remove this line since we don't have content_source yet
         # self._setup_team()
     
     def _load_environment(self):
-        """Load environment variables from .env file"""
+        """Load environment variables from .env file (once per process)"""
+        global _environment_loaded
+        if _environment_loaded:
+            return
+
+        with _environment_lock:
+            if not _environment_loaded:
+                self._load_environment_file()
+                _environment_loaded = True
+
+    def _load_environment_file(self):
+        """Locate and load the .env file and verify the OpenAI key"""
         # Try to find .env file in CrewAI root
         project_root = Path(__file__).parent.parent.parent.parent
         env_path = project_root / '.env'
@@ -107,7 +127,8 @@ class ContentApprovalTeam:
 
     def _load_approval_guidelines(self):
         """
-        Load content approval guidelines from YAML
+        Load content approval guidelines from the process-wide registry.
+        The YAML file is only re-parsed when it changes on disk.
         
         Returns:
             dict: The loaded guidelines
@@ -116,59 +137,37 @@ class ContentApprovalTeam:
             FileNotFoundError: If guidelines file is not found
             ValueError: If guidelines are malformed or missing
         """
-        yaml_path = Path(__file__).parent / "content_approval_directories.yaml"
-        print(f"\nLoading guidelines from: {yaml_path}")
-        print(f"Absolute path: {yaml_path.absolute()}")
-        print(f"File exists: {yaml_path.exists()}\n")
-        
-        if not yaml_path.exists():
-            raise FileNotFoundError(
-                f"YAML file not found at {yaml_path}. "
-                f"Current directory: {Path.cwd()}"
-            )
-        
-        try:
-            with open(yaml_path, 'r') as file:
-                yaml_content = yaml.safe_load(file)
-                if yaml_content is None or not isinstance(yaml_content, dict):
-                    raise ValueError("YAML file is empty or malformed")
-                guidelines = yaml_content.get('content_approval_guidelines')
-                if guidelines is None:
-                    raise ValueError("Missing content_approval_guidelines in YAML")
-                
-                # Debug output for structure
-                print("Guidelines structure:")
-                print("===================")
-                print("Top level keys:", list(guidelines.keys()))
-                print("\nPodcast requirements keys:", 
-                      list(guidelines.get('podcast_content_requirements', {}).keys()))
-                print("\nValidation checks structure:", 
-                      guidelines.get('podcast_content_requirements', {}).get('validation_checks', {}))
-                print("===================\n")
-                
-                return guidelines
-                
-        except KeyError as e:
-            print(f"KeyError: Missing key {e} in YAML structure")
-            raise
-        except yaml.YAMLError as e:
-            print(f"YAML parsing error: {e}")
-            raise
-        except Exception as e:
-            print(f"Unexpected error loading guidelines: {e}")
-            raise
-
-    def _setup_team(self, content_source: str):
+        entry = get_guidelines_registry().get()
+        self.guidelines_prompt = entry.prompt
+        return entry.guidelines
+
+    def _setup_team(self, content_source: Optional[str], snapshot: Optional[ContentSnapshot] = None):
         """
         Setup agents and tasks for the team
         
+        The agent and crew are built once per team instance; later calls only
+        rebind the agent's website tool to the new content source.
+        
         Args:
             content_source: URL or file path to validate
+            snapshot: Optional pre-fetched snapshot the agent reads instead
+                of scraping the source
         """
-        # Create agent with content source
-        self.agents = {
-            "content_validator": validator_creator(url=content_source)
-        }
+        if "content_validator" in self.agents:
+            self.agents["content_validator"].tools = create_website_verification_tools(
+                url=content_source,
+                snapshot=snapshot
+            )
+        else:
+            # Create agent with content source
+            self.agents = {
+                "content_validator": validator_creator(url=content_source)
+            }
+            if snapshot is not None:
+                self.agents["content_validator"].tools = create_website_verification_tools(
+                    url=content_source,
+                    snapshot=snapshot
+                )
         
         # Initialize empty tasks list
         self.tasks = []
@@ -181,27 +180,75 @@ class ContentApprovalTeam:
                 verbose=self.verbose
             )
 
-    def start_podcast_production_flow(self, content_source: str) -> Tuple[Crew, List[Task], dict]:
+    def warm(self):
+        """
+        Build the agent and crew ahead of the first request so that
+        start_podcast_production_flow only has to bind the content source.
+        """
+        if self.crew is None:
+            self._setup_team(content_source=None)
+
+    def release(self):
+        """Drop per-request state so the team can serve another content source"""
+        self.tasks = []
+        if self.crew is not None:
+            self.crew.tasks = []
+            self._reset_tool_cache()
+
+    def _reset_tool_cache(self):
+        """
+        Give the crew and its agents an empty tool cache
+
+        crewai caches tool output per crew, keyed on tool name and
+        arguments. The per-job website tools share a name and take no
+        arguments, so a reused crew would answer the next job with the
+        previous job's page.
+        """
+        from crewai.agents.cache import CacheHandler
+
+        cache_handler = CacheHandler()
+        self.crew._cache_handler = cache_handler
+        for agent in self.agents.values():
+            agent.set_cache_handler(cache_handler)
+
+    def start_podcast_production_flow(
+        self,
+        content_source: str,
+        snapshot: Optional[ContentSnapshot] = None,
+        gate_findings: Optional[str] = None
+    ) -> Tuple[Crew, List[Task], dict]:
         """
         Start the podcast production flow
         
         Args:
             content_source: URL or file path to source content
+            snapshot: Optional ContentSnapshot fetched once for this job;
+                tasks and tools read it instead of re-fetching the source
+            gate_findings: Optional content gate findings for escalated content
             
         Returns:
             Tuple[Crew, List[Task], dict]: (crew, tasks, guidelines)
         """
         # Setup team with content source
-        self._setup_team(content_source)
+        self._setup_team(content_source, snapshot)
+        
+        # Pooled teams outlive guideline edits; the registry only re-parses
+        # the file when it changed
+        self.guidelines = self._load_approval_guidelines()
         
         # Create tasks
         tasks = validate_content_tasks(
             content_validator=self.agents["content_validator"],
             guidelines=self.guidelines,
-            content_source=content_source
+            content_source=content_source,
+            guidelines_prompt=self.guidelines_prompt,
+            snapshot=snapshot,
+            gate_findings=gate_findings,
+            compiled_prompts=get_guidelines_compiler().compile_all()
         )
         
         # Update crew's tasks
+        self.tasks = tasks
         if self.crew is not None:
             self.crew.tasks = tasks
         else:
@@ -1,44 +1,74 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Type
+from pydantic.v1 import BaseModel
 from crewai_tools import (
-    ScrapeWebsiteTool, 
-    DOCXSearchTool, 
-    PDFSearchTool, 
+    BaseTool,
     DirectoryReadTool
 )
 
-def create_website_verification_tools(url: Optional[str] = None) -> List:
+from .content_snapshot import ContentSnapshot
+from ....tools.file_ingestion_tool import FileIngestionTool
+from ....tools.pooled_web_tools import PooledScrapeWebsiteTool
+
+class ContentSnapshotSchema(BaseModel):
+    """The snapshot tool takes no arguments; its content is fixed per job"""
+    pass
+
+class ContentSnapshotTool(BaseTool):
+    """
+    Returns the job's pre-fetched content snapshot instead of re-scraping.
+    Every task that uses this tool sees exactly the same content.
+    """
+    name: str = "Read website content"
+    description: str = "Reads the content being reviewed, with fetch status, redirects and metadata."
+    args_schema: Type[BaseModel] = ContentSnapshotSchema
+    snapshot: Any = None
+
+    def __init__(self, snapshot: ContentSnapshot, **kwargs):
+        super().__init__(snapshot=snapshot, **kwargs)
+        self.description = f"Reads the content of {snapshot.source}, with fetch status, redirects and metadata."
+        self._generate_description()
+
+    def _run(self, **kwargs: Any) -> str:
+        return self.snapshot.read()
+
+def create_website_verification_tools(
+    url: Optional[str] = None,
+    snapshot: Optional[ContentSnapshot] = None
+) -> List:
     """
     Create tools for verifying website content.
     
     Parameters:
     - url: Optional specific URL to analyze
+    - snapshot: Optional pre-fetched snapshot; when given, agents read it
+      instead of scraping the URL again
     
     Returns:
     - List of tools for website content verification
     """
-    website_tool = ScrapeWebsiteTool(
+    if snapshot is not None:
+        return [ContentSnapshotTool(snapshot=snapshot)]
+
+    website_tool = PooledScrapeWebsiteTool(
         website_url=url if url else "https://example.com"
     )
     return [website_tool]
 
 def create_document_verification_tools(file_path: Optional[str] = None) -> List:
     """
-    Create tools for verifying document content (DOCX, PDF).
+    Create tools for verifying document content (PDF, DOCX, CSV, text).
     
     Parameters:
     - file_path: Optional specific file path to analyze
     
     Returns:
-    - List of tools for document content verification
+    - List of tools for document content verification; the file's text
+      is extracted and indexed once, shared with the content file readers
     """
     tools = []
     
     if file_path:
-        # Add specific file tools based on file extension
-        if file_path.lower().endswith('.pdf'):
-            tools.append(PDFSearchTool(file_path=file_path))
-        elif file_path.lower().endswith('.docx'):
-            tools.append(DOCXSearchTool(file_path=file_path))
+        tools.append(FileIngestionTool(file_path=file_path))
     
     return tools
 
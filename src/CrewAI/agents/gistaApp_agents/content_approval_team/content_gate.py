@@ -0,0 +1,255 @@
+"""
+Content Gate
+============
+
+Deterministic pre-LLM checks for content approval.
+
+The measurable rules in ``content_approval_directories.yaml`` (HTTP
+accessibility, login/paywall blocks, URL shorteners, accepted content
+types, word-count limits and placeholder content) are evaluated directly
+against the job's ContentSnapshot. Clear rejections and clear approvals
+are decided here with the guideline codes and no LLM call; anything the
+rules cannot settle (timeouts, HTTP 429/5xx and other failures that may
+be temporary, cross-domain redirects, possible paywalls, pages over the
+maximum length, missing titles, non-URL sources) is escalated to the approval
+crew together with the findings.
+
+Content-based criteria (hate speech, malicious material, educational
+value) are not judged here; per the guidelines' handling rules they are
+checked again in the content analysis stage.
+"""
+
+import re
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .content_snapshot import ContentSnapshot
+from .guidelines_registry import get_guidelines_registry
+
+DECISION_APPROVED = "approved"
+DECISION_REJECTED = "rejected"
+DECISION_ESCALATE = "escalate"
+
+TEXT_CONTENT_TYPES = {"text/html", "application/xhtml+xml", "text/plain"}
+# Accepted, but text is only available through document tools
+DOCUMENT_CONTENT_TYPES = {"application/pdf"}
+
+URL_SHORTENERS = {
+    "bit.ly", "tinyurl.com", "t.co", "goo.gl", "ow.ly", "is.gd", "buff.ly",
+    "rebrand.ly", "cutt.ly", "shorturl.at", "tiny.cc", "lnkd.in", "rb.gy"
+}
+PLACEHOLDER_DOMAINS = {"example.com", "example.org", "example.net"}
+PLACEHOLDER_TEXT = re.compile(r"\blorem ipsum\b", re.IGNORECASE)
+PAYWALL_TEXT = re.compile(
+    r"subscribe (now )?to (continue|read)|sign in to (continue|read)|log ?in to (continue|read)"
+    r"|create (a free )?account to (continue|read)|this (article|content) is for (paid )?subscribers",
+    re.IGNORECASE
+)
+
+# Fallback messages when the guidelines file omits a code
+DEFAULT_MESSAGES = {
+    "ACC200": "Content validated - All criteria met",
+    "ACC201": "Content validated - Meets minimum requirements",
+    "ACC001": "Content inaccessible - Dead or invalid URL",
+    "ACC002": "Content inaccessible - Requires login/paywall",
+    "ACC003": "Content inaccessible - Geo-restricted",
+    "ACC004": "Content inaccessible - Technical error",
+    "CON001": "Content too short - Below minimum length",
+    "CON002": "Content type not supported",
+    "CON003": "Content quality insufficient",
+    "CON004": "Content is placeholder/example only",
+    "SEC003": "Security risk - SSL certificate invalid",
+}
+
+ACCESS_CODES = {"ACC001", "ACC002", "ACC003", "ACC004", "SEC003"}
+
+# Fetch errors that retrying cannot fix; any other error (connection
+# failures, timeouts, dropped streams) is escalated rather than rejected
+PERMANENT_ERRORS = ("InvalidURL", "MissingSchema", "InvalidSchema", "TooManyRedirects")
+# Statuses the same URL can recover from (5xx are always treated as such)
+TRANSIENT_STATUSES = {408, 425, 429}
+
+
+def _domain(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class GateDecision:
+    """Outcome of the content gate for one snapshot"""
+
+    def __init__(self, decision: str, code: Optional[str] = None, message: Optional[str] = None,
+                 criteria_met: Optional[List[str]] = None, issues_found: Optional[List[str]] = None):
+        self.decision = decision
+        self.code = code
+        self.message = message
+        self.criteria_met = criteria_met or []
+        self.issues_found = issues_found or []
+
+    @property
+    def is_final(self) -> bool:
+        """True if the crew does not need to run"""
+        return self.decision != DECISION_ESCALATE
+
+    def describe(self) -> str:
+        """Findings formatted for the escalated validation task"""
+        lines = ["Automated pre-checks could not decide this content."]
+        if self.criteria_met:
+            lines.append("Criteria already met: " + "; ".join(self.criteria_met))
+        if self.issues_found:
+            lines.append("Needs your judgement: " + "; ".join(self.issues_found))
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same shape as the validate_content_quality task output"""
+        if self.decision == DECISION_APPROVED:
+            status, production_state = "approved", "in_production"
+        elif self.decision == DECISION_REJECTED:
+            status, production_state = "rejected", "invalid_content"
+        else:
+            status, production_state = "needs_review", None
+        return {
+            "status": status,
+            "production_state": production_state,
+            "code": self.code,
+            "message": f"{self.code}: {self.message}" if self.code else self.message,
+            "validation_details": {
+                "accessibility": "accessible" if self.code not in ACCESS_CODES else "inaccessible",
+                "quality_check": self.decision,
+                "criteria_met": self.criteria_met,
+                "issues_found": self.issues_found
+            },
+            "decided_by": "content_gate"
+        }
+
+
+class ContentGate:
+    """
+    Rule engine built from the content approval guidelines
+
+    Args:
+        guidelines: Parsed guidelines dict (from the guidelines registry)
+    """
+
+    def __init__(self, guidelines: Dict[str, Any]):
+        root = guidelines.get("content_approval_guidelines", guidelines)
+        length = root.get("criteria", {}).get("length_requirements", {})
+        self.minimum_words = int(length.get("minimum_words", 300))
+        self.maximum_words = int(length.get("maximum_words", 15000))
+        optimal = str(length.get("optimal_range", "1000-5000")).split()[0].split("-")
+        self.optimal_range = (int(optimal[0]), int(optimal[-1]))
+
+        outputs = root.get("validation_outputs", {})
+        self.messages = dict(DEFAULT_MESSAGES)
+        self.messages.update(outputs.get("acceptance", {}).get("success_codes", {}) or {})
+        for group in (outputs.get("rejection", {}).get("error_codes", {}) or {}).values():
+            self.messages.update(group or {})
+
+    def _decide(self, decision: str, code: str, criteria_met: List[str], issues: List[str],
+                detail: Optional[str] = None) -> GateDecision:
+        if detail:
+            issues = issues + [detail]
+        return GateDecision(decision, code, self.messages.get(code, code), criteria_met, issues)
+
+    def evaluate(self, snapshot: Optional[ContentSnapshot]) -> GateDecision:
+        """
+        Apply the measurable rules to a snapshot
+
+        Returns:
+            GateDecision; ``is_final`` is False when the crew must decide
+        """
+        met: List[str] = []
+        issues: List[str] = []
+
+        if snapshot is None or (snapshot.error and snapshot.error.startswith("unsupported source")):
+            return GateDecision(DECISION_ESCALATE, issues_found=["Source is not a fetchable URL"])
+
+        # Accessibility; only permanent failures are rejected here, since a
+        # rejection is final and the gist would not be fetched again
+        if snapshot.error:
+            error = snapshot.error
+            if error.startswith(("SSLError", "SSLCertVerificationError")):
+                return self._decide(DECISION_REJECTED, "SEC003", met, issues, error)
+            if error.startswith(PERMANENT_ERRORS):
+                return self._decide(DECISION_REJECTED, "ACC001", met, issues, error)
+            issues.append(f"Fetch failed, possibly temporarily ({error})")
+            return GateDecision(DECISION_ESCALATE, criteria_met=met, issues_found=issues)
+
+        status = snapshot.status_code
+        if status in (401, 402, 403, 407):
+            return self._decide(DECISION_REJECTED, "ACC002", met, issues, f"HTTP {status}")
+        if status == 451:
+            return self._decide(DECISION_REJECTED, "ACC003", met, issues, f"HTTP {status}")
+        if status is None or status in TRANSIENT_STATUSES or status >= 500:
+            issues.append(f"Server unavailable, possibly temporarily (HTTP {status})")
+            return GateDecision(DECISION_ESCALATE, criteria_met=met, issues_found=issues)
+        if 400 <= status < 500:
+            return self._decide(DECISION_REJECTED, "ACC001", met, issues, f"HTTP {status}")
+        if not 200 <= status < 300:
+            return self._decide(DECISION_REJECTED, "ACC004", met, issues, f"HTTP {status}")
+        met.append(f"Accessible (HTTP {status})")
+
+        source_domain = _domain(snapshot.source)
+        if source_domain in URL_SHORTENERS:
+            return self._decide(DECISION_REJECTED, "ACC001", met, issues, f"URL shortener ({source_domain})")
+        if snapshot.redirect_chain and _domain(snapshot.final_url) != source_domain:
+            issues.append(f"Redirects to another domain ({_domain(snapshot.final_url)})")
+
+        # Content type
+        content_type = snapshot.content_type or "text/html"
+        if content_type in DOCUMENT_CONTENT_TYPES:
+            issues.append(f"Document content ({content_type}) needs document tools to read")
+            return GateDecision(DECISION_ESCALATE, criteria_met=met, issues_found=issues)
+        if content_type not in TEXT_CONTENT_TYPES:
+            return self._decide(DECISION_REJECTED, "CON002", met, issues, f"Content type {content_type}")
+        met.append(f"Text content ({content_type})")
+
+        # Length is checked before placeholders so example pages report CON001
+        words = snapshot.word_count
+        paywalled = bool(PAYWALL_TEXT.search(snapshot.text))
+        if words < self.minimum_words:
+            if paywalled:
+                return self._decide(DECISION_REJECTED, "ACC002", met, issues, "Login or subscription prompt")
+            return self._decide(
+                DECISION_REJECTED, "CON001", met, issues, f"{words} words (minimum {self.minimum_words})"
+            )
+        if words > self.maximum_words:
+            # The guidelines have no "too long" code; CON003 is about quality
+            issues.append(f"{words} words exceeds maximum of {self.maximum_words}")
+        else:
+            met.append(f"Length {words} words")
+
+        if source_domain in PLACEHOLDER_DOMAINS or _domain(snapshot.final_url) in PLACEHOLDER_DOMAINS \
+                or PLACEHOLDER_TEXT.search(snapshot.text):
+            return self._decide(DECISION_REJECTED, "CON004", met, issues, "Placeholder content")
+
+        if paywalled:
+            issues.append("Page mentions a login or subscription wall")
+        if not snapshot.title:
+            issues.append("No title found")
+        if issues:
+            return GateDecision(DECISION_ESCALATE, criteria_met=met, issues_found=issues)
+
+        met.append(f"Title: {snapshot.title}")
+        low, high = self.optimal_range
+        if low <= words <= high and snapshot.author and snapshot.published_date:
+            return self._decide(DECISION_APPROVED, "ACC200", met, issues)
+        return self._decide(DECISION_APPROVED, "ACC201", met, issues)
+
+
+_gate: Optional[ContentGate] = None
+_gate_digest: Optional[str] = None
+_gate_lock = threading.Lock()
+
+
+def get_content_gate() -> ContentGate:
+    """Gate for the current guidelines, rebuilt only when they change"""
+    global _gate, _gate_digest
+    entry = get_guidelines_registry().get()
+    if _gate is None or _gate_digest != entry.digest:
+        with _gate_lock:
+            if _gate is None or _gate_digest != entry.digest:
+                _gate = ContentGate(entry.guidelines)
+                _gate_digest = entry.digest
+    return _gate
@@ -0,0 +1,350 @@
+"""
+Content Snapshot
+================
+
+Fetch-once view of a content source shared by every approval and
+analysis task of a job.
+
+A snapshot records what a single HTTP fetch returned: the final URL,
+status code and redirect chain, the content type, extracted text and word
+count, and title/author/publication date metadata. Tasks and tools read
+from the snapshot instead of scraping the URL again, so a job downloads
+its source once and every step sees the same content.
+
+Example:
+    store = SnapshotStore()
+    snapshot = store.get_or_fetch("https://example.com/article")
+    snapshot.word_count, snapshot.title, snapshot.redirect_chain
+"""
+
+import codecs
+import hashlib
+import re
+import threading
+import time
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+from ....utils.http_pool import get_http_session
+from ....utils.metrics import record_bytes
+
+FETCH_TIMEOUT = 15
+MAX_CONTENT_BYTES = 5 * 1024 * 1024
+
+# Same browser headers as crewai_tools' ScrapeWebsiteTool, so sites that
+# answered the scraper answer the snapshot fetch the same way
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.google.com/',
+}
+
+_SKIPPED_TAGS = {"script", "style", "noscript", "template", "svg"}
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+    "section", "article", "header", "footer", "tr", "table", "blockquote", "pre"
+}
+_TITLE_META = ("og:title", "twitter:title")
+_AUTHOR_META = ("author", "article:author", "og:article:author", "parsely-author", "dc.creator")
+_DATE_META = (
+    "article:published_time", "og:article:published_time", "date",
+    "pubdate", "publish-date", "dc.date", "parsely-pub-date"
+)
+
+
+_CHARSET_PARAM = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+
+
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def detect_encoding(content_type_header: Optional[str], body: bytes) -> str:
+    """
+    Character encoding of a fetched body
+
+    Uses the Content-Type charset when the server declared one, then a
+    byte order mark or ``<meta charset>`` in the first bytes of the page,
+    then UTF-8 if the body decodes as UTF-8, and windows-1252 (cp1252) otherwise.
+    ``requests`` would assume ISO-8859-1 for any charset-less ``text/*``
+    response, which garbles UTF-8 pages that do not declare a charset.
+    """
+    match = _CHARSET_PARAM.search(content_type_header or "")
+    declared = _known_encoding(match.group(1)) if match else None
+    if declared:
+        return declared
+    for bom, encoding in _BOMS:
+        if body.startswith(bom):
+            return encoding
+    match = _META_CHARSET.search(body[:4096])
+    declared = _known_encoding(match.group(1).decode("ascii", "ignore")) if match else None
+    if declared:
+        return declared
+    try:
+        # Not final: the body may be cut off in the middle of a character
+        codecs.getincrementaldecoder("utf-8")().decode(body, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+class _PageParser(HTMLParser):
+    """Collects visible text and metadata in one pass over the HTML"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[str, str] = {}
+        self.title_parts: List[str] = []
+        self.text_parts: List[str] = []
+        self.time_datetime: Optional[str] = None
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        attributes = {name.lower(): value or "" for name, value in attrs}
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            name = (attributes.get("property") or attributes.get("name") or "").lower()
+            if name and "content" in attributes:
+                self.meta.setdefault(name, attributes["content"].strip())
+        elif tag == "time" and self.time_datetime is None and attributes.get("datetime"):
+            self.time_datetime = attributes["datetime"].strip()
+        if tag in _BLOCK_TAGS:
+            self.text_parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+        if tag in _BLOCK_TAGS:
+            self.text_parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title_parts.append(data)
+        elif not self._skip_depth:
+            self.text_parts.append(data)
+
+
+def _first(meta: Dict[str, str], names) -> Optional[str]:
+    for name in names:
+        if meta.get(name):
+            return meta[name]
+    return None
+
+
+def parse_html(html: str) -> Dict[str, Any]:
+    """
+    Extract text and metadata from an HTML document
+
+    Returns:
+        Dict with ``title``, ``author``, ``published_date`` and ``text``
+        (blank lines removed and runs of whitespace collapsed)
+    """
+    parser = _PageParser()
+    parser.feed(html)
+    parser.close()
+
+    lines = (" ".join(line.split()) for line in "".join(parser.text_parts).splitlines())
+    text = "\n".join(line for line in lines if line)
+    title = " ".join("".join(parser.title_parts).split()) or None
+
+    return {
+        "title": _first(parser.meta, _TITLE_META) or title,
+        "author": _first(parser.meta, _AUTHOR_META),
+        "published_date": _first(parser.meta, _DATE_META) or parser.time_datetime,
+        "text": text
+    }
+
+
+class ContentSnapshot:
+    """Immutable record of one fetch of a content source"""
+
+    def __init__(
+        self,
+        source: str,
+        final_url: Optional[str] = None,
+        status_code: Optional[int] = None,
+        redirect_chain: Optional[List[Dict[str, Any]]] = None,
+        content_type: Optional[str] = None,
+        text: str = "",
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        published_date: Optional[str] = None,
+        error: Optional[str] = None,
+        fetched_at: Optional[float] = None
+    ):
+        self.source = source
+        self.final_url = final_url or source
+        self.status_code = status_code
+        self.redirect_chain = redirect_chain or []
+        self.content_type = content_type
+        self.text = text
+        self.title = title
+        self.author = author
+        self.published_date = published_date
+        self.error = error
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.word_count = len(re.findall(r"\b\w+\b", text))
+        self.digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and 200 <= self.status_code < 300
+
+    def to_dict(self, include_text: bool = False) -> Dict[str, Any]:
+        data = {
+            "source": self.source,
+            "final_url": self.final_url,
+            "status_code": self.status_code,
+            "redirect_chain": self.redirect_chain,
+            "content_type": self.content_type,
+            "title": self.title,
+            "author": self.author,
+            "published_date": self.published_date,
+            "word_count": self.word_count,
+            "digest": self.digest,
+            "error": self.error,
+            "fetched_at": self.fetched_at
+        }
+        if include_text:
+            data["text"] = self.text
+        return data
+
+    def describe(self) -> str:
+        """Fetch facts formatted for task descriptions"""
+        redirects = " -> ".join(
+            f"{hop['url']} ({hop['status_code']})" for hop in self.redirect_chain
+        ) or "none"
+        lines = [
+            f"Source: {self.source}",
+            f"Final URL: {self.final_url}",
+            f"HTTP status: {self.status_code if self.status_code is not None else 'not fetched'}",
+            f"Redirects: {redirects}",
+            f"Content type: {self.content_type or 'unknown'}",
+            f"Title: {self.title or 'unknown'}",
+            f"Author: {self.author or 'unknown'}",
+            f"Published: {self.published_date or 'unknown'}",
+            f"Word count: {self.word_count}",
+        ]
+        if self.error:
+            lines.append(f"Fetch error: {self.error}")
+        return "\n".join(lines)
+
+    def read(self) -> str:
+        """Metadata header followed by the extracted text, as tools return it"""
+        return f"{self.describe()}\n\n{self.text}"
+
+
+def snapshot_from_response(source: str, response: Any, max_bytes: int = MAX_CONTENT_BYTES) -> ContentSnapshot:
+    """
+    Build a snapshot from a ``requests`` response opened with ``stream=True``
+
+    The body is read up to ``max_bytes``; HTML is parsed for text and
+    metadata, plain text is used as is, and other types keep no text.
+    """
+    redirect_chain = [
+        {"url": hop.url, "status_code": hop.status_code} for hop in response.history
+    ]
+    content_type = (response.headers.get("Content-Type") or "").split(";")[0].strip().lower() or None
+
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body.extend(chunk)
+        if len(body) >= max_bytes:
+            del body[max_bytes:]
+            break
+    record_bytes("snapshot", len(body))
+    encoding = detect_encoding(response.headers.get("Content-Type"), bytes(body))
+    decoded = bytes(body).decode(encoding, errors="replace")
+
+    fields: Dict[str, Any] = {"text": ""}
+    if content_type in (None, "text/html", "application/xhtml+xml"):
+        fields = parse_html(decoded)
+    elif content_type.startswith("text/"):
+        fields = {"text": decoded.strip()}
+
+    return ContentSnapshot(
+        source=source,
+        final_url=response.url,
+        status_code=response.status_code,
+        redirect_chain=redirect_chain,
+        content_type=content_type,
+        **fields
+    )
+
+
+def fetch_snapshot(source: str, session: Any = None, timeout: float = FETCH_TIMEOUT) -> ContentSnapshot:
+    """
+    Fetch a URL once and capture it as a snapshot
+
+    Network and HTTP errors are recorded on the snapshot rather than
+    raised, so approval can report them with the right rejection code.
+
+    Args:
+        source: http(s) URL to fetch
+        session: ``requests.Session`` to use (the shared pooled session by default)
+        timeout: Request timeout in seconds
+    """
+    if not re.match(r"^https?://", source, re.IGNORECASE):
+        return ContentSnapshot(source=source, error="unsupported source: only http(s) URLs can be fetched")
+
+    import requests
+
+    client = session or get_http_session()
+    try:
+        response = client.get(source, headers=REQUEST_HEADERS, timeout=timeout, stream=True, allow_redirects=True)
+        try:
+            return snapshot_from_response(source, response)
+        finally:
+            response.close()
+    except requests.RequestException as e:
+        return ContentSnapshot(source=source, error=f"{type(e).__name__}: {str(e)}")
+
+
+class SnapshotStore:
+    """
+    Per-job snapshot store
+
+    Each source is fetched at most once, even when several tasks or tools
+    ask for it concurrently.
+    """
+
+    def __init__(self, fetcher=fetch_snapshot):
+        self._fetcher = fetcher
+        self._snapshots: Dict[str, ContentSnapshot] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, source: str) -> Optional[ContentSnapshot]:
+        return self._snapshots.get(source)
+
+    def put(self, snapshot: ContentSnapshot) -> None:
+        with self._lock:
+            self._snapshots[snapshot.source] = snapshot
+
+    def get_or_fetch(self, source: str) -> ContentSnapshot:
+        snapshot = self._snapshots.get(source)
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            source_lock = self._locks.setdefault(source, threading.Lock())
+        with source_lock:
+            snapshot = self._snapshots.get(source)
+            if snapshot is None:
+                snapshot = self._fetcher(source)
+                self.put(snapshot)
+        return snapshot
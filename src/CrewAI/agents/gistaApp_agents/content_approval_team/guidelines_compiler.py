@@ -0,0 +1,198 @@
+"""
+Guidelines Compiler
+===================
+
+Compiles the content approval guidelines into compact, task-specific
+prompts instead of sending the full ``yaml.dump`` to every task.
+
+Each approval task gets a projection holding only the sections it uses,
+rendered as short "label: item; item" lines:
+
+    read_guidelines           acceptance, rejection, metadata and podcast rules
+    detect_content_nature     accepted types and basic access checks
+    validate_content_quality  length rules, quality requirements, status codes
+
+Compiled prompts are cached per guidelines digest, so they are rebuilt
+only when the YAML file changes. Token counts use tiktoken when it is
+installed and a four-characters-per-token estimate otherwise.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .guidelines_registry import GuidelinesRegistry, get_guidelines_registry
+
+TASK_READ_GUIDELINES = "read_guidelines"
+TASK_DETECT_CONTENT_NATURE = "detect_content_nature"
+TASK_VALIDATE_CONTENT_QUALITY = "validate_content_quality"
+
+_encoding = None
+_encoding_loaded = False
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken's cl100k_base, or an estimate without it"""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _encoding = None
+        _encoding_loaded = True
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def _items(value: Any) -> str:
+    if isinstance(value, dict):
+        return "; ".join(f"{key} {_items(item)}" for key, item in value.items())
+    if isinstance(value, list):
+        return "; ".join(_items(item) for item in value)
+    return str(value)
+
+
+def _line(label: str, value: Any) -> Optional[str]:
+    if value in (None, [], {}, ""):
+        return None
+    return f"{label}: {_items(value)}"
+
+
+def _codes(group: Dict[str, Any]) -> List[str]:
+    return [f"{code}={message}" for code, message in (group or {}).items()]
+
+
+class CompiledPrompt:
+    """A task-specific guidelines prompt and its size"""
+
+    def __init__(self, task: str, text: str, digest: str):
+        self.task = task
+        self.text = text
+        self.digest = digest
+        self.tokens = count_tokens(text)
+
+
+class GuidelinesCompiler:
+    """
+    Builds and caches compact guideline prompts per approval task
+
+    Args:
+        registry: Guidelines registry to compile from
+    """
+
+    def __init__(self, registry: Optional[GuidelinesRegistry] = None):
+        self.registry = registry or get_guidelines_registry()
+        self._cache: Dict[Tuple[str, str], CompiledPrompt] = {}
+        self._lock = threading.Lock()
+        self._projections: Dict[str, Callable[[Dict[str, Any]], List[Optional[str]]]] = {
+            TASK_READ_GUIDELINES: self._read_guidelines,
+            TASK_DETECT_CONTENT_NATURE: self._detect_content_nature,
+            TASK_VALIDATE_CONTENT_QUALITY: self._validate_content_quality,
+        }
+
+    @property
+    def tasks(self) -> List[str]:
+        return list(self._projections)
+
+    def compile(self, task: str) -> CompiledPrompt:
+        """
+        Return the compiled prompt for a task
+
+        Raises:
+            KeyError: If the task has no projection
+        """
+        if task not in self._projections:
+            raise KeyError(f"No guidelines projection for task '{task}'")
+
+        entry = self.registry.get()
+        key = (entry.digest, task)
+        compiled = self._cache.get(key)
+        if compiled is None:
+            lines = self._projections[task](entry.guidelines)
+            compiled = CompiledPrompt(task, "\n".join(line for line in lines if line), entry.digest)
+            with self._lock:
+                # Drop prompts compiled from an older guidelines file
+                for stale in [k for k in self._cache if k[0] != entry.digest]:
+                    del self._cache[stale]
+                self._cache[key] = compiled
+        return compiled
+
+    def compile_all(self) -> Dict[str, str]:
+        """Compiled prompt text for every task"""
+        return {task: self.compile(task).text for task in self._projections}
+
+    def report(self) -> Dict[str, Any]:
+        """Token counts per task compared with the full YAML prompt"""
+        full_tokens = count_tokens(self.registry.get().prompt)
+        tasks = {task: self.compile(task).tokens for task in self._projections}
+        total = sum(tasks.values())
+        return {
+            "full_prompt_tokens": full_tokens,
+            "tasks": tasks,
+            "total_tokens": total,
+            "saved_tokens": full_tokens - total
+        }
+
+    # Projections
+
+    def _length_lines(self, guidelines: Dict[str, Any]) -> List[Optional[str]]:
+        length = guidelines.get("criteria", {}).get("length_requirements", {})
+        special = length.get("special_cases", {})
+        lines = [
+            f"Length: {length.get('minimum_words')}-{length.get('maximum_words')} words "
+            f"(optimal {length.get('optimal_range')})"
+        ]
+        for name in ("short_form", "long_form"):
+            case = special.get(name)
+            if case:
+                lines.append(f"- {name}: {case.get('minimum')}-{case.get('maximum')} words, {case.get('notes')}")
+        lines.append(_line("Long content handling", special.get("handling_rules")))
+        return lines
+
+    def _read_guidelines(self, guidelines: Dict[str, Any]) -> List[Optional[str]]:
+        criteria = guidelines.get("criteria", {})
+        metadata = guidelines.get("metadata_requirements", {})
+        podcast = guidelines.get("podcast_content_requirements", {})
+        return [
+            _line("Accepted content", criteria.get("accepted")),
+            _line("Rejected content", criteria.get("rejected")),
+            _line("Required metadata", metadata.get("required")),
+            _line("Metadata rules", metadata.get("validation_rules")),
+            _line("Podcast content types", podcast.get("content_type")),
+            _line("Podcast restrictions", podcast.get("restricted_content")),
+        ]
+
+    def _detect_content_nature(self, guidelines: Dict[str, Any]) -> List[Optional[str]]:
+        criteria = guidelines.get("criteria", {})
+        checks = guidelines.get("podcast_content_requirements", {}).get("validation_checks", {})
+        return [
+            _line("Accepted content", criteria.get("accepted")),
+            _line("Basic checks", checks.get("basic_checks")),
+        ]
+
+    def _validate_content_quality(self, guidelines: Dict[str, Any]) -> List[Optional[str]]:
+        outputs = guidelines.get("validation_outputs", {})
+        acceptance = outputs.get("acceptance", {})
+        rejection = outputs.get("rejection", {})
+        error_codes = [code for group in (rejection.get("error_codes") or {}).values() for code in _codes(group)]
+        return [
+            *self._length_lines(guidelines),
+            _line("Quality requirements", guidelines.get("content_quality_markers", {}).get("basic_requirements")),
+            _line("Approval codes", _codes(acceptance.get("success_codes"))),
+            _line("Rejection codes", error_codes),
+        ]
+
+
+_default_compiler: Optional[GuidelinesCompiler] = None
+_default_compiler_lock = threading.Lock()
+
+
+def get_guidelines_compiler() -> GuidelinesCompiler:
+    """Return the process-wide compiler for the bundled guidelines"""
+    global _default_compiler
+    if _default_compiler is None:
+        with _default_compiler_lock:
+            if _default_compiler is None:
+                _default_compiler = GuidelinesCompiler()
+    return _default_compiler
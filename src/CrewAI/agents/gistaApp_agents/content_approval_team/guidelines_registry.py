@@ -0,0 +1,147 @@
+"""
+Content Approval Guidelines Registry
+===================================
+
+Process-wide cache of the parsed ``content_approval_directories.yaml``.
+
+The YAML file is parsed once and kept together with its serialized prompt
+string. Later lookups only ``stat`` the file; it is re-read when its
+modification time or size changes, and re-parsed only when the content
+hash differs from the cached copy.
+
+The returned guidelines dict is shared between callers and must be
+treated as read-only.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import yaml
+
+DEFAULT_GUIDELINES_PATH = Path(__file__).parent / "content_approval_directories.yaml"
+
+
+class GuidelinesEntry:
+    """Parsed guidelines plus the metadata used to detect changes"""
+
+    def __init__(self, guidelines: Dict[str, Any], prompt: str, digest: str, mtime: float, size: int):
+        self.guidelines = guidelines
+        self.prompt = prompt
+        self.digest = digest
+        self.mtime = mtime
+        self.size = size
+
+
+class GuidelinesRegistry:
+    """
+    Loads content approval guidelines once per process and reloads them
+    only when the YAML file changes.
+
+    Args:
+        yaml_path: Path to the guidelines YAML file
+    """
+
+    def __init__(self, yaml_path: Union[str, Path] = DEFAULT_GUIDELINES_PATH):
+        self.yaml_path = Path(yaml_path)
+        self._entry: Optional[GuidelinesEntry] = None
+        self._lock = threading.Lock()
+        self.load_count = 0
+
+    def get(self) -> GuidelinesEntry:
+        """
+        Return the current guidelines entry, reloading if the file changed
+
+        Raises:
+            FileNotFoundError: If guidelines file is not found
+            ValueError: If guidelines are malformed or missing
+        """
+        try:
+            stat = os.stat(self.yaml_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"YAML file not found at {self.yaml_path}. "
+                f"Current directory: {Path.cwd()}"
+            )
+
+        entry = self._entry
+        if entry is not None and entry.mtime == stat.st_mtime and entry.size == stat.st_size:
+            return entry
+
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry.mtime == stat.st_mtime and entry.size == stat.st_size:
+                return entry
+
+            raw = self.yaml_path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+
+            if entry is not None and entry.digest == digest:
+                # Touched but unchanged - keep the parsed copy
+                entry.mtime = stat.st_mtime
+                entry.size = stat.st_size
+                return entry
+
+            guidelines = self._parse(raw)
+            self._entry = GuidelinesEntry(
+                guidelines=guidelines,
+                prompt=yaml.dump(guidelines, default_flow_style=False),
+                digest=digest,
+                mtime=stat.st_mtime,
+                size=stat.st_size
+            )
+            self.load_count += 1
+            self._print_summary(guidelines)
+            return self._entry
+
+    def get_guidelines(self) -> Dict[str, Any]:
+        """Return the parsed guidelines dict"""
+        return self.get().guidelines
+
+    def get_prompt(self) -> str:
+        """Return the guidelines serialized for task prompts"""
+        return self.get().prompt
+
+    def invalidate(self):
+        """Force the next lookup to re-read the file"""
+        with self._lock:
+            self._entry = None
+
+    def _parse(self, raw: bytes) -> Dict[str, Any]:
+        try:
+            yaml_content = yaml.safe_load(raw)
+        except yaml.YAMLError as e:
+            print(f"YAML parsing error: {e}")
+            raise
+
+        if yaml_content is None or not isinstance(yaml_content, dict):
+            raise ValueError("YAML file is empty or malformed")
+        guidelines = yaml_content.get('content_approval_guidelines')
+        if guidelines is None:
+            raise ValueError("Missing content_approval_guidelines in YAML")
+        return guidelines
+
+    def _print_summary(self, guidelines: Dict[str, Any]):
+        print(f"\nLoaded guidelines from: {self.yaml_path.absolute()}")
+        print("Guidelines structure:")
+        print("===================")
+        print("Top level keys:", list(guidelines.keys()))
+        print("\nPodcast requirements keys:",
+              list(guidelines.get('podcast_content_requirements', {}).keys()))
+        print("===================\n")
+
+
+_default_registry: Optional[GuidelinesRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_guidelines_registry() -> GuidelinesRegistry:
+    """Return the process-wide registry for the bundled guidelines file"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = GuidelinesRegistry()
+    return _default_registry
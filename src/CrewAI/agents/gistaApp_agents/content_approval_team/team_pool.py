@@ -0,0 +1,109 @@
+"""
+Content Approval Team Pool
+=========================
+
+Keeps warmed ``ContentApprovalTeam`` instances for reuse across requests.
+
+Building a team loads the environment, the guidelines and a new validator
+agent and crew. The pool pays that cost once per team; a request leases a
+team, binds its content source (scrape tool URL + task list) and returns
+the team when done. Returning a team clears its tasks and the crew's tool
+cache, so the next request never gets an earlier page back:
+
+    with pool.lease() as team:
+        crew, tasks, guidelines = team.start_podcast_production_flow(url)
+        crew.kickoff()
+
+A leased team is used by one request at a time, so at most ``max_size``
+crews run concurrently.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .content_approval_team import ContentApprovalTeam
+
+
+class ContentApprovalTeamPool:
+    """
+    Bounded pool of reusable content approval teams.
+
+    Args:
+        max_size: Maximum number of teams (and concurrent leases)
+        verbose: Verbose flag passed to each team
+        factory: Optional callable creating a new team; defaults to
+            ``ContentApprovalTeam(verbose=verbose)``
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2,
+        verbose: bool = False,
+        factory: Optional[Callable[[], "ContentApprovalTeam"]] = None
+    ):
+        self.max_size = max_size
+        self.verbose = verbose
+        self._factory = factory or self._default_team
+        self._idle: "queue.LifoQueue[ContentApprovalTeam]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def _default_team(self) -> "ContentApprovalTeam":
+        # crewai is loaded with the first team, not when the pool is created
+        from .content_approval_team import ContentApprovalTeam
+
+        return ContentApprovalTeam(verbose=self.verbose)
+
+    def warm(self, count: Optional[int] = None):
+        """
+        Build up to ``count`` teams (default: ``max_size``) ahead of traffic
+
+        Args:
+            count: Number of idle teams to prepare
+        """
+        target = min(count if count is not None else self.max_size, self.max_size)
+        with self._lock:
+            while self.created < target:
+                self._idle.put(self._create_team())
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator["ContentApprovalTeam"]:
+        """
+        Borrow a team for a single content source
+
+        Args:
+            timeout: Seconds to wait for a free team (None waits forever)
+
+        Raises:
+            TimeoutError: If no team became available in time
+        """
+        if not self._slots.acquire(timeout=timeout if timeout is not None else -1):
+            raise TimeoutError("No content approval team available")
+
+        try:
+            team = self._checkout()
+            try:
+                yield team
+            finally:
+                team.release()
+                self._idle.put(team)
+        finally:
+            self._slots.release()
+
+    def _checkout(self) -> "ContentApprovalTeam":
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                return self._create_team()
+
+    def _create_team(self) -> "ContentApprovalTeam":
+        """Create and warm a new team. Caller holds the lock."""
+        team = self._factory()
+        team.warm()
+        self.created += 1
+        return team
@@ -102,9 +102,12 @@ Notes:
 """
 
 from crewai import Agent
+from ...config.llm_cache import configure_llm_cache
+from ...config.llm_config import get_openai_llm
 
 def create_gista_agents():
     """Create and return the Gista App agents organized by department"""
+    configure_llm_cache()
     
     # Content Assessment Department
     content_validator = Agent(
@@ -115,7 +118,8 @@ def create_gista_agents():
             "preparation, approval decisions, and production pipeline initiation."
         ),
         allow_delegation=False,
-        verbose=True
+        verbose=True,
+        llm=get_openai_llm(temperature=0)
     )
     
     content_analyst = Agent(
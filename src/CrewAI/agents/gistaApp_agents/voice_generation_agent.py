@@ -1,3 +1,4 @@
+import asyncio
 from crewai import Agent
 from typing import Dict, List
 
@@ -16,17 +17,14 @@ class VoiceGenerationAgent(Agent):
         # Parse script
         parsed_segments = self.tools["parser"].run(script_content)
         
-        # Generate audio for each segment
-        audio_segments = []
-        for segment in parsed_segments["segments"]:
-            audio = await self.tools["voice"].run(
-                text=segment.text,
-                voice_role=segment.voice_role,
-                segment_type=segment.segment_type
-            )
-            audio_segments.append(audio)
+        # Generate audio for all segments concurrently, keeping segment order
+        audio_batch = await asyncio.to_thread(
+            self.tools["voice"].synthesize_batch,
+            parsed_segments["segments"]
+        )
             
         return {
-            "audio_segments": audio_segments,
+            "audio_segments": audio_batch["segments"],
+            "failed_segments": audio_batch["failed_indices"],
             "metadata": parsed_segments["metadata"]
         } 
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Benchmark Harness
+=================
+
+Runs a callable repeatedly, optionally from several threads at once, and
+reports throughput and latency percentiles. Results are written to JSON
+together with the commit they were measured on, so two runs can be
+compared:
+
+    result = run_benchmark("script_parser", lambda i: parser._run(script), iterations=50)
+    write_results("bench.json", [result])
+    regressions = compare_results(load_results("baseline.json"), load_results("bench.json"))
+
+The harness itself has no dependencies; the offline scenarios live in
+``run_benchmarks.py``.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+RESULTS_VERSION = 1
+
+# Summary fields where a higher value is worse
+LATENCY_FIELDS = ("p50_ms", "p95_ms")
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Linearly interpolated percentile (0-100) of ``values``; 0.0 when empty"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class BenchmarkResult:
+    """Latencies and errors collected for one benchmark"""
+
+    def __init__(self, name: str, concurrency: int = 1, metadata: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.concurrency = concurrency
+        self.metadata = metadata or {}
+        self.latencies: List[float] = []
+        self.errors: List[str] = []
+        self.wall_seconds = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-serializable summary; latencies in milliseconds"""
+        count = len(self.latencies)
+        ms = [value * 1000 for value in self.latencies]
+        return {
+            "name": self.name,
+            "iterations": count + len(self.errors),
+            "errors": len(self.errors),
+            "concurrency": self.concurrency,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "throughput_per_second": round(count / self.wall_seconds, 3) if self.wall_seconds else 0.0,
+            "mean_ms": round(sum(ms) / count, 3) if count else 0.0,
+            "min_ms": round(min(ms), 3) if count else 0.0,
+            "p50_ms": round(percentile(ms, 50), 3),
+            "p95_ms": round(percentile(ms, 95), 3),
+            "max_ms": round(max(ms), 3) if count else 0.0,
+            "error_samples": self.errors[:3],
+            "metadata": self.metadata
+        }
+
+
+def run_benchmark(
+    name: str,
+    fn: Callable[[int], Any],
+    iterations: int = 20,
+    concurrency: int = 1,
+    warmup: int = 1,
+    metadata: Optional[Dict[str, Any]] = None
+) -> BenchmarkResult:
+    """
+    Time ``fn(iteration)`` ``iterations`` times
+
+    Warmup calls run first, one at a time, and are not recorded. A call
+    that raises counts as an error instead of a latency sample.
+
+    Args:
+        name: Benchmark name used in the results file
+        fn: Callable receiving the iteration index
+        iterations: Number of timed calls
+        concurrency: Number of threads issuing calls at the same time
+        warmup: Untimed calls made before measuring
+        metadata: Extra settings to store with the result
+    """
+    result = BenchmarkResult(name, concurrency=concurrency, metadata=metadata)
+    for i in range(warmup):
+        fn(-1 - i)
+
+    lock = threading.Lock()
+
+    def timed_call(iteration: int) -> None:
+        started = time.perf_counter()
+        try:
+            fn(iteration)
+        except Exception as e:
+            with lock:
+                result.errors.append(f"{type(e).__name__}: {str(e)}")
+            if os.getenv("BENCHMARK_TRACEBACKS"):
+                traceback.print_exc()
+            return
+        elapsed = time.perf_counter() - started
+        with lock:
+            result.latencies.append(elapsed)
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        for i in range(iterations):
+            timed_call(i)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"bench-{name}") as executor:
+            list(executor.map(timed_call, range(iterations)))
+    result.wall_seconds = time.perf_counter() - started
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_results(
+    path: str,
+    results: Iterable[BenchmarkResult],
+    settings: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Write benchmark summaries to a JSON file
+
+    Returns:
+        The document that was written
+    """
+    document = {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "settings": settings or {},
+        "benchmarks": {result.name: result.summary() for result in results}
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    return document
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Benchmarks whose latency grew by more than ``tolerance`` or that errored
+
+    Args:
+        baseline: Results document of the reference run
+        current: Results document of the new run
+        tolerance: Allowed relative increase, e.g. 0.2 for +20%
+
+    Returns:
+        One entry per regression with the benchmark, field and both values
+    """
+    regressions = []
+    for name, summary in current.get("benchmarks", {}).items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        if summary["errors"] > reference["errors"]:
+            regressions.append({
+                "benchmark": name,
+                "field": "errors",
+                "baseline": reference["errors"],
+                "current": summary["errors"]
+            })
+        for field in LATENCY_FIELDS:
+            if reference[field] > 0 and summary[field] > reference[field] * (1 + tolerance):
+                regressions.append({
+                    "benchmark": name,
+                    "field": field,
+                    "baseline": reference[field],
+                    "current": summary[field],
+                    "change": round(summary[field] / reference[field] - 1, 3)
+                })
+    return regressions
@@ -0,0 +1,223 @@
+"""
+Offline Benchmarks
+==================
+
+Throughput and p50/p95 latency of the content approval and podcast
+processing paths, measured against the recorded service stubs in
+``stubs.py`` so runs are repeatable and need no API keys:
+
+    content_approval_gate   create_content_approval_crew, decided by the content gate
+    content_approval_crew   create_content_approval_crew, escalated to the approval crew
+    podcast_processing      GistaToolbox.process_podcast_script with audio and transcript
+    script_parser           ScriptParserTool on sample_podcast_script.md
+    transcription           TranscriptionTool, timestamped format
+    flask_content_approval  POST /api/content/approve under concurrent load,
+                            until the queued job finishes
+
+Run from ``src/``; results go to JSON and can be checked against a
+baseline from another commit:
+
+    python -m CrewAI.benchmarks.run_benchmarks --output bench.json
+    python -m CrewAI.benchmarks.run_benchmarks --compare baseline.json --tolerance 0.2
+
+The process exits with status 1 when a benchmark regressed past the
+tolerance. The TTS audio cache is bypassed so every iteration measures
+synthesis.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .harness import BenchmarkResult, compare_results, load_results, run_benchmark, write_results
+from .stubs import ServiceLatency, offline_services
+
+SAMPLE_SCRIPT_PATH = Path(__file__).resolve().parents[3] / "sample_podcast_script.md"
+
+APPROVED_URL = "https://news.benchmark.test/articles/ai-research"
+ESCALATED_URL = "https://blog.benchmark.test/untitled-post"
+
+# name -> (setup, default concurrency); setup returns the timed callable
+SCENARIOS: Dict[str, Any] = {}
+
+
+def scenario(name: str, concurrency: int = 1):
+    def register(setup: Callable[[Dict[str, Any], str], Callable[[int], Any]]):
+        SCENARIOS[name] = (setup, concurrency)
+        return setup
+    return register
+
+
+def _check_approval(result: Dict[str, Any]) -> None:
+    if result.get("status") == "error":
+        raise RuntimeError(result.get("error_message") or result.get("message") or "approval failed")
+
+
+@scenario("content_approval_gate")
+def content_approval_gate(fixtures: Dict[str, Any], work_dir: str) -> Callable[[int], Any]:
+    from ..main import create_content_approval_crew
+
+    return lambda iteration: _check_approval(create_content_approval_crew(APPROVED_URL))
+
+
+@scenario("content_approval_crew")
+def content_approval_crew(fixtures: Dict[str, Any], work_dir: str) -> Callable[[int], Any]:
+    from ..main import create_content_approval_crew
+
+    return lambda iteration: _check_approval(create_content_approval_crew(ESCALATED_URL))
+
+
+@scenario("podcast_processing")
+def podcast_processing(fixtures: Dict[str, Any], work_dir: str) -> Callable[[int], Any]:
+    from ..tools.gista_tools.gista_general_tools import GistaToolbox
+
+    toolbox = GistaToolbox()
+    toolbox.voiceover.cache = None
+    script = SAMPLE_SCRIPT_PATH.read_text(encoding="utf-8")
+
+    def process(iteration: int) -> None:
+        result = toolbox.process_podcast_script(
+            script,
+            output_dir=os.path.join(work_dir, "podcast", f"run_{iteration}"),
+            transcript_format="timestamped"
+        )
+        if "error" in result:
+            raise RuntimeError(result["error"])
+    return process
+
+
+@scenario("script_parser")
+def script_parser(fixtures: Dict[str, Any], work_dir: str) -> Callable[[int], Any]:
+    from ..tools.gista_tools.script_parser_tool import ScriptParserTool
+
+    parser = ScriptParserTool()
+    script = SAMPLE_SCRIPT_PATH.read_text(encoding="utf-8")
+    return lambda iteration: parser._run(script)
+
+
+@scenario("transcription")
+def transcription(fixtures: Dict[str, Any], work_dir: str) -> Callable[[int], Any]:
+    from ..tools.gista_tools.script_parser_tool import ScriptParserTool
+    from ..tools.gista_tools.transcription_tool import TranscriptionTool
+
+    parsed = ScriptParserTool()._run(SAMPLE_SCRIPT_PATH.read_text(encoding="utf-8"))
+    tool = TranscriptionTool()
+    metadata = {**parsed["metadata"], "segments": parsed["segments"]}
+    return lambda iteration: tool._run(
+        segments=parsed["segments"], metadata=metadata, format_type="timestamped"
+    )
+
+
+@scenario("flask_content_approval", concurrency=8)
+def flask_content_approval(fixtures: Dict[str, Any], work_dir: str) -> Callable[[int], Any]:
+    from ..main import API_KEY, app, job_queue
+
+    urls = sorted(fixtures["pages"])
+    headers = {"X-API-Key": API_KEY}
+
+    def approve(iteration: int) -> None:
+        # Test clients keep cookies, so each request gets its own
+        response = app.test_client().post(
+            "/api/content/approve",
+            json={
+                "userId": "benchmark",
+                "gistId": f"gist-{iteration}",
+                "gistData": {"link": urls[iteration % len(urls)]}
+            },
+            headers=headers
+        )
+        if response.status_code != 202:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.get_json()}")
+        job = job_queue.get(response.get_json()["jobId"])
+        if not job.wait(timeout=120):
+            raise TimeoutError(f"Job {job.job_id} did not finish")
+        if job.error:
+            raise RuntimeError(job.error["error_message"])
+        _check_approval(job.result)
+    return approve
+
+
+def run_scenarios(
+    names: List[str],
+    iterations: int,
+    warmup: int,
+    latency: ServiceLatency,
+    concurrency: Optional[int] = None
+) -> List[BenchmarkResult]:
+    """Run the named scenarios against the offline stubs"""
+    results = []
+    with offline_services(latency) as fixtures, tempfile.TemporaryDirectory(prefix="gista-bench-") as work_dir:
+        for name in names:
+            setup, default_concurrency = SCENARIOS[name]
+            workers = concurrency or default_concurrency
+            print(f"Running {name} ({iterations} iterations, concurrency {workers})...")
+            result = run_benchmark(
+                name,
+                setup(fixtures, work_dir),
+                iterations=iterations,
+                concurrency=workers,
+                warmup=warmup,
+                metadata={"latency": latency.to_dict()}
+            )
+            summary = result.summary()
+            print(
+                f"  {summary['throughput_per_second']:>8.2f}/s  p50 {summary['p50_ms']:>9.1f} ms  "
+                f"p95 {summary['p95_ms']:>9.1f} ms  errors {summary['errors']}"
+            )
+            results.append(result)
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks for content approval and podcast processing")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed calls per scenario")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed calls before measuring")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Threads per scenario (default: 8 for the Flask endpoint, 1 otherwise)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds per stubbed LLM call")
+    parser.add_argument("--http-latency", type=float, default=0.02, help="Seconds per stubbed HTTP request")
+    parser.add_argument("--tts-latency", type=float, default=0.05, help="Seconds per stubbed ElevenLabs call")
+    parser.add_argument("--output", default="benchmark_results.json", help="Results JSON file")
+    parser.add_argument("--compare", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed latency increase (0.2 = +20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}")
+        return 2
+
+    latency = ServiceLatency(llm=args.llm_latency, http=args.http_latency, tts=args.tts_latency)
+    results = run_scenarios(names, args.iterations, args.warmup, latency, args.concurrency)
+    document = write_results(args.output, results, settings={
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+        "latency": latency.to_dict()
+    })
+    print(f"✓ Results written to {args.output}")
+
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), document, args.tolerance)
+        for regression in regressions:
+            print(
+                f"✗ {regression['benchmark']} {regression['field']}: "
+                f"{regression['baseline']} → {regression['current']}"
+            )
+        if regressions:
+            return 1
+        print(f"✓ No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Offline Service Stubs
+=====================
+
+Recorded stand-ins for the external services the benchmarks would
+otherwise call: the OpenAI chat model, Serper, website scraping and
+ElevenLabs. Responses come from ``fixtures/recorded_responses.json`` and
+each stub sleeps for a configurable latency so results reflect how the
+code overlaps network time rather than how fast the stubs return.
+
+    with offline_services(ServiceLatency(llm=0.2, http=0.05, tts=0.3)) as fixtures:
+        create_content_approval_crew("https://news.benchmark.test/articles/ai-research")
+
+Unknown URLs get a 404 and no request ever leaves the process.
+"""
+
+import json
+import os
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from unittest import mock
+from urllib.parse import urlsplit
+
+FIXTURES_PATH = Path(__file__).resolve().parent / "fixtures" / "recorded_responses.json"
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, joint stereo, no CRC
+MP3_FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0x44])
+MP3_FRAME_SECONDS = 1152 / 44100
+SPOKEN_WORDS_PER_SECOND = 2.5
+
+SERPER_HOST = "google.serper.dev"
+
+# Placeholder credentials so settings validation and tool constructors pass
+OFFLINE_ENVIRONMENT = {
+    "OPENAI_API_KEY": "offline-benchmark",
+    "SERPER_API_KEY": "offline-benchmark",
+    "ELEVENLABS_API_KEY": "offline-benchmark",
+    "CREW_AI_FUNCTIONS_API_KEY": "offline-benchmark",
+    "LLM_CACHE_ENABLED": "0",
+    "OTEL_SDK_DISABLED": "true"
+}
+
+
+class ServiceLatency:
+    """Simulated latency in seconds for each stubbed service"""
+
+    def __init__(self, llm: float = 0.0, http: float = 0.0, tts: float = 0.0):
+        self.llm = llm
+        self.http = http
+        self.tts = tts
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"llm": self.llm, "http": self.http, "tts": self.tts}
+
+
+def load_fixtures(path: Path = FIXTURES_PATH) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def render_page(page: Dict[str, Any]) -> str:
+    """HTML document for a recorded page entry"""
+    head = []
+    if page.get("title"):
+        head.append(f"<title>{page['title']}</title>")
+    if page.get("author"):
+        head.append(f'<meta name="author" content="{page["author"]}">')
+    if page.get("published"):
+        head.append(f'<meta property="article:published_time" content="{page["published"]}">')
+    body = "".join(f"<p>{page['paragraph']}</p>" for _ in range(page.get("repeat", 1)))
+    return f"<html><head>{''.join(head)}</head><body><article>{body}</article></body></html>"
+
+
+def pick_llm_response(recorded: List[Dict[str, str]], prompt: str) -> str:
+    """First recorded response whose ``match`` text occurs in the prompt"""
+    for entry in recorded:
+        if entry["match"] in prompt:
+            return entry["response"]
+    raise LookupError("No recorded LLM response matches the prompt")
+
+
+def _make_response(url: str, status: int, body: bytes, content_type: str):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response.headers = CaseInsensitiveDict({
+        "Content-Type": content_type,
+        "Content-Length": str(len(body))
+    })
+    response.encoding = "utf-8"
+    response._content = body
+    # Lets iter_content stream the recorded body
+    response._content_consumed = True
+    return response
+
+
+class RecordedHTTP:
+    """Replacement for ``requests.Session.request`` serving recorded responses"""
+
+    def __init__(self, fixtures: Dict[str, Any], latency: float = 0.0):
+        self.fixtures = fixtures
+        self.latency = latency
+
+    def __call__(self, session: Any, method: str, url: str, *args: Any, **kwargs: Any):
+        if self.latency:
+            time.sleep(self.latency)
+        if urlsplit(url).hostname == SERPER_HOST:
+            body = json.dumps(self.fixtures["serper"]).encode("utf-8")
+            return _make_response(url, 200, body, "application/json")
+
+        page = self.fixtures["pages"].get(url)
+        if page is None:
+            return _make_response(url, 404, b"<html><body>Not found</body></html>", "text/html")
+        return _make_response(
+            url, page["status"], render_page(page).encode("utf-8"), page["content_type"]
+        )
+
+
+def _recorded_chat_model_class():
+    from langchain_core.language_models.chat_models import SimpleChatModel
+
+    class RecordedChatModel(SimpleChatModel):
+        """Chat model replaying recorded agent turns after a fixed delay"""
+
+        responses: List[Dict[str, str]]
+        latency: float = 0.0
+
+        @property
+        def _llm_type(self) -> str:
+            return "recorded-chat-model"
+
+        def _call(self, messages, stop=None, run_manager=None, **kwargs) -> str:
+            if self.latency:
+                time.sleep(self.latency)
+            prompt = "\n".join(str(message.content) for message in messages)
+            return pick_llm_response(self.responses, prompt)
+
+    return RecordedChatModel
+
+
+def silent_mp3(seconds: float) -> bytes:
+    """Valid MP3 frames of silence lasting about ``seconds``"""
+    from ..tools.gista_tools.mp3_frames import parse_frame_header, silent_frame
+
+    frame = silent_frame(parse_frame_header(MP3_FRAME_HEADER))
+    return frame * max(1, round(seconds / MP3_FRAME_SECONDS))
+
+
+class RecordedElevenLabs:
+    """Stand-in for the ElevenLabs client; audio length follows the word count"""
+
+    def __init__(self, latency: float = 0.0, **kwargs: Any):
+        self.latency = latency
+
+    def generate(self, text: str, voice: str, **kwargs: Any) -> Iterator[bytes]:
+        if self.latency:
+            time.sleep(self.latency)
+        audio = silent_mp3(len(re.findall(r"\S+", text)) / SPOKEN_WORDS_PER_SECOND)
+        return iter([audio[i:i + 4096] for i in range(0, len(audio), 4096)])
+
+
+@contextmanager
+def offline_services(latency: Optional[ServiceLatency] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Route the LLM, HTTP and ElevenLabs calls of the app to recorded stubs
+
+    Yields:
+        The loaded fixtures
+    """
+    latency = latency or ServiceLatency()
+    fixtures = load_fixtures()
+    chat_model_class = _recorded_chat_model_class()
+
+    def chat_model(*args: Any, **kwargs: Any):
+        return chat_model_class(responses=fixtures["llm"], latency=latency.llm)
+
+    def elevenlabs_client(*args: Any, **kwargs: Any):
+        return RecordedElevenLabs(latency=latency.tts)
+
+    http = RecordedHTTP(fixtures, latency.http)
+
+    def session_request(session: Any, method: str, url: str, *args: Any, **kwargs: Any):
+        return http(session, method, url, *args, **kwargs)
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.dict(os.environ, OFFLINE_ENVIRONMENT))
+        # requests.get/post/request all go through Session.request
+        stack.enter_context(mock.patch("requests.sessions.Session.request", session_request))
+        # Agents built without an explicit llm use crewai's ChatOpenAI default
+        stack.enter_context(mock.patch("crewai.agent.ChatOpenAI", chat_model))
+        stack.enter_context(mock.patch(
+            "CrewAI.tools.gista_tools.elevenLabs_voiceover_tool.ElevenLabs", elevenlabs_client
+        ))
+        yield fixtures
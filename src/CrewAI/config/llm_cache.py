@@ -0,0 +1,260 @@
+"""
+LLM Response Cache
+==================
+
+Opt-in SQLite cache for the LLM calls made by crews.
+
+The cache is installed as LangChain's global LLM cache, so every agent
+LLM (crewai's default ChatOpenAI included) consults it before calling the
+provider. LangChain looks entries up by ``(prompt, llm_string)``:
+
+    llm_string  model name and parameters, temperature included
+    prompt      the full serialized prompt; for crewai's ReAct agents this
+                contains the task description and every tool output seen
+                so far, so a changed tool result is a different entry
+
+Entries are stored under a SHA-256 of both. Re-running a gist after a
+transient failure then replays the LLM turns that already succeeded.
+
+Sampled responses are not replayed by default: calls with a temperature
+above 0 (or no temperature in the llm_string) bypass the cache unless
+LLM_CACHE_ALLOW_TEMPERATURE is set.
+
+Environment settings:
+    LLM_CACHE_ENABLED              Set to 1/true to install the cache
+    LLM_CACHE_PATH                 SQLite file (default db/llm_cache.sqlite3)
+    LLM_CACHE_TTL                  Entry lifetime in seconds (default 7 days)
+    LLM_CACHE_MAX_ENTRIES          Entry limit, least recently used evicted
+                                   first (default 5000)
+    LLM_CACHE_MAX_BYTES            Total stored response size (default 100 MB)
+    LLM_CACHE_ALLOW_TEMPERATURE    Also cache calls with temperature > 0
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from langchain_core.caches import BaseCache
+except ImportError:
+    try:
+        from langchain.schema.cache import BaseCache
+    except ImportError:
+        # LangChain is only needed to install the cache; the store itself
+        # works without it
+        BaseCache = object
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[3] / "db" / "llm_cache.sqlite3"
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# Matches the JSON form ("temperature": 0.7) and the sorted-params form
+# (('temperature', 0.7)) that LangChain puts in llm_string
+_TEMPERATURE = re.compile(r"""["']temperature["']\s*[:,]\s*(-?[0-9.]+(?:[eE][-+]?[0-9]+)?)""")
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def temperature_from_llm_string(llm_string: str) -> Optional[float]:
+    """Temperature recorded in a LangChain llm_string, or None if absent"""
+    match = _TEMPERATURE.search(llm_string)
+    if match is None:
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        return None
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+class LLMResponseStore:
+    """
+    SQLite key/value store with TTL, entry and byte limits
+
+    Args:
+        path: SQLite file path (":memory:" for a private in-memory store)
+        ttl: Seconds an entry stays valid
+        max_entries: Entry limit; least recently used entries are evicted
+        max_bytes: Limit on the summed size of stored values
+    """
+
+    def __init__(
+        self,
+        path: str = str(DEFAULT_CACHE_PATH),
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("DELETE FROM llm_cache WHERE created_at <= ?", (time.time() - ttl,))
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Stored value, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now - self.ttl:
+                if row is not None:
+                    self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                self._stats["misses"] += 1
+                return None
+            self._db.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._stats["hits"] += 1
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now)
+            )
+            self._stats["writes"] += 1
+            self._enforce_limits(now)
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM llm_cache")
+            self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, total = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+            return {**self._stats, "entries": entries, "bytes": total}
+
+    def _enforce_limits(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones. Caller holds the lock."""
+        self._db.execute("DELETE FROM llm_cache WHERE created_at <= ?", (now - self.ttl,))
+        entries, total = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        if entries <= self.max_entries and total <= self.max_bytes:
+            return
+
+        rows = self._db.execute("SELECT key, size FROM llm_cache ORDER BY last_used ASC").fetchall()
+        for key, size in rows:
+            if entries <= self.max_entries and total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            entries -= 1
+            total -= size
+            self._stats["evictions"] += 1
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    LangChain cache backed by an LLMResponseStore
+
+    Args:
+        store: Where responses are kept
+        allow_temperature: Also cache calls with temperature > 0
+    """
+
+    def __init__(self, store: LLMResponseStore, allow_temperature: bool = False):
+        self.store = store
+        self.allow_temperature = allow_temperature
+
+    def is_cacheable(self, llm_string: str) -> bool:
+        if self.allow_temperature:
+            return True
+        temperature = temperature_from_llm_string(llm_string)
+        return temperature is not None and temperature <= 0
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Any]:
+        if not self.is_cacheable(llm_string):
+            return None
+        value = self.store.get(cache_key(prompt, llm_string))
+        if value is None:
+            return None
+        from langchain_core.load import loads
+        try:
+            return loads(value)
+        except Exception:
+            # Written by an incompatible LangChain version; call the LLM again
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Any) -> None:
+        if not self.is_cacheable(llm_string):
+            return
+        from langchain_core.load import dumps
+        self.store.set(cache_key(prompt, llm_string), dumps(list(return_val)))
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
+
+
+_llm_cache: Optional[SQLiteLLMCache] = None
+_llm_cache_configured = False
+_llm_cache_lock = threading.Lock()
+
+
+def configure_llm_cache() -> Optional[SQLiteLLMCache]:
+    """
+    Install the LLM cache if LLM_CACHE_ENABLED is set
+
+    Safe to call from every crew factory; the environment is read and the
+    cache installed only on the first call.
+
+    Returns:
+        The installed cache, or None when caching is disabled
+    """
+    global _llm_cache, _llm_cache_configured
+    if _llm_cache_configured:
+        return _llm_cache
+
+    with _llm_cache_lock:
+        if _llm_cache_configured:
+            return _llm_cache
+        if _env_flag("LLM_CACHE_ENABLED"):
+            from langchain.globals import set_llm_cache
+
+            store = LLMResponseStore(
+                path=os.getenv("LLM_CACHE_PATH") or str(DEFAULT_CACHE_PATH),
+                ttl=float(os.getenv("LLM_CACHE_TTL", str(DEFAULT_TTL))),
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))),
+                max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+            )
+            _llm_cache = SQLiteLLMCache(store, allow_temperature=_env_flag("LLM_CACHE_ALLOW_TEMPERATURE"))
+            set_llm_cache(_llm_cache)
+            print(f"LLM cache enabled at {store.path}")
+        _llm_cache_configured = True
+    return _llm_cache
@@ -1,14 +1,17 @@
 import os
-from langchain_community.llms import HuggingFaceHub
-from langchain_community.chat_models import ChatCohere
-from dotenv import load_dotenv
 
-load_dotenv()
+from .settings import load_environment
+
+# Provider clients are imported inside their factory so only the provider
+# actually requested is loaded
 
 def get_huggingface_llm():
     """
     Initialize and return HuggingFace LLM
     """
+    from langchain_community.llms import HuggingFaceHub
+
+    load_environment()
     return HuggingFaceHub(
         repo_id="HuggingFaceH4/zephyr-7b-beta",
         huggingfacehub_api_token=os.getenv('HUGGINGFACE_API_TOKEN'),
@@ -19,6 +22,7 @@ def get_mistral_config():
     """
     Return Mistral configuration
     """
+    load_environment()
     return {
         "api_key": os.getenv('MISTRAL_API_KEY'),
         "api_base": "https://api.mistral.ai/v1",
@@ -29,10 +33,29 @@ def get_cohere_llm():
     """
     Initialize and return Cohere LLM
     """
+    from langchain_community.chat_models import ChatCohere
+
+    load_environment()
     return ChatCohere(
         cohere_api_key=os.getenv('COHERE_API_KEY')
     )
 
+def get_openai_llm(temperature: float = 0.0, request_timeout: float = None):
+    """
+    Initialize and return the OpenAI chat model crewai agents use by default
+
+    Agents whose answers should be repeatable (validation, approval) run at
+    temperature 0, which also lets the LLM response cache replay them.
+    """
+    from langchain_openai import ChatOpenAI
+
+    load_environment()
+    return ChatOpenAI(
+        model=os.environ.get("OPENAI_MODEL_NAME", "gpt-4"),
+        temperature=temperature,
+        request_timeout=request_timeout
+    )
+
 def get_llm(provider: str = "openai"):
     """
     Factory function to get the specified LLM
@@ -1,12 +1,26 @@
-import os
-from dotenv import load_dotenv
+"""
+Settings
+========
+
+Environment-backed application settings, loaded once on first use.
+
+Importing this module has no side effects: ``.env`` is read and the
+environment parsed the first time ``get_settings()`` is called, and the
+result is cached for the process. Required keys are checked by
+``validate_settings()``, which the crew entry points call before they
+run, not at import.
 
-# Load environment variables
-load_dotenv()
+    settings = get_settings()
+    settings.content_approval_max_workers
 
-# API Keys
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-SERPER_API_KEY = os.getenv('SERPER_API_KEY')
+The environment-backed module constants (``OPENAI_API_KEY``,
+``CONTENT_APPROVAL_MAX_WORKERS``, ...) are still importable and resolve
+to the cached settings.
+"""
+
+import os
+import threading
+from typing import Any, Optional
 
 # Model Settings
 DEFAULT_MODEL = "gpt-4-turbo"
@@ -17,13 +31,84 @@ MAX_TOKENS = 1500
 DEBUG_MODE = True
 VERBOSE_OUTPUT = bool(2)  # or simply True if you want verbose output
 
+_environment_loaded = False
+_environment_lock = threading.Lock()
+
+
+def load_environment() -> None:
+    """Load ``.env`` into the process environment (once)"""
+    global _environment_loaded
+    if _environment_loaded:
+        return
+    with _environment_lock:
+        if not _environment_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _environment_loaded = True
+
+
+class Settings:
+    """Settings parsed from the environment"""
+
+    def __init__(self):
+        # API Keys
+        self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        self.serper_api_key = os.getenv('SERPER_API_KEY')
+        self.functions_api_key = os.getenv('CREW_AI_FUNCTIONS_API_KEY')
+
+        # Job Queue Settings
+        self.content_approval_max_workers = int(os.getenv('CONTENT_APPROVAL_MAX_WORKERS', '2'))
+        self.content_approval_max_pending = int(os.getenv('CONTENT_APPROVAL_MAX_PENDING', '50'))
+        self.job_result_ttl_seconds = int(os.getenv('JOB_RESULT_TTL_SECONDS', '3600'))
+        self.content_approval_max_batch = int(os.getenv('CONTENT_APPROVAL_MAX_BATCH', '100'))
+        self.content_approval_batch_wait = float(os.getenv('CONTENT_APPROVAL_BATCH_WAIT', '30'))
+        self.content_approval_pool_size = int(
+            os.getenv('CONTENT_APPROVAL_POOL_SIZE', str(self.content_approval_max_workers))
+        )
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """Process-wide settings, read from ``.env`` and the environment on first call"""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                load_environment()
+                _settings = Settings()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Forget the cached settings; the next get_settings() re-reads the environment"""
+    global _settings
+    with _settings_lock:
+        _settings = None
+
+
 # Validate required settings
 def validate_settings():
     """Validate that all required settings are present"""
-    if not OPENAI_API_KEY:
+    settings = get_settings()
+    if not settings.openai_api_key:
         raise ValueError("OPENAI_API_KEY is not set in environment variables")
-    if not SERPER_API_KEY:
+    if not settings.serper_api_key:
         raise ValueError("SERPER_API_KEY is not set in environment variables")
 
-# Initialize settings validation
-validate_settings() 
\ No newline at end of file
+
+_SETTING_CONSTANTS = {
+    'OPENAI_API_KEY', 'SERPER_API_KEY',
+    'CONTENT_APPROVAL_MAX_WORKERS', 'CONTENT_APPROVAL_MAX_PENDING', 'JOB_RESULT_TTL_SECONDS',
+    'CONTENT_APPROVAL_MAX_BATCH', 'CONTENT_APPROVAL_BATCH_WAIT', 'CONTENT_APPROVAL_POOL_SIZE'
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Environment-backed constants resolve lazily to the cached settings
+    if name in _SETTING_CONSTANTS:
+        return getattr(get_settings(), name.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
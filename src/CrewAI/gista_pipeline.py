@@ -0,0 +1,347 @@
+"""
+Gista Pipeline
+==============
+
+Resumable content assessment → script production → voice generation
+pipeline for a single gist.
+
+Every stage's output is saved to the checkpoint store under the gist ID
+as soon as the stage finishes. Running the pipeline again for the same
+gist skips finished stages and resumes at the first incomplete one, so a
+failure during voice generation keeps the content analysis and the
+script. Crew stages run through the task scheduler, so tasks whose
+context does not depend on each other (terminology analysis and
+background research) run at the same time.
+
+Voice generation is checkpointed per script part: each part written to
+disk is recorded with a hash of its text, and a re-run only synthesizes
+parts that are missing, changed, or whose file is gone before assembling
+the episode.
+
+The script stage renders every script task's output, in task order,
+into the speaker-tagged markdown that ``ScriptStream`` parses
+(``[Host Voice]`` lines before each speaker's text).
+
+Example:
+    result = GistaPipeline("gist-123", "https://example.com/article").run()
+
+or from ``src/``:
+
+    python -m CrewAI.gista_pipeline gist-123 https://example.com/article
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config.settings import VERBOSE_OUTPUT, validate_settings
+from .agents.gistaApp_agents.content_approval_team.content_snapshot import fetch_snapshot
+from .tools.gista_tools.audio_assembly import assemble_episode, split_on_pauses
+from .tools.gista_tools.script_stream import SOURCE_PREFIX, TITLE_PREFIX, ScriptStream
+from .tools.tool_registry import get_tool
+from .utils.checkpoint_store import CheckpointStore, get_checkpoint_store
+from .utils.metrics import context_bound
+from .utils.task_scheduler import run_crew
+
+STAGE_CONTENT_ASSESSMENT = "content_assessment"
+STAGE_SCRIPT_PRODUCTION = "script_production"
+STAGE_VOICE_GENERATION = "voice_generation"
+
+PIPELINE_STAGES = (STAGE_CONTENT_ASSESSMENT, STAGE_SCRIPT_PRODUCTION, STAGE_VOICE_GENERATION)
+
+DEFAULT_OUTPUT_ROOT = os.getenv("GISTA_OUTPUT_DIR") or str(Path(__file__).resolve().parents[2] / "output")
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _script_content(output: Any) -> Dict[str, str]:
+    """Speaker → text of one script task output (ScriptOutput, dict or JSON)"""
+    if hasattr(output, "script_content"):
+        return dict(output.script_content)
+    if isinstance(output, str):
+        try:
+            output = json.loads(output)
+        except ValueError:
+            return {"host": output} if output.strip() else {}
+    if isinstance(output, dict):
+        return dict(output.get("script_content", {}))
+    return {}
+
+
+def render_script(outputs: List[Any], title: str, source: str) -> str:
+    """
+    Script markdown for ``ScriptStream`` from the script tasks' outputs
+
+    Args:
+        outputs: Task outputs in episode order
+        title: Episode title
+        source: Content source shown in the header
+
+    Returns:
+        Script text with one ``[<Speaker> Voice]`` block per speaker turn
+    """
+    lines = [f"{TITLE_PREFIX} {title}", f"{SOURCE_PREFIX} {source}", ""]
+    for index, output in enumerate(outputs):
+        segment_type = getattr(output, "segment_type", None) or f"part {index + 1}"
+        lines += [f"## {segment_type.replace('_', ' ').title()}", ""]
+        for speaker, text in _script_content(output).items():
+            if text and text.strip():
+                lines += [f"[{speaker.replace('_', ' ').title()} Voice]", text.strip(), ""]
+    return "\n".join(lines)
+
+
+def _script_is_parseable(script: Any) -> bool:
+    return isinstance(script, str) and next(iter(ScriptStream(script)), None) is not None
+
+
+def _content_cleared(content_result: Any) -> bool:
+    """False only when the assessment explicitly reports a non-CLEARED status"""
+    data = content_result
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            return True
+    if isinstance(data, dict) and "content_status" in data:
+        return data["content_status"] == "CLEARED"
+    return True
+
+
+class GistaPipeline:
+    """
+    Runs the Gista stages for one gist, resuming from checkpoints
+
+    Args:
+        gist_id: Checkpoint key for this gist
+        content_source: URL or file path of the source content
+        store: Checkpoint store (process-wide store by default)
+        output_dir: Directory for segment audio and episode.mp3
+            (GISTA_OUTPUT_DIR/<gist_id> by default)
+    """
+
+    def __init__(
+        self,
+        gist_id: str,
+        content_source: str,
+        store: Optional[CheckpointStore] = None,
+        output_dir: Optional[str] = None
+    ):
+        self.gist_id = gist_id
+        self.content_source = content_source
+        self.store = store or get_checkpoint_store()
+        self.output_dir = output_dir or os.path.join(DEFAULT_OUTPUT_ROOT, gist_id)
+        self._agents: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def agents(self) -> Dict[str, Dict[str, Any]]:
+        # Only built when a crew stage actually has to run
+        if self._agents is None:
+            from .agents.gistaApp_agents.gista_agents import create_gista_agents
+
+            self._agents = create_gista_agents()
+        return self._agents
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every unfinished stage in order
+
+        Returns:
+            Dict with ``status`` (completed, content_rejected or error), the
+            stage outputs, ``resumed_from`` and, on error, the failed stage
+        """
+        resumed_from = self.store.first_incomplete(self.gist_id, PIPELINE_STAGES)
+        if resumed_from is not None and resumed_from != PIPELINE_STAGES[0]:
+            print(f"Resuming gist {self.gist_id} at stage: {resumed_from}")
+
+        outputs: Dict[str, Any] = {}
+        stage = None
+        try:
+            stage = STAGE_CONTENT_ASSESSMENT
+            outputs[stage] = self._run_stage(stage, self._run_content_assessment)
+            if not _content_cleared(outputs[stage]):
+                return {
+                    "status": "content_rejected",
+                    "details": outputs[stage],
+                    "resumed_from": resumed_from
+                }
+
+            stage = STAGE_SCRIPT_PRODUCTION
+            outputs[stage] = self._run_stage(
+                stage,
+                lambda: self._run_script_production(outputs[STAGE_CONTENT_ASSESSMENT]),
+                valid=_script_is_parseable
+            )
+
+            stage = STAGE_VOICE_GENERATION
+            outputs[stage] = self._run_stage(
+                stage, lambda: self._run_voice_generation(outputs[STAGE_SCRIPT_PRODUCTION])
+            )
+        except Exception as e:
+            print(f"Error in pipeline stage {stage} for gist {self.gist_id}: {str(e)}")
+            return {
+                "status": "error",
+                "failed_stage": stage,
+                "error_message": str(e),
+                "error_type": type(e).__name__,
+                "resumed_from": resumed_from,
+                **outputs
+            }
+
+        return {
+            "status": "completed",
+            "resumed_from": resumed_from,
+            **outputs
+        }
+
+    def _run_stage(self, stage: str, execute, valid=None) -> Any:
+        saved = self.store.load(self.gist_id, stage)
+        if saved is not None and (valid is None or valid(saved)):
+            print(f"✓ {stage}: loaded from checkpoint")
+            return saved
+        if saved is not None:
+            print(f"✗ {stage}: saved checkpoint is unusable, running the stage again")
+        # Later stages were built from this stage's previous output
+        for later in PIPELINE_STAGES[PIPELINE_STAGES.index(stage) + 1:]:
+            self.store.clear(self.gist_id, later)
+        output = execute()
+        self.store.save(self.gist_id, stage, output)
+        print(f"✓ {stage}: checkpoint saved")
+        return output
+
+    def _run_crew(self, stage: str, agents: Dict[str, Any], tasks: List[Any]) -> Any:
+        from crewai import Crew
+
+        crew = Crew(
+            agents=list(agents.values()),
+            tasks=tasks,
+            verbose=VERBOSE_OUTPUT
+        )
+        return run_crew(crew, name=stage)
+
+    def _content_assessment_tasks(self) -> List[Any]:
+        from .tasks.gistaApp_tasks.gista_tasks import (
+            create_user_content_research_tasks,
+            create_user_content_validation_tasks,
+        )
+
+        agents = self.agents["content_assessment"]
+        snapshot = None
+        if self.content_source.lower().startswith(("http://", "https://")):
+            snapshot = fetch_snapshot(self.content_source)
+
+        validation_tasks = create_user_content_validation_tasks(agents, snapshot)
+        research_tasks = create_user_content_research_tasks(agents, validation_tasks, snapshot)
+        validation_tasks[0].description += f"\n\nContent source: {self.content_source}"
+        return validation_tasks + research_tasks
+
+    def _script_production_tasks(self, content_result: Any) -> List[Any]:
+        from .tasks.gistaApp_tasks.gista_tasks import create_script_production_tasks
+
+        tasks = create_script_production_tasks(self.agents["script_production"])
+        # The crew runs without inputs, so the analysis is handed to the
+        # first task directly instead of through str.format interpolation
+        tasks[0].description += f"\n\nContent analysis from the assessment stage:\n{content_result}"
+        return tasks
+
+    def _run_content_assessment(self) -> str:
+        validate_settings()
+        tasks = self._content_assessment_tasks()
+        return str(self._run_crew(STAGE_CONTENT_ASSESSMENT, self.agents["content_assessment"], tasks))
+
+    def _run_script_production(self, content_result: Any) -> str:
+        validate_settings()
+        tasks = self._script_production_tasks(content_result)
+        self._run_crew(STAGE_SCRIPT_PRODUCTION, self.agents["script_production"], tasks)
+
+        # The crew result is only the last task's output; the script is
+        # every segment task's output in order
+        outputs = [task.output.exported_output for task in tasks if task.output is not None]
+        script = render_script(outputs, title=self.gist_id, source=self.content_source)
+        if not _script_is_parseable(script):
+            raise RuntimeError("Script production returned no speaker segments")
+        return script
+
+    def _run_voice_generation(self, script: str) -> Dict[str, Any]:
+        """Synthesize missing script parts, then assemble the episode"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        parts = list(split_on_pauses(ScriptStream(script)))
+        done = self.store.items(self.gist_id, STAGE_VOICE_GENERATION)
+
+        pending: List[int] = []
+        for index, part in enumerate(parts):
+            saved = done.get(f"part-{index:03d}")
+            if (
+                saved is not None
+                and saved.get("text_digest") == _text_digest(part["text"])
+                and os.path.exists(saved.get("file_path", ""))
+            ):
+                part["file_path"] = saved["file_path"]
+            else:
+                pending.append(index)
+
+        if len(pending) < len(parts):
+            print(f"✓ voice: {len(parts) - len(pending)} of {len(parts)} parts loaded from checkpoint")
+
+        voiceover = get_tool("voiceover")
+        failures: Dict[int, str] = {}
+        failures_lock = threading.Lock()
+
+        def synthesize(index: int) -> None:
+            part = parts[index]
+            result = voiceover.synthesize_to_file(
+                text=part["text"],
+                voice_role=part["voice_role"],
+                segment_type=part["segment_type"],
+                output_path=os.path.join(self.output_dir, f"segment_{index:03d}.mp3")
+            )
+            if "error" in result:
+                with failures_lock:
+                    failures[index] = result["error"]
+                return
+            part["file_path"] = result["file_path"]
+            self.store.save(
+                self.gist_id,
+                STAGE_VOICE_GENERATION,
+                {"file_path": result["file_path"], "text_digest": _text_digest(part["text"])},
+                item=f"part-{index:03d}"
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, voiceover.max_concurrency), thread_name_prefix="gista-voice"
+        ) as executor:
+            list(executor.map(context_bound(synthesize), pending))
+
+        if failures:
+            # Finished parts stay checkpointed; the next run retries the rest
+            raise RuntimeError(
+                f"{len(failures)} of {len(parts)} voice parts failed: "
+                + "; ".join(f"part {i}: {error}" for i, error in sorted(failures.items()))
+            )
+
+        episode = assemble_episode(parts, os.path.join(self.output_dir, "episode.mp3"))
+        return {
+            "episode": episode,
+            "parts": len(parts),
+            "synthesized_parts": len(pending)
+        }
+
+
+def run_gista_pipeline(gist_id: str, content_source: str) -> Dict[str, Any]:
+    """Run or resume the Gista pipeline for a gist"""
+    return GistaPipeline(gist_id, content_source).run()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m CrewAI.gista_pipeline <gist_id> <content_source>")
+        sys.exit(2)
+    result = run_gista_pipeline(sys.argv[1], sys.argv[2])
+    print(json.dumps(result, indent=2, default=str))
+    sys.exit(0 if result["status"] == "completed" else 1)
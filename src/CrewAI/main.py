@@ -6,16 +6,42 @@ New implementation focuses on content approval functionality.
 import warnings
 import os
 import sys
-from crewai import Crew
-from .config.settings import VERBOSE_OUTPUT, validate_settings
-from .agents.gistaApp_agents.content_approval_team.content_approval_team import ContentApprovalTeam
-from flask import Flask, request, jsonify, abort
+import threading
+from .config.settings import VERBOSE_OUTPUT, get_settings, validate_settings
+from .agents.gistaApp_agents.content_approval_team.content_snapshot import SnapshotStore
+from .agents.gistaApp_agents.content_approval_team.content_gate import get_content_gate
+from .utils.job_queue import JobQueue, JobQueueFullError
+from .utils.batch_approval import parse_wait_timeout, plan_batch
+from .utils.metrics import registry, timed_crew
+from .tools.tool_registry import preload_tools_from_env
+from flask import Flask, Response, request, jsonify, abort
 from functools import wraps
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
-API_KEY = os.getenv('CREW_AI_FUNCTIONS_API_KEY')
+# crewai, langchain and the provider SDKs are imported on the first crew
+# run, not here, so a new worker can serve /metrics and queue jobs at once
+settings = get_settings()
+
+API_KEY = settings.functions_api_key
+
+_approval_team_pool = None
+_approval_team_pool_lock = threading.Lock()
+
+def get_approval_team_pool():
+    """Warmed content approval teams shared by all requests, created on first use"""
+    global _approval_team_pool
+    if _approval_team_pool is None:
+        with _approval_team_pool_lock:
+            if _approval_team_pool is None:
+                from .agents.gistaApp_agents.content_approval_team.team_pool import ContentApprovalTeamPool
+
+                _approval_team_pool = ContentApprovalTeamPool(
+                    max_size=settings.content_approval_pool_size,
+                    verbose=bool(VERBOSE_OUTPUT)
+                )
+    return _approval_team_pool
 
 def check_environment():
     """Check if required environment variables are set"""
@@ -35,52 +61,103 @@ def check_environment():
     
     print("✅ All required environment variables are set")
 
-def create_content_approval_crew(content_source: str):
+def create_content_approval_crew(content_source: str, raise_errors: bool = False):
     """
     Create and run a crew for content approval
     
     Args:
         content_source (str): URL, PDF path, or DOCX path to source content
+        raise_errors (bool): Re-raise failures instead of returning an error result
         
     Returns:
         dict: Results from the content approval process
     """
     # Validate settings
     validate_settings()
-    
-    # Create content approval team
-    approval_team = ContentApprovalTeam(verbose=bool(VERBOSE_OUTPUT))
+    from .config.llm_cache import configure_llm_cache
+    configure_llm_cache()
     
     try:
-        # Get crew, tasks and guidelines
-        crew, read_task, guidelines = approval_team.start_podcast_production_flow(content_source)
+        # Fetch the source once; every task of this job reads the snapshot
+        snapshot_store = SnapshotStore()
+        snapshot = None
+        if content_source.lower().startswith(("http://", "https://")):
+            snapshot = snapshot_store.get_or_fetch(content_source)
         
-        if crew and read_task and guidelines:
-            # Execute the read guidelines task
-            result = crew.kickoff(inputs={"guidelines": guidelines})
-            
-            return {
-                "status": "guidelines_reviewed",
-                "result": result,
-                "message": "Guidelines have been reviewed and understood",
-                "next_step": "content_validation"
-            }
-        else:
+        # Clear rejections and approvals are decided without the crew
+        decision = get_content_gate().evaluate(snapshot)
+        if decision.is_final:
+            gate_result = decision.to_dict()
             return {
-                "status": "error",
-                "message": "Failed to prepare podcast production flow"
+                "status": gate_result["status"],
+                "result": gate_result,
+                "content_snapshot": snapshot.to_dict() if snapshot else None,
+                "message": gate_result["message"],
+                "next_step": "content_analysis" if gate_result["status"] == "approved" else None
             }
+        
+        # Lease a warmed content approval team for this content source
+        with get_approval_team_pool().lease() as approval_team:
+            # Get crew, tasks and guidelines
+            crew, read_task, guidelines = approval_team.start_podcast_production_flow(
+                content_source,
+                snapshot=snapshot,
+                gate_findings=decision.describe()
+            )
+            
+            if crew and read_task and guidelines:
+                # Guidelines are compiled into the task descriptions; passing
+                # them as inputs would also run str.format over the JSON
+                # braces in the expected outputs
+                with timed_crew(crew, "content_approval"):
+                    result = crew.kickoff()
+                
+                return {
+                    "status": "guidelines_reviewed",
+                    "result": result,
+                    "content_snapshot": snapshot.to_dict() if snapshot else None,
+                    "message": "Guidelines have been reviewed and understood",
+                    "next_step": "content_validation"
+                }
+            else:
+                return {
+                    "status": "error",
+                    "message": "Failed to prepare podcast production flow"
+                }
             
     except Exception as e:
         print(f"Error in content approval: {str(e)}")
+        if raise_errors:
+            raise
         return {
             "status": "error",
             "error_message": str(e),
             "error_type": type(e).__name__
         }
 
+def run_content_approval_job(content_source: str) -> dict:
+    """
+    Job entry point for queued content approvals
+
+    Runs the approval crew and converts the crew output to a string so the
+    job result can be returned as JSON. Failures are raised so the job
+    queue marks the job failed and reports the error.
+    """
+    approval_result = create_content_approval_crew(content_source, raise_errors=True)
+    if approval_result.get("status") == "error":
+        raise RuntimeError(approval_result.get("message", "Content approval failed"))
+    if "result" in approval_result and not isinstance(approval_result["result"], dict):
+        approval_result["result"] = str(approval_result["result"])
+    return approval_result
+
 app = Flask(__name__)
 
+job_queue = JobQueue(
+    max_workers=settings.content_approval_max_workers,
+    max_pending=settings.content_approval_max_pending,
+    result_ttl=settings.job_result_ttl_seconds
+)
+
 def require_api_key(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -108,20 +185,26 @@ def initiate_content_approval():
                 'error': 'Missing required data'
             }), 400
 
-        # Initialize content approval team
-        approval_team = ContentApprovalTeam(verbose=True)
-        
-        # Start the approval workflow
-        result = approval_team.start_podcast_production_flow(
-            content_source=gist_data['link']  # or other relevant field
+        # Queue the approval workflow; the crew runs on the job queue workers
+        job = job_queue.submit(
+            run_content_approval_job,
+            gist_data['link'],  # or other relevant field
+            name="content_approval",
+            metadata={'userId': user_id, 'gistId': gist_id}
         )
 
         return jsonify({
             'success': True,
-            'message': 'Content approval workflow initiated',
-            'data': result
-        })
+            'message': 'Content approval workflow queued',
+            'jobId': job.job_id,
+            'status': job.status
+        }), 202
 
+    except JobQueueFullError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 503
     except Exception as e:
         print(f"Error in content approval: {str(e)}")
         return jsonify({
@@ -129,8 +212,130 @@ def initiate_content_approval():
             'error': str(e)
         }), 500
 
+@app.route('/api/content/approve/batch', methods=['POST'])
+@require_api_key
+def initiate_batch_content_approval():
+    """
+    Queue approvals for many gists in one request
+
+    Body: ``{"items": [{userId, gistId, gistData}, ...], "wait": false, "timeout": 30}``.
+    Items with the same link share one job. With ``wait`` the request
+    blocks up to ``timeout`` seconds (capped at CONTENT_APPROVAL_BATCH_WAIT)
+    and finished results are returned inline; unfinished items keep their
+    jobId for polling.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'success': False, 'error': 'No JSON data received'}), 400
+
+        items = data.get('items')
+        if not isinstance(items, list) or not items:
+            return jsonify({'success': False, 'error': 'items must be a non-empty list'}), 400
+        if len(items) > settings.content_approval_max_batch:
+            return jsonify({
+                'success': False,
+                'error': f'Batch too large ({len(items)} items, limit {settings.content_approval_max_batch})'
+            }), 413
+        try:
+            wait_timeout = parse_wait_timeout(data, settings.content_approval_batch_wait)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        plan = plan_batch(items)
+
+        # One job per unique link, queued all or nothing
+        keys = list(plan.groups)
+        jobs = job_queue.submit_many(
+            run_content_approval_job,
+            [(plan.links[key],) for key in keys],
+            name="content_approval",
+            metadata=[
+                {
+                    'gists': [
+                        {'userId': plan.items[i].get('userId'), 'gistId': plan.items[i].get('gistId')}
+                        for i in plan.groups[key]
+                    ]
+                }
+                for key in keys
+            ]
+        )
+
+        finished = True
+        if wait_timeout is not None:
+            finished = job_queue.wait(jobs, timeout=wait_timeout)
+
+        results = [None] * len(items)
+        for index, error in plan.errors.items():
+            results[index] = {
+                'index': index,
+                'gistId': plan.items[index].get('gistId'),
+                'status': 'invalid',
+                'error': error
+            }
+        for key, job in zip(keys, jobs):
+            first = plan.groups[key][0]
+            for index in plan.groups[key]:
+                entry = {
+                    'index': index,
+                    'gistId': plan.items[index].get('gistId'),
+                    'jobId': job.job_id,
+                    'status': job.status
+                }
+                if index != first:
+                    entry['duplicateOf'] = first
+                if wait_timeout is not None and job.is_finished:
+                    entry['result'] = job.result
+                    entry['error'] = job.error
+                results[index] = entry
+
+        return jsonify({
+            'success': True,
+            'message': f'{len(jobs)} content approval jobs queued',
+            'data': {
+                'items': results,
+                'jobs': len(jobs),
+                'duplicates': plan.duplicates,
+                'invalid': len(plan.errors)
+            }
+        }), 200 if wait_timeout is not None and finished else 202
+
+    except JobQueueFullError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 503
+    except Exception as e:
+        print(f"Error in batch content approval: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/content/jobs/<job_id>', methods=['GET'])
+@require_api_key
+def get_content_job(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': f'Job {job_id} not found'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'data': job.to_dict()
+    })
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Tool, task and crew latency, token, byte and cache counters for Prometheus"""
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
 if __name__ == "__main__":
     check_environment()
+    get_approval_team_pool().warm()
+    preload_tools_from_env()
     
     # Normal flow
     content_source = "https://example.com/article"
@@ -253,64 +458,6 @@ Original implementation below - currently being refactored
 #     )
 #     return gista_crew.kickoff(inputs={"content_source": content_source})
 #
-# def create_gista_pipeline(content_source):
-#     """Create and run a pipeline of crews for podcast generation"""
-#     gista_agents = create_gista_agents()
-#     
-#     content_assessment_crew = Crew(
-#         agents=[agent for agent in gista_agents["content_assessment"].values()],
-#         tasks=create_all_gista_tasks(gista_agents)[:9],
-#         verbose=VERBOSE_OUTPUT,
-#         memory=True
-#     )
-#     
-#     script_crew = Crew(
-#         agents=[agent for agent in gista_agents["script_production"].values()],
-#         tasks=create_script_production_tasks(gista_agents["script_production"]),
-#         verbose=VERBOSE_OUTPUT,
-#         memory=True
-#     )
-#     
-#     voice_crew = Crew(
-#         agents=[agent for agent in gista_agents["voice_generation"].values()],
-#         tasks=create_voice_generation_tasks(
-#             voice_agents=gista_agents["voice_generation"],
-#             script_agents=gista_agents["script_production"]
-#         ),
-#         verbose=VERBOSE_OUTPUT,
-#         memory=True
-#     )
-#     
-#     try:
-#         content_result = content_assessment_crew.kickoff(
-#             inputs={"content_source": content_source}
-#         )
-#         
-#         if isinstance(content_result, dict) and content_result.get("content_status") == "CLEARED":
-#             script_result = script_crew.kickoff(
-#                 inputs={"content_analysis": content_result}
-#             )
-#             
-#             voice_result = voice_crew.kickoff(
-#                 inputs={"script_data": script_result}
-#             )
-#             
-#             return {
-#                 "status": "completed",
-#                 "content_analysis": content_result,
-#                 "script_generation": script_result,
-#                 "voice_generation": voice_result
-#             }
-#         else:
-#             return {
-#                 "status": "content_rejected",
-#                 "details": content_result
-#             }
-#             
-#     except Exception as e:
-#         print(f"Error in pipeline: {str(e)}")
-#         raise
-#
 # if __name__ == "__main__":
 #     check_environment()
 #     
@@ -342,8 +489,8 @@ Original implementation below - currently being refactored
 #     podcast_result = create_gista_crew(content_source)
 #     print("Podcast Generation Result:", podcast_result)
 #     
-#     # Or using pipeline of crews
-#     pipeline_result = create_gista_pipeline(content_source)
+#     # Or using the resumable pipeline (gista_pipeline.run_gista_pipeline)
+#     pipeline_result = run_gista_pipeline("gist-123", content_source)
 #     print("Pipeline Generation Result:", pipeline_result)
 #
 #     # Example usage for content approval
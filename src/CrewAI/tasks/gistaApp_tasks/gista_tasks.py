@@ -30,6 +30,7 @@ Gista App Tasks Module - Workflow Sequence
 
 from crewai import Task
 from CrewAI.tools.gista_tools.gista_general_tools import GistaToolbox
+from CrewAI.agents.gistaApp_agents.content_approval_team.content_approval_tools import ContentSnapshotTool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
@@ -83,11 +84,19 @@ class AudioOutput(BaseModel):
     quality_metrics: Dict
 
 # 1. Content Assessment Tasks
-def create_user_content_validation_tasks(agents):
-    """Initial content validation and user response tasks"""
+def create_user_content_validation_tasks(agents, snapshot=None):
+    """
+    Initial content validation and user response tasks
+    
+    Args:
+        agents: Content assessment agents
+        snapshot: Optional ContentSnapshot; replaces the web scraper so the
+            source is not downloaded again
+    """
     print(f"\nCreating validation tasks with agents keys: {list(agents.keys())}")
     
     gista_tools = GistaToolbox()
+    web_reader = ContentSnapshotTool(snapshot=snapshot) if snapshot is not None else gista_tools.web_scraper
     
     prepare_content = Task(
         description=(
@@ -95,9 +104,7 @@ def create_user_content_validation_tasks(agents):
             "1. Access the provided URL/file\n"
             "2. Extract text content based on source type:\n"
                 "- Web pages (using web_scraper)\n"
-                "- PDF documents (using pdf_reader)\n"
-                "- Word documents (using docx_reader)\n"
-                "- CSV files (using csv_reader)\n"
+                "- PDF, Word, CSV and text files (using file_reader)\n"
                 "- Local directories (using directory_reader)\n"
             "3. Structure the output data\n"
             "4. Set content_status based on validation rules\n"
@@ -114,10 +121,8 @@ def create_user_content_validation_tasks(agents):
         ),
         agent=agents["content_validator"],
         tools=[
-            gista_tools.web_scraper,
-            gista_tools.pdf_reader,
-            gista_tools.docx_reader,
-            gista_tools.csv_reader,
+            web_reader,
+            gista_tools.file_reader,
             gista_tools.directory_reader
         ],
         output_pydantic=ContentValidationOutput,
@@ -174,11 +179,20 @@ def create_user_content_validation_tasks(agents):
     
     return [prepare_content, approve_content, reject_content]
 
-def create_user_content_research_tasks(agents, validation_tasks):
-    """Research preparation and initial analysis tasks"""
+def create_user_content_research_tasks(agents, validation_tasks, snapshot=None):
+    """
+    Research preparation and initial analysis tasks
+    
+    Args:
+        agents: Content assessment agents
+        validation_tasks: Tasks from create_user_content_validation_tasks
+        snapshot: Optional ContentSnapshot of the source content; when given,
+            every research task reads it instead of re-scraping the URL
+    """
     print(f"\nCreating research tasks with agents keys: {list(agents.keys())}")
     
     gista_tools = GistaToolbox()
+    snapshot_tools = [ContentSnapshotTool(snapshot=snapshot)] if snapshot is not None else []
     prepare_content = validation_tasks[0]
     approve_content = validation_tasks[1]
     
@@ -211,7 +225,7 @@ def create_user_content_research_tasks(agents, validation_tasks):
             gista_tools.web_search,
             gista_tools.wikipedia,
             gista_tools.dictionary
-        ],
+        ] + snapshot_tools,
         context=[prepare_content, approve_content],
         output_pydantic=ContentValidationOutput,
         callback=task_completed_callback
@@ -237,7 +251,7 @@ def create_user_content_research_tasks(agents, validation_tasks):
             gista_tools.web_search,
             gista_tools.wikipedia,
             gista_tools.dictionary
-        ],
+        ] + snapshot_tools,
         context=[start_production_pipeline],
         output_pydantic=ContentAnalysisOutput
     )
@@ -262,7 +276,7 @@ def create_user_content_research_tasks(agents, validation_tasks):
             gista_tools.web_search,
             gista_tools.dictionary,
             gista_tools.wikipedia
-        ],
+        ] + snapshot_tools,
         context=[content_analysis],
         output_pydantic=TerminologyAnalysisOutput
     )
@@ -287,7 +301,7 @@ def create_user_content_research_tasks(agents, validation_tasks):
             gista_tools.web_search,
             gista_tools.wikipedia,
             gista_tools.dictionary
-        ],
+        ] + snapshot_tools,
         context=[content_analysis],
         output_pydantic=ContentValidationOutput
     )
@@ -316,7 +330,7 @@ def create_user_content_research_tasks(agents, validation_tasks):
             gista_tools.web_search,
             gista_tools.dictionary,
             gista_tools.wikipedia
-        ],
+        ] + snapshot_tools,
         context=[content_analysis, terminology_analysis, background_research],
         output_pydantic=ContentValidationOutput
     )
@@ -507,12 +521,7 @@ def create_voice_generation_tasks(voice_agents, script_agents):
         expected_output="Audio files for readout segments",
         agent=voice_agents["segment_voice_alpha"],
         tools=[gista_tools.voiceover],
-        context=[{
-            "description": "Parse script output for readout segment",
-            "expected_output": "Readout segment bundle",
-            "depends_on": parse_script,
-            "segment_bundle": "readout_bundle"
-        }],
+        context=[parse_script],
         output_pydantic=ContentValidationOutput
     )
 
@@ -527,12 +536,7 @@ def create_voice_generation_tasks(voice_agents, script_agents):
         expected_output="Audio files for Q&A segments 1-3",
         agent=voice_agents["segment_voice_alpha"],
         tools=[gista_tools.voiceover],
-        context=[{
-            "description": "Parse script output for early Q&A segments",
-            "expected_output": "Early Q&A segment bundle",
-            "depends_on": parse_script,
-            "segment_bundle": "qa_early_bundle"
-        }],
+        context=[parse_script],
         output_pydantic=ContentValidationOutput
     )
 
@@ -547,12 +551,7 @@ def create_voice_generation_tasks(voice_agents, script_agents):
         expected_output="Audio files for Q&A segments 4-6",
         agent=voice_agents["segment_voice_beta"],
         tools=[gista_tools.voiceover],
-        context=[{
-            "description": "Parse script output for middle Q&A segments",
-            "expected_output": "Middle Q&A segment bundle",
-            "depends_on": parse_script,
-            "segment_bundle": "qa_middle_bundle"
-        }],
+        context=[parse_script],
         output_pydantic=ContentValidationOutput
     )
 
@@ -567,12 +566,7 @@ def create_voice_generation_tasks(voice_agents, script_agents):
         expected_output="Audio files for Q&A segments 7-10",
         agent=voice_agents["segment_voice_gamma"],
         tools=[gista_tools.voiceover],
-        context=[{
-            "description": "Parse script output for late Q&A segments",
-            "expected_output": "Late Q&A segment bundle",
-            "depends_on": parse_script,
-            "segment_bundle": "qa_late_bundle"
-        }],
+        context=[parse_script],
         output_pydantic=ContentValidationOutput
     )
     
@@ -587,14 +581,9 @@ def create_voice_generation_tasks(voice_agents, script_agents):
         expected_output="Complete transcript document",
         agent=script_agents["transcript_generator"],
         tools=[gista_tools.transcription],
-        context=[{
-            "description": "Process all audio segments in order",
-            "expected_output": "Combined transcript from all segments",
-            "depends_on": [parse_script, readout_production, 
-                          qa_production_early, qa_production_middle, 
-                          qa_production_late],
-            "segment_order": "index"
-        }],
+        context=[parse_script, readout_production,
+                 qa_production_early, qa_production_middle,
+                 qa_production_late],
         output_pydantic=ContentValidationOutput
     )
     
@@ -607,20 +596,22 @@ def create_voice_generation_tasks(voice_agents, script_agents):
         generate_transcript
     ]
 
-def create_all_gista_tasks(agents):
+def create_all_gista_tasks(agents, snapshot=None):
     """
     Create and return all tasks in workflow order:
     1. Content Assessment → 2. Analysis → 3. Script → 4. Voice
     
     Args:
         agents: The complete agents dictionary from create_gista_agents()
+        snapshot: Optional ContentSnapshot shared by the assessment and
+            research tasks
     """
     print(f"\nCreating all tasks with main agents keys: {list(agents.keys())}")
     
-    validation_tasks = create_user_content_validation_tasks(agents["content_assessment"])
+    validation_tasks = create_user_content_validation_tasks(agents["content_assessment"], snapshot)
     print(f"✓ Validation tasks created: {len(validation_tasks)} tasks")
     
-    research_tasks = create_user_content_research_tasks(agents["content_assessment"], validation_tasks)
+    research_tasks = create_user_content_research_tasks(agents["content_assessment"], validation_tasks, snapshot)
     print(f"✓ Research tasks created: {len(research_tasks)} tasks")
     
     script_tasks = create_script_production_tasks(agents["script_production"])
@@ -0,0 +1,97 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.gista_tools.audio_assembly import assemble_episode, split_on_pauses
+from CrewAI.tools.gista_tools.mp3_frames import mp3_duration, parse_frame_header, silent_frame
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, joint stereo, no CRC
+HEADER_128K = bytes([0xFF, 0xFB, 0x90, 0x44])
+FRAME_SECONDS = 1152 / 44100
+
+class TestSplitOnPauses(unittest.TestCase):
+    def test_pause_markers_become_silence(self):
+        segments = [
+            {"voice_role": "host", "text": "Welcome. // Today we talk // // about AI.", "segment_type": "intro"},
+            {"voice_role": "expert", "text": "Thanks for having me.", "segment_type": "qa"},
+        ]
+        parts = list(split_on_pauses(segments, pause_seconds=0.5))
+
+        self.assertEqual([p["text"] for p in parts], ["Welcome.", "Today we talk", "about AI.", "Thanks for having me."])
+        self.assertEqual([p["pause_after"] for p in parts], [0.5, 1.0, 0.0, 0.0])
+        self.assertEqual([p["segment_index"] for p in parts], [0, 0, 0, 1])
+        self.assertEqual(parts[3]["voice_role"], "expert")
+
+    def test_parts_are_yielded_before_later_segments_are_read(self):
+        read = []
+
+        def segments():
+            for text in ("One. // Two.", "Three."):
+                read.append(text)
+                yield {"voice_role": "host", "text": text, "segment_type": "intro"}
+
+        parts = split_on_pauses(segments())
+        self.assertEqual(next(parts)["text"], "One.")
+        self.assertEqual(read, ["One. // Two."])
+        self.assertEqual([p["text"] for p in parts], ["Two.", "Three."])
+
+class TestAssembleEpisode(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.frame = silent_frame(parse_frame_header(HEADER_128K))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_segment(self, name: str, frames: int, with_tag: bool = False) -> str:
+        path = Path(self.tmp_dir.name) / name
+        tag = b"ID3\x04\x00\x00\x00\x00\x00\x0A" + b"\x00" * 10 if with_tag else b""
+        path.write_bytes(tag + self.frame * frames)
+        return str(path)
+
+    def test_concatenates_frames_and_reports_durations(self):
+        parts = [
+            {"file_path": self.write_segment("a.mp3", 10, with_tag=True), "segment_index": 0},
+            {"file_path": self.write_segment("b.mp3", 5), "segment_index": 1},
+        ]
+        output = os.path.join(self.tmp_dir.name, "episode.mp3")
+        result = assemble_episode(parts, output)
+
+        self.assertEqual(os.path.getsize(output), 15 * len(self.frame))
+        self.assertEqual(result["size_bytes"], 15 * len(self.frame))
+        self.assertAlmostEqual(result["playback_duration"], 15 * FRAME_SECONDS)
+        self.assertAlmostEqual(mp3_duration(output), result["playback_duration"])
+        self.assertAlmostEqual(result["segments"][1]["offset_seconds"], 10 * FRAME_SECONDS)
+        self.assertAlmostEqual(result["segments"][1]["playback_duration"], 5 * FRAME_SECONDS)
+
+    def test_pause_adds_silence_to_segment(self):
+        silence_frames = round(0.5 / FRAME_SECONDS)
+        parts = [
+            {"file_path": self.write_segment("a.mp3", 4), "segment_index": 0, "pause_after": 0.5},
+            {"file_path": self.write_segment("b.mp3", 4), "segment_index": 0},
+            {"file_path": self.write_segment("c.mp3", 4), "segment_index": 1},
+        ]
+        result = assemble_episode(parts, os.path.join(self.tmp_dir.name, "episode.mp3"))
+
+        self.assertEqual(len(result["segments"]), 2)
+        self.assertAlmostEqual(result["segments"][0]["playback_duration"], (8 + silence_frames) * FRAME_SECONDS)
+        self.assertAlmostEqual(result["segments"][1]["offset_seconds"], (8 + silence_frames) * FRAME_SECONDS)
+
+    def test_failed_assembly_leaves_no_output(self):
+        parts = [
+            {"file_path": self.write_segment("a.mp3", 4)},
+            {"file_path": os.path.join(self.tmp_dir.name, "missing.mp3")},
+        ]
+        output = os.path.join(self.tmp_dir.name, "episode.mp3")
+
+        with self.assertRaises(FileNotFoundError):
+            assemble_episode(parts, output)
+        self.assertFalse(os.path.exists(output))
+        self.assertEqual(list(Path(self.tmp_dir.name).glob("*.part")), [])
+
+if __name__ == '__main__':
+    unittest.main()
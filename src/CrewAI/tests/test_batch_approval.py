@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils.batch_approval import normalize_link, parse_wait_timeout, plan_batch
+
+def item(gist_id, link, user_id="user-1"):
+    return {"userId": user_id, "gistId": gist_id, "gistData": {"link": link}}
+
+class TestBatchApproval(unittest.TestCase):
+    def test_duplicate_links_share_a_group(self):
+        plan = plan_batch([
+            item("g1", "https://news.site/a?utm_source=x"),
+            item("g2", "https://news.site/b"),
+            item("g3", "HTTPS://News.site/a/"),
+        ])
+        self.assertEqual(list(plan.groups.values()), [[0, 2], [1]])
+        self.assertEqual(plan.duplicates, 1)
+        # The job gets the link as first submitted
+        self.assertEqual(plan.links[normalize_link("https://news.site/a")], "https://news.site/a?utm_source=x")
+
+    def test_invalid_items_are_reported_per_index(self):
+        plan = plan_batch([
+            item("g1", "https://news.site/a"),
+            {"userId": "user-1", "gistId": "g2"},
+            item("g3", "   "),
+            "not an item",
+        ])
+        self.assertEqual(plan.errors, {
+            1: "Missing required data",
+            2: "Missing gistData.link",
+            3: "Item must be an object",
+        })
+        self.assertEqual(list(plan.groups.values()), [[0]])
+
+    def test_non_url_sources_are_kept_as_is(self):
+        self.assertEqual(normalize_link(" docs/report.pdf "), "docs/report.pdf")
+
+    def test_wait_timeout_is_validated_and_capped(self):
+        self.assertIsNone(parse_wait_timeout({}, max_wait=30))
+        self.assertIsNone(parse_wait_timeout({"wait": False, "timeout": 5}, max_wait=30))
+        self.assertEqual(parse_wait_timeout({"wait": True}, max_wait=30), 30.0)
+        self.assertEqual(parse_wait_timeout({"wait": True, "timeout": 5}, max_wait=30), 5.0)
+        self.assertEqual(parse_wait_timeout({"wait": True, "timeout": 120}, max_wait=30), 30.0)
+
+        for bad in ({"wait": True, "timeout": "soon"}, {"wait": True, "timeout": -1},
+                    {"wait": True, "timeout": float("nan")}, {"wait": True, "timeout": True},
+                    {"wait": "yes"}, {"timeout": "soon"}):
+            with self.assertRaises(ValueError, msg=bad):
+                parse_wait_timeout(bad, max_wait=30)
+
+if __name__ == '__main__':
+    unittest.main()
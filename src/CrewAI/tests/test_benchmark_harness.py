@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.benchmarks.harness import (
+    compare_results,
+    load_results,
+    percentile,
+    run_benchmark,
+    write_results,
+)
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_percentile_interpolates(self):
+        values = [10, 20, 30, 40, 50]
+        self.assertEqual(percentile(values, 50), 30)
+        self.assertEqual(percentile(values, 95), 48)
+        self.assertEqual(percentile([7], 95), 7)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_run_benchmark_counts_errors_and_skips_warmup(self):
+        """Warmup calls are not timed and failing calls count as errors"""
+        calls = []
+
+        def fn(iteration):
+            calls.append(iteration)
+            if iteration == 3:
+                raise ValueError("boom")
+
+        result = run_benchmark("demo", fn, iterations=5, warmup=2)
+        summary = result.summary()
+
+        self.assertEqual(calls[:2], [-1, -2])
+        self.assertEqual(summary["iterations"], 5)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["error_samples"], ["ValueError: boom"])
+        self.assertEqual(len(result.latencies), 4)
+
+    def test_concurrent_runs_overlap(self):
+        """With concurrency, waiting calls overlap and throughput rises"""
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def fn(iteration):
+            with lock:
+                active.append(iteration)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(iteration)
+
+        result = run_benchmark("sleep", fn, iterations=8, concurrency=4, warmup=0)
+
+        self.assertEqual(peak[0], 4)
+        self.assertLess(result.wall_seconds, 8 * 0.05)
+        self.assertGreater(result.summary()["throughput_per_second"], 1 / 0.05)
+
+    def test_write_and_compare_results(self):
+        """Latency growth past the tolerance and new errors are regressions"""
+        fast = run_benchmark("op", lambda i: None, iterations=3, warmup=0)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "results", "bench.json")
+            write_results(path, [fast], settings={"iterations": 3})
+            baseline = load_results(path)
+
+        self.assertIn("op", baseline["benchmarks"])
+        self.assertEqual(baseline["settings"], {"iterations": 3})
+
+        baseline["benchmarks"]["op"]["p95_ms"] = 10.0
+        current = {"benchmarks": {"op": dict(baseline["benchmarks"]["op"], p95_ms=11.0)}}
+        self.assertEqual(compare_results(baseline, current, tolerance=0.2), [])
+
+        current["benchmarks"]["op"]["p95_ms"] = 20.0
+        current["benchmarks"]["op"]["errors"] = 1
+        fields = {r["field"] for r in compare_results(baseline, current, tolerance=0.2)}
+        self.assertEqual(fields, {"errors", "p95_ms"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils.checkpoint_store import CheckpointStore
+
+STAGES = ("content_assessment", "script_production", "voice_generation")
+
+class TestCheckpointStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "checkpoints.sqlite3")
+        self.store = CheckpointStore(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_resume_point_follows_saved_stages(self):
+        self.assertEqual(self.store.first_incomplete("gist-1", STAGES), "content_assessment")
+
+        self.store.save("gist-1", "content_assessment", {"content_status": "CLEARED"})
+        self.store.save("gist-1", "script_production", "[Host Voice]\nHello")
+        self.assertEqual(self.store.first_incomplete("gist-1", STAGES), "voice_generation")
+        # Other gists are unaffected
+        self.assertEqual(self.store.first_incomplete("gist-2", STAGES), "content_assessment")
+
+    def test_outputs_survive_reopening(self):
+        self.store.save("gist-1", "content_assessment", {"content_status": "CLEARED", "score": 0.9})
+        reopened = CheckpointStore(self.path)
+        self.assertEqual(reopened.load("gist-1", "content_assessment"), {"content_status": "CLEARED", "score": 0.9})
+        self.assertIsNone(reopened.load("gist-1", "script_production"))
+
+    def test_items_do_not_complete_the_stage(self):
+        self.store.save("gist-1", "voice_generation", {"file_path": "a.mp3"}, item="part-000")
+        self.store.save("gist-1", "voice_generation", {"file_path": "b.mp3"}, item="part-001")
+
+        self.assertFalse(self.store.is_complete("gist-1", "voice_generation"))
+        self.assertTrue(self.store.is_complete("gist-1", "voice_generation", item="part-001"))
+        self.assertEqual(
+            self.store.items("gist-1", "voice_generation"),
+            {"part-000": {"file_path": "a.mp3"}, "part-001": {"file_path": "b.mp3"}}
+        )
+
+        self.store.save("gist-1", "voice_generation", {"episode": "episode.mp3"})
+        self.assertEqual(len(self.store.items("gist-1", "voice_generation")), 2)
+
+    def test_non_json_outputs_are_stored_as_text(self):
+        class CrewResult:
+            def __str__(self):
+                return "final answer"
+
+        self.store.save("gist-1", "script_production", CrewResult())
+        self.assertEqual(self.store.load("gist-1", "script_production"), "final answer")
+
+    def test_clear(self):
+        self.store.save("gist-1", "content_assessment", "ok")
+        self.store.save("gist-1", "script_production", "script")
+        self.store.clear("gist-1", "script_production")
+        self.assertEqual(self.store.first_incomplete("gist-1", STAGES), "script_production")
+        self.store.clear("gist-1")
+        self.assertIsNone(self.store.load("gist-1", "content_assessment"))
+
+if __name__ == '__main__':
+    unittest.main()
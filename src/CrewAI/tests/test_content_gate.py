@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.agents.gistaApp_agents.content_approval_team.content_gate import ContentGate
+from CrewAI.agents.gistaApp_agents.content_approval_team.content_snapshot import ContentSnapshot
+from CrewAI.agents.gistaApp_agents.content_approval_team.guidelines_registry import GuidelinesRegistry
+
+def words(count: int) -> str:
+    return " ".join(["quantum"] * count)
+
+def snapshot(source="https://news.site/article", status=200, text=words(1200), **kwargs) -> ContentSnapshot:
+    kwargs.setdefault("content_type", "text/html")
+    kwargs.setdefault("title", "Quantum Computing Basics")
+    return ContentSnapshot(source=source, status_code=status, text=text, **kwargs)
+
+class TestContentGate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Rules come from the real guidelines file
+        cls.gate = ContentGate(GuidelinesRegistry().get_guidelines())
+
+    def assertDecision(self, snap, decision, code=None):
+        result = self.gate.evaluate(snap)
+        self.assertEqual(result.decision, decision, result.to_dict())
+        self.assertEqual(result.code, code)
+        return result
+
+    def test_accessibility_rejections(self):
+        self.assertDecision(snapshot(status=404), "rejected", "ACC001")
+        self.assertDecision(snapshot(status=403), "rejected", "ACC002")
+        self.assertDecision(snapshot(status=451), "rejected", "ACC003")
+        self.assertDecision(ContentSnapshot("https://bad url", error="InvalidURL: Invalid URL"), "rejected", "ACC001")
+        self.assertDecision(ContentSnapshot("https://old.site", error="SSLError: certificate expired"), "rejected", "SEC003")
+        self.assertDecision(snapshot(source="https://bit.ly/abc"), "rejected", "ACC001")
+
+    def test_transient_failures_are_escalated(self):
+        for status in (429, 500, 502, 503, 504):
+            result = self.assertDecision(snapshot(status=status), "escalate")
+            self.assertFalse(result.is_final)
+            self.assertIn(f"HTTP {status}", result.describe())
+        for error in ("ConnectionError: DNS failure", "ReadTimeout: timed out",
+                      "ConnectTimeout: timed out", "ChunkedEncodingError: connection reset"):
+            result = self.assertDecision(ContentSnapshot("https://slow.site", error=error), "escalate")
+            self.assertIn(error, result.describe())
+
+    def test_length_rules(self):
+        result = self.assertDecision(snapshot(text=words(120)), "rejected", "CON001")
+        self.assertEqual(result.to_dict()["message"], "CON001: Content too short - Below minimum length")
+        result = self.assertDecision(snapshot(text=words(16000)), "escalate")
+        self.assertIn("16000 words exceeds maximum of 15000", result.describe())
+        self.assertDecision(snapshot(text="Subscribe to continue reading. " + words(50)), "rejected", "ACC002")
+
+    def test_placeholder_page_reports_length_first(self):
+        """example.com is short, so it is rejected as CON001 rather than CON004"""
+        self.assertDecision(snapshot(source="https://example.com", text=words(30)), "rejected", "CON001")
+        self.assertDecision(snapshot(source="https://example.com", text=words(500)), "rejected", "CON004")
+
+    def test_unsupported_content_type(self):
+        self.assertDecision(snapshot(content_type="image/png", text=""), "rejected", "CON002")
+
+    def test_clear_approvals(self):
+        result = self.assertDecision(
+            snapshot(text=words(1500), author="Dr. Sarah Chen", published_date="2024-03-01"),
+            "approved", "ACC200"
+        )
+        self.assertEqual(result.to_dict()["production_state"], "in_production")
+        self.assertDecision(snapshot(text=words(400)), "approved", "ACC201")
+
+    def test_ambiguous_content_is_escalated(self):
+        redirected = snapshot(
+            final_url="https://other.site/landing",
+            redirect_chain=[{"url": "https://news.site/article", "status_code": 302}]
+        )
+        result = self.assertDecision(redirected, "escalate")
+        self.assertFalse(result.is_final)
+        self.assertIn("other.site", result.describe())
+
+        self.assertDecision(snapshot(title=None), "escalate")
+        self.assertDecision(snapshot(content_type="application/pdf", text=""), "escalate")
+        self.assertDecision(ContentSnapshot("/tmp/doc.pdf", error="unsupported source: only http(s) URLs can be fetched"), "escalate")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.agents.gistaApp_agents.content_approval_team.content_snapshot import (
+    ContentSnapshot,
+    SnapshotStore,
+    fetch_snapshot,
+    parse_html,
+    detect_encoding,
+    snapshot_from_response,
+)
+
+ARTICLE_HTML = """
+<html><head>
+  <title>Fallback Title</title>
+  <meta property="og:title" content="Introduction to Quantum Computing">
+  <meta name="author" content="Dr. Sarah Chen">
+  <meta property="article:published_time" content="2024-03-01T09:00:00Z">
+  <script>var tracking = "not content";</script>
+  <style>p { color: red; }</style>
+</head><body>
+  <h1>Quantum   Computing</h1>
+  <p>Qubits can exist in   superposition.</p>
+  <p>Entanglement links &amp; correlates qubits.</p>
+</body></html>
+"""
+
+class FakeHop:
+    def __init__(self, url, status_code):
+        self.url = url
+        self.status_code = status_code
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response"""
+    def __init__(self, body: bytes, content_type: str = "text/html; charset=utf-8"):
+        self.url = "https://example.org/articles/quantum"
+        self.status_code = 200
+        self.history = [FakeHop("http://example.org/quantum", 301)]
+        self.headers = {"Content-Type": content_type}
+        # requests' guess for text/* responses without a charset
+        self.encoding = "ISO-8859-1" if "charset" not in content_type else content_type.split("charset=")[-1]
+        self._body = body
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+class TestContentSnapshot(unittest.TestCase):
+    def test_parse_html_metadata_and_text(self):
+        parsed = parse_html(ARTICLE_HTML)
+
+        self.assertEqual(parsed["title"], "Introduction to Quantum Computing")
+        self.assertEqual(parsed["author"], "Dr. Sarah Chen")
+        self.assertEqual(parsed["published_date"], "2024-03-01T09:00:00Z")
+        self.assertEqual(
+            parsed["text"],
+            "Quantum Computing\nQubits can exist in superposition.\nEntanglement links & correlates qubits."
+        )
+
+    def test_snapshot_from_response(self):
+        snapshot = snapshot_from_response("http://example.org/quantum", FakeResponse(ARTICLE_HTML.encode()))
+
+        self.assertTrue(snapshot.ok)
+        self.assertEqual(snapshot.final_url, "https://example.org/articles/quantum")
+        self.assertEqual(snapshot.redirect_chain, [{"url": "http://example.org/quantum", "status_code": 301}])
+        self.assertEqual(snapshot.content_type, "text/html")
+        self.assertEqual(snapshot.word_count, 11)
+        self.assertIn("Word count: 11", snapshot.describe())
+        self.assertTrue(snapshot.read().endswith("Entanglement links & correlates qubits."))
+
+    def test_charset_less_utf8_page_is_decoded_as_utf8(self):
+        body = "<html><head><title>Café</title></head><body><p>Über naïve résumé</p></body></html>".encode()
+        snapshot = snapshot_from_response("https://example.org/cafe", FakeResponse(body, "text/html"))
+
+        self.assertEqual(snapshot.title, "Café")
+        self.assertEqual(snapshot.text, "Über naïve résumé")
+
+    def test_detect_encoding(self):
+        latin = "<p>café</p>".encode("cp1252")
+        self.assertEqual(detect_encoding("text/html; charset=ISO-8859-1", latin), "iso8859-1")
+        self.assertEqual(detect_encoding("text/html", b'<meta charset="Shift_JIS"><p>x</p>'), "shift_jis")
+        self.assertEqual(detect_encoding("text/html", latin), "cp1252")
+        # Unknown declared charsets fall through instead of raising LookupError
+        self.assertEqual(detect_encoding("text/html; charset=x-unknown", "é".encode()), "utf-8")
+        # A body cut inside a multi-byte character is still UTF-8
+        self.assertEqual(detect_encoding("text/plain", "naïve".encode()[:3]), "utf-8")
+
+    def test_non_html_content_has_no_text(self):
+        snapshot = snapshot_from_response("https://example.org/a.pdf", FakeResponse(b"%PDF-1.7", "application/pdf"))
+        self.assertEqual(snapshot.text, "")
+        self.assertEqual(snapshot.word_count, 0)
+
+    def test_unsupported_source_is_recorded(self):
+        snapshot = fetch_snapshot("/tmp/article.pdf")
+        self.assertFalse(snapshot.ok)
+        self.assertIn("unsupported source", snapshot.error)
+
+    def test_store_fetches_each_source_once(self):
+        calls = []
+        gate = threading.Event()
+
+        def fetcher(source):
+            calls.append(source)
+            gate.wait(1)
+            return ContentSnapshot(source=source, status_code=200, text="hello world")
+
+        store = SnapshotStore(fetcher=fetcher)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.get_or_fetch("https://example.org")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, ["https://example.org"])
+        self.assertTrue(all(result is results[0] for result in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools import file_ingestion
+from CrewAI.tools.file_ingestion import ExtractionCache, detect_file_type, iter_file_text
+
+DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+    '<w:p><w:r><w:t>First </w:t></w:r><w:r><w:t>paragraph</w:t></w:r></w:p>'
+    '<w:p></w:p>'
+    '<w:p><w:r><w:t>Second</w:t><w:tab/><w:t>paragraph</w:t></w:r></w:p>'
+    '</w:body></w:document>'
+)
+
+
+class TestFileIngestion(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as handle:
+            handle.write(content.encode("utf-8") if isinstance(content, str) else content)
+        return path
+
+    def write_docx(self, name):
+        path = os.path.join(self.tmp.name, name)
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("[Content_Types].xml", "<Types/>")
+            archive.writestr("word/document.xml", DOCUMENT_XML)
+        return path
+
+    def test_type_comes_from_content_not_extension(self):
+        self.assertEqual(detect_file_type(self.write("report.txt", b"%PDF-1.7\n...")), "pdf")
+        self.assertEqual(detect_file_type(self.write_docx("brief.pdf")), "docx")
+        self.assertEqual(detect_file_type(self.write("data.pdf", "name,score\nada,3\nbob,4\n")), "csv")
+        self.assertEqual(detect_file_type(self.write("notes.csv", "Just a note.\nNothing tabular.")), "text")
+
+    def test_unsupported_binaries_are_rejected(self):
+        with self.assertRaises(ValueError):
+            detect_file_type(self.write("image.png", b"\x89PNG\r\n\x1a\n\x00\x00"))
+
+        path = os.path.join(self.tmp.name, "archive.zip")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("readme.txt", "hello")
+        with self.assertRaises(ValueError):
+            detect_file_type(path)
+
+    def test_docx_paragraphs_are_streamed(self):
+        blocks = list(iter_file_text(self.write_docx("brief.docx")))
+        self.assertEqual(blocks, ["First paragraph", "Second\tparagraph"])
+
+    def test_csv_rows_keep_their_columns(self):
+        blocks = list(iter_file_text(self.write("data.csv", "name;score\nada;3\n\nbob;4\n")))
+        self.assertEqual(blocks, ["name: ada; score: 3", "name: bob; score: 4"])
+
+    def test_text_is_split_into_paragraphs(self):
+        blocks = list(iter_file_text(self.write("notes.txt", "one\ntwo\n\n\nthree\n")))
+        self.assertEqual(blocks, ["one\ntwo", "three"])
+
+    def test_same_content_is_extracted_once(self):
+        first = self.write("a.txt", "shared body")
+        second = self.write("b.txt", "shared body")
+        cache = ExtractionCache(max_entries=1)
+
+        with mock.patch.object(file_ingestion, "iter_file_text", wraps=file_ingestion.iter_file_text) as reader:
+            document = cache.extract(first)
+            self.assertIs(cache.extract(second), document)
+            self.assertEqual(reader.call_count, 1)
+
+            cache.extract(self.write("c.txt", "other body"))
+            cache.extract(first)
+            self.assertEqual(reader.call_count, 3)
+
+        self.assertEqual(document.file_type, "text")
+        self.assertEqual(document.text, "shared body")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI import gista_pipeline
+from CrewAI.gista_pipeline import (
+    STAGE_CONTENT_ASSESSMENT,
+    STAGE_SCRIPT_PRODUCTION,
+    STAGE_VOICE_GENERATION,
+    GistaPipeline,
+    render_script,
+)
+from CrewAI.tools.gista_tools.script_stream import ScriptStream
+from CrewAI.utils.checkpoint_store import CheckpointStore
+
+SCRIPT_OUTPUTS = [
+    SimpleNamespace(segment_type="opening", script_content={"host": "Welcome to the show."}),
+    SimpleNamespace(segment_type="readout", script_content={"narrator": "Part one. // Part two."}),
+    SimpleNamespace(segment_type="qa", script_content={"host": "Why?", "expert": "Because."}),
+]
+
+
+class FakeVoiceover:
+    max_concurrency = 2
+
+    def __init__(self, fail_texts=()):
+        self.fail_texts = set(fail_texts)
+        self.calls = []
+
+    def synthesize_to_file(self, text, voice_role, segment_type, output_path):
+        self.calls.append(text)
+        if text in self.fail_texts:
+            return {"error": "quota exceeded"}
+        with open(output_path, "wb") as handle:
+            handle.write(b"audio")
+        return {"file_path": output_path}
+
+
+class StubbedPipeline(GistaPipeline):
+    """GistaPipeline with crews replaced by canned task outputs"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.crews_run = []
+
+    @property
+    def agents(self):
+        return {"content_assessment": {}, "script_production": {}}
+
+    def _content_assessment_tasks(self):
+        return [SimpleNamespace(output=None)]
+
+    def _script_production_tasks(self, content_result):
+        return [SimpleNamespace(output=None) for _ in SCRIPT_OUTPUTS]
+
+    def _run_crew(self, stage, agents, tasks):
+        self.crews_run.append(stage)
+        if stage == STAGE_CONTENT_ASSESSMENT:
+            return '{"content_status": "CLEARED"}'
+        for task, output in zip(tasks, SCRIPT_OUTPUTS):
+            task.output = SimpleNamespace(exported_output=output)
+        # Like a crewai crew, the result is only the last task's output
+        return SCRIPT_OUTPUTS[-1]
+
+
+class TestGistaPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(":memory:")
+        self.voiceover = FakeVoiceover()
+        self.assembled = []
+        patches = [
+            mock.patch.object(gista_pipeline, "validate_settings", lambda: None),
+            mock.patch.object(gista_pipeline, "get_tool", lambda name: self.voiceover),
+            mock.patch.object(gista_pipeline, "assemble_episode", self.assemble),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assemble(self, parts, output_path):
+        self.assembled.append([part["file_path"] for part in parts])
+        return {"file_path": output_path}
+
+    def pipeline(self):
+        return StubbedPipeline("gist-1", "notes.txt", store=self.store, output_dir=self.tmp.name)
+
+    def test_script_covers_every_task_in_order(self):
+        segments = list(ScriptStream(render_script(SCRIPT_OUTPUTS, "Episode", "notes.txt")))
+
+        self.assertEqual(
+            [(s.voice_role, s.text) for s in segments],
+            [("host", "Welcome to the show."), ("narrator", "Part one. // Part two."),
+             ("host", "Why?"), ("expert", "Because.")]
+        )
+
+    def test_full_run_checkpoints_every_stage(self):
+        pipeline = self.pipeline()
+        result = pipeline.run()
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(result["resumed_from"], STAGE_CONTENT_ASSESSMENT)
+        self.assertEqual(pipeline.crews_run, [STAGE_CONTENT_ASSESSMENT, STAGE_SCRIPT_PRODUCTION])
+        self.assertEqual(result[STAGE_VOICE_GENERATION]["parts"], 5)
+        self.assertEqual(len(self.voiceover.calls), 5)
+        self.assertIn("[Expert Voice]", self.store.load("gist-1", STAGE_SCRIPT_PRODUCTION))
+
+    def test_resumes_at_script_production(self):
+        self.store.save("gist-1", STAGE_CONTENT_ASSESSMENT, '{"content_status": "CLEARED"}')
+        pipeline = self.pipeline()
+        result = pipeline.run()
+
+        self.assertEqual(result["resumed_from"], STAGE_SCRIPT_PRODUCTION)
+        self.assertEqual(pipeline.crews_run, [STAGE_SCRIPT_PRODUCTION])
+
+    def test_resumes_at_voice_generation(self):
+        self.pipeline().run()
+        self.store.clear("gist-1", STAGE_VOICE_GENERATION)
+        self.voiceover.calls.clear()
+
+        pipeline = self.pipeline()
+        result = pipeline.run()
+
+        self.assertEqual(result["resumed_from"], STAGE_VOICE_GENERATION)
+        self.assertEqual(pipeline.crews_run, [])
+        self.assertEqual(len(self.voiceover.calls), 5)
+
+    def test_finished_voice_parts_are_not_synthesized_again(self):
+        self.voiceover.fail_texts = {"Part two.", "Because."}
+        failed = self.pipeline().run()
+        self.assertEqual(failed["status"], "error")
+        self.assertEqual(failed["failed_stage"], STAGE_VOICE_GENERATION)
+
+        self.voiceover.fail_texts = set()
+        self.voiceover.calls.clear()
+        result = self.pipeline().run()
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(sorted(self.voiceover.calls), ["Because.", "Part two."])
+        self.assertEqual(result[STAGE_VOICE_GENERATION]["synthesized_parts"], 2)
+        self.assertEqual(len(self.assembled[-1]), 5)
+
+    def test_unparseable_script_checkpoint_is_rebuilt(self):
+        self.store.save("gist-1", STAGE_CONTENT_ASSESSMENT, '{"content_status": "CLEARED"}')
+        self.store.save("gist-1", STAGE_SCRIPT_PRODUCTION, "segment_type='closing' script_content={}")
+        pipeline = self.pipeline()
+        result = pipeline.run()
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(pipeline.crews_run, [STAGE_SCRIPT_PRODUCTION])
+
+    def test_rerun_stage_discards_later_checkpoints(self):
+        self.pipeline().run()
+        self.store.save("gist-1", STAGE_SCRIPT_PRODUCTION, "segment_type='closing' script_content={}")
+        self.voiceover.calls.clear()
+
+        pipeline = self.pipeline()
+        result = pipeline.run()
+
+        self.assertEqual(pipeline.crews_run, [STAGE_SCRIPT_PRODUCTION])
+        self.assertEqual(len(self.voiceover.calls), 5)
+        self.assertEqual(result[STAGE_VOICE_GENERATION]["synthesized_parts"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import warnings
 from typing import Dict, Any
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from tasks.gistaApp_tasks.gista_tasks import (
     create_all_gista_tasks,
@@ -14,7 +15,7 @@ from tasks.gistaApp_tasks.gista_tasks import (
     create_user_content_validation_tasks,
     create_user_content_research_tasks,
 )
-from agents.gistaApp_agents.gista_agents import create_gista_agents
+from CrewAI.agents.gistaApp_agents.gista_agents import create_gista_agents
 from config.settings import validate_settings
 
 def format_markdown(text: str) -> str:
@@ -0,0 +1,65 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.agents.gistaApp_agents.content_approval_team.guidelines_compiler import (
+    GuidelinesCompiler, TASK_READ_GUIDELINES, TASK_DETECT_CONTENT_NATURE, TASK_VALIDATE_CONTENT_QUALITY
+)
+from CrewAI.agents.gistaApp_agents.content_approval_team.guidelines_registry import (
+    DEFAULT_GUIDELINES_PATH, GuidelinesRegistry
+)
+
+class TestGuidelinesCompiler(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.yaml_path = os.path.join(self.tmpdir, "guidelines.yaml")
+        shutil.copy(DEFAULT_GUIDELINES_PATH, self.yaml_path)
+        self.registry = GuidelinesRegistry(self.yaml_path)
+        self.compiler = GuidelinesCompiler(self.registry)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_projections_are_smaller_than_full_prompt(self):
+        report = self.compiler.report()
+        self.assertEqual(set(report["tasks"]), {
+            TASK_READ_GUIDELINES, TASK_DETECT_CONTENT_NATURE, TASK_VALIDATE_CONTENT_QUALITY
+        })
+        self.assertLess(report["total_tokens"], report["full_prompt_tokens"])
+        self.assertGreater(report["saved_tokens"], 0)
+
+    def test_validate_prompt_keeps_codes_and_limits(self):
+        text = self.compiler.compile(TASK_VALIDATE_CONTENT_QUALITY).text
+        self.assertIn("ACC200=", text)
+        self.assertIn("CON001=", text)
+        self.assertIn("Length: 300-15000 words", text)
+        self.assertNotIn("ACC200=", self.compiler.compile(TASK_DETECT_CONTENT_NATURE).text)
+
+    def test_compiled_prompts_are_cached(self):
+        first = self.compiler.compile(TASK_READ_GUIDELINES)
+        self.assertIs(self.compiler.compile(TASK_READ_GUIDELINES), first)
+        self.assertEqual(self.registry.load_count, 1)
+
+    def test_recompiles_when_guidelines_change(self):
+        first = self.compiler.compile(TASK_VALIDATE_CONTENT_QUALITY)
+        with open(self.yaml_path) as f:
+            content = f.read()
+        with open(self.yaml_path, "w") as f:
+            f.write(content.replace("minimum_words: 300", "minimum_words: 400"))
+        self.registry.invalidate()
+
+        second = self.compiler.compile(TASK_VALIDATE_CONTENT_QUALITY)
+        self.assertIsNot(second, first)
+        self.assertNotEqual(second.digest, first.digest)
+        self.assertIn("Length: 400-15000 words", second.text)
+
+    def test_unknown_task(self):
+        with self.assertRaises(KeyError):
+            self.compiler.compile("write_script")
+
+if __name__ == "__main__":
+    unittest.main()
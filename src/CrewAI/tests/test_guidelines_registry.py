@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.agents.gistaApp_agents.content_approval_team.guidelines_registry import (
+    GuidelinesRegistry,
+    get_guidelines_registry,
+)
+
+GUIDELINES_V1 = """
+content_approval_guidelines:
+  criteria:
+    length_requirements:
+      minimum_words: 300
+"""
+
+GUIDELINES_V2 = """
+content_approval_guidelines:
+  criteria:
+    length_requirements:
+      minimum_words: 500
+"""
+
+class TestGuidelinesRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.yaml_path = Path(self.tmp_dir.name) / "guidelines.yaml"
+        self.yaml_path.write_text(GUIDELINES_V1)
+        self.registry = GuidelinesRegistry(self.yaml_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _minimum_words(self):
+        return self.registry.get_guidelines()["criteria"]["length_requirements"]["minimum_words"]
+
+    def test_parses_once(self):
+        """Repeated lookups reuse the parsed guidelines and prompt"""
+        first = self.registry.get()
+        second = self.registry.get()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.load_count, 1)
+        self.assertIn("minimum_words: 300", first.prompt)
+
+    def test_reloads_when_file_changes(self):
+        """A content change on disk is picked up on the next lookup"""
+        self.assertEqual(self._minimum_words(), 300)
+
+        self.yaml_path.write_text(GUIDELINES_V2)
+        stat = os.stat(self.yaml_path)
+        os.utime(self.yaml_path, (stat.st_atime, stat.st_mtime + 5))
+
+        self.assertEqual(self._minimum_words(), 500)
+        self.assertEqual(self.registry.load_count, 2)
+
+    def test_touch_without_change_keeps_parsed_copy(self):
+        """A new mtime with identical content does not re-parse"""
+        entry = self.registry.get()
+        stat = os.stat(self.yaml_path)
+        os.utime(self.yaml_path, (stat.st_atime, stat.st_mtime + 5))
+
+        self.assertIs(self.registry.get(), entry)
+        self.assertEqual(self.registry.load_count, 1)
+
+    def test_missing_section(self):
+        self.yaml_path.write_text("other: {}\n")
+        with self.assertRaises(ValueError):
+            self.registry.get()
+
+    def test_missing_file(self):
+        registry = GuidelinesRegistry(Path(self.tmp_dir.name) / "missing.yaml")
+        with self.assertRaises(FileNotFoundError):
+            registry.get()
+
+    def test_bundled_guidelines(self):
+        """The shared registry loads the bundled approval guidelines"""
+        guidelines = get_guidelines_registry().get_guidelines()
+        self.assertIn("validation_outputs", guidelines)
+        self.assertIs(get_guidelines_registry(), get_guidelines_registry())
+
+if __name__ == '__main__':
+    unittest.main()
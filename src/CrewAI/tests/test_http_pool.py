@@ -0,0 +1,45 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils import http_pool
+
+
+class TestHttpPool(unittest.TestCase):
+    def setUp(self):
+        if importlib.util.find_spec("requests") is None:
+            self.skipTest("requests is not installed")
+
+    def tearDown(self):
+        http_pool.close_http_clients()
+
+    def test_session_pools_connections_per_host(self):
+        session = http_pool.create_http_session(pool_hosts=4, pool_per_host=8, retries=1)
+        adapter = session.get_adapter("https://example.org/")
+
+        self.assertIs(adapter, session.get_adapter("http://example.org/"))
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(adapter.max_retries.connect, 1)
+        self.assertEqual(adapter.max_retries.read, 0)
+
+    def test_shared_session_is_reused_until_closed(self):
+        session = http_pool.get_http_session()
+        self.assertIs(http_pool.get_http_session(), session)
+
+        http_pool.close_http_clients()
+        self.assertIsNot(http_pool.get_http_session(), session)
+
+    def test_session_does_not_keep_cookies(self):
+        from requests.cookies import create_cookie
+
+        session = http_pool.create_http_session()
+        cookie = create_cookie("sid", "1", domain="example.org")
+        self.assertFalse(session.cookies._policy.set_ok(cookie, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
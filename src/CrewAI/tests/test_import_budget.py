@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils.import_budget import ImportReport, check_budget, measure_imports, parse_importtime
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        450 |     json.decoder
+import time:       150 |        900 |   json
+import time:      2000 |       5000 | CrewAI.main
+Traceback noise that is not importtime output
+"""
+
+
+class TestImportBudget(unittest.TestCase):
+    def test_parse_importtime(self):
+        records = parse_importtime(SAMPLE_OUTPUT)
+
+        self.assertEqual([r.name for r in records], ["_io", "json.decoder", "json", "CrewAI.main"])
+        self.assertEqual([r.depth for r in records], [1, 2, 1, 0])
+        self.assertEqual(records[1].self_us, 300)
+        self.assertEqual(records[1].cumulative_us, 450)
+
+    def test_report_totals_and_packages(self):
+        report = ImportReport("CrewAI.main", parse_importtime(SAMPLE_OUTPUT))
+
+        self.assertEqual(report.total_ms, 5.0)
+        self.assertEqual(report.slowest(1)[0].name, "CrewAI.main")
+        self.assertAlmostEqual(report.by_package()["json"], 0.45)
+        self.assertEqual(report.loaded(["json", "crewai"]), ["json"])
+
+    def test_check_budget(self):
+        report = ImportReport("CrewAI.main", parse_importtime(SAMPLE_OUTPUT))
+
+        self.assertEqual(check_budget(report, budget_ms=10, deferred=["crewai"]), [])
+        violations = check_budget(report, budget_ms=1, deferred=["json"])
+        self.assertEqual(len(violations), 2)
+
+    def test_settings_import_does_not_load_dotenv(self):
+        report = measure_imports("CrewAI.config.settings")
+
+        self.assertTrue(any(r.name == "CrewAI.config.settings" for r in report.records))
+        self.assertEqual(report.loaded(["dotenv", "crewai", "langchain"]), [])
+
+    def test_gista_toolbox_import_defers_tool_packages(self):
+        report = measure_imports("CrewAI.tools.gista_tools.gista_general_tools")
+
+        names = {r.name for r in report.records}
+        self.assertIn("CrewAI.tools.gista_tools.gista_general_tools", names)
+        self.assertNotIn("CrewAI.tools.gista_tools.research_tools", names)
+        self.assertNotIn("CrewAI.tools.cached_rag_tools", names)
+        self.assertEqual(report.loaded(["crewai_tools", "embedchain"]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
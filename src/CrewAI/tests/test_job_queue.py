@@ -0,0 +1,107 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils.job_queue import (
+    JobQueue,
+    JobQueueFullError,
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+)
+
+def wait_for(job, timeout=5.0):
+    """Poll a job until it finishes or the timeout expires"""
+    deadline = time.time() + timeout
+    while not job.is_finished and time.time() < deadline:
+        time.sleep(0.01)
+    return job
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = JobQueue(max_workers=1, max_pending=2, result_ttl=60)
+
+    def tearDown(self):
+        self.queue.shutdown(wait=True)
+
+    def test_job_completes_with_result(self):
+        """Submitted work runs in the background and its result is kept"""
+        job = self.queue.submit(lambda x: x * 2, 21, name="double")
+        wait_for(job)
+
+        self.assertEqual(job.status, JOB_DONE)
+        self.assertEqual(job.result, 42)
+        self.assertIs(self.queue.get(job.job_id), job)
+        self.assertEqual(job.to_dict()["jobId"], job.job_id)
+
+    def test_job_failure_is_reported(self):
+        """Exceptions mark the job failed instead of escaping the worker"""
+        def explode():
+            raise ValueError("boom")
+
+        job = wait_for(self.queue.submit(explode))
+
+        self.assertEqual(job.status, JOB_FAILED)
+        self.assertEqual(job.error["error_type"], "ValueError")
+        self.assertEqual(job.error["error_message"], "boom")
+
+    def test_pending_limit_and_states(self):
+        """Work beyond max_pending is rejected while earlier jobs are unfinished"""
+        release = threading.Event()
+        running = self.queue.submit(release.wait)
+        queued = self.queue.submit(lambda: "second")
+
+        deadline = time.time() + 5
+        while running.status != JOB_RUNNING and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(running.status, JOB_RUNNING)
+        self.assertEqual(queued.status, JOB_QUEUED)
+
+        with self.assertRaises(JobQueueFullError):
+            self.queue.submit(lambda: "third")
+
+        release.set()
+        wait_for(queued)
+        self.assertEqual(queued.result, "second")
+        self.assertEqual(self.queue.stats()[JOB_DONE], 2)
+
+    def test_finished_jobs_expire(self):
+        """Finished jobs are pruned once their TTL passes"""
+        queue = JobQueue(max_workers=1, result_ttl=0)
+        try:
+            job = wait_for(queue.submit(lambda: None))
+            time.sleep(0.01)
+            self.assertIsNone(queue.get(job.job_id))
+        finally:
+            queue.shutdown()
+
+    def test_submit_many_is_all_or_nothing(self):
+        """A batch that does not fit is rejected without queueing any of it"""
+        with self.assertRaises(JobQueueFullError):
+            self.queue.submit_many(lambda x: x, [(1,), (2,), (3,)])
+        self.assertEqual(sum(self.queue.stats().values()), 0)
+
+        jobs = self.queue.submit_many(
+            lambda x: x * 10, [(1,), (2,)], name="batch", metadata=[{"n": 1}, {"n": 2}]
+        )
+        self.assertTrue(self.queue.wait(jobs, timeout=5))
+        self.assertEqual([job.result for job in jobs], [10, 20])
+        self.assertEqual(jobs[1].metadata, {"n": 2})
+
+    def test_wait_times_out(self):
+        release = threading.Event()
+        job = self.queue.submit(release.wait)
+        self.assertFalse(self.queue.wait([job], timeout=0.05))
+        release.set()
+        self.assertTrue(job.wait(5))
+
+    def test_unknown_job(self):
+        self.assertIsNone(self.queue.get("missing"))
+
+if __name__ == '__main__':
+    unittest.main()
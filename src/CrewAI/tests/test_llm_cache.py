@@ -0,0 +1,79 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.config.llm_cache import (
+    LLMResponseStore,
+    SQLiteLLMCache,
+    cache_key,
+    temperature_from_llm_string,
+)
+
+CHAT_LLM_STRING = '{"lc": 1, "kwargs": {"model_name": "gpt-4", "temperature": 0.0}}---[(\'stop\', None)]'
+
+class TestLLMCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "llm_cache.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_temperature_parsing(self):
+        self.assertEqual(temperature_from_llm_string(CHAT_LLM_STRING), 0.0)
+        self.assertEqual(temperature_from_llm_string("[('model', 'x'), ('temperature', 0.7)]"), 0.7)
+        self.assertIsNone(temperature_from_llm_string("[('model', 'x')]"))
+
+    def test_only_deterministic_calls_are_cacheable(self):
+        cache = SQLiteLLMCache(LLMResponseStore(":memory:"))
+        self.assertTrue(cache.is_cacheable(CHAT_LLM_STRING))
+        self.assertFalse(cache.is_cacheable(CHAT_LLM_STRING.replace("0.0", "0.7")))
+        self.assertFalse(cache.is_cacheable("[('model', 'x')]"))
+
+        # Skipped calls never reach the store
+        cache.update("prompt", "[('temperature', 0.7)]", [])
+        self.assertEqual(cache.store.stats()["writes"], 0)
+
+        permissive = SQLiteLLMCache(LLMResponseStore(":memory:"), allow_temperature=True)
+        self.assertTrue(permissive.is_cacheable("[('temperature', 0.7)]"))
+
+    def test_key_covers_prompt_and_model(self):
+        key = cache_key("Observation: tool output A", CHAT_LLM_STRING)
+        self.assertNotEqual(key, cache_key("Observation: tool output B", CHAT_LLM_STRING))
+        self.assertNotEqual(key, cache_key("Observation: tool output A", CHAT_LLM_STRING.replace("gpt-4", "gpt-3.5")))
+
+    def test_entries_persist_and_expire(self):
+        store = LLMResponseStore(self.path, ttl=60)
+        store.set("k", "response")
+        self.assertEqual(LLMResponseStore(self.path, ttl=60).get("k"), "response")
+
+        expired = LLMResponseStore(self.path, ttl=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(expired.get("k"))
+
+    def test_size_limits_evict_least_recently_used(self):
+        store = LLMResponseStore(":memory:", max_entries=2, max_bytes=1000)
+        store.set("a", "1")
+        time.sleep(0.01)
+        store.set("b", "2")
+        time.sleep(0.01)
+        store.get("a")
+        store.set("c", "3")
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("a"), "1")
+
+        store.set("big", "x" * 995)
+        stats = store.stats()
+        self.assertLessEqual(stats["bytes"], 1000)
+        self.assertEqual(store.get("big"), "x" * 995)
+
+        store.set("huge", "x" * 2000)
+        self.assertIsNone(store.get("huge"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils.metrics import (
+    MetricsRegistry,
+    context_bound,
+    current_job,
+    instrument_tool,
+    record_bytes,
+    record_cache,
+    registry,
+    timed_crew,
+    timed_task,
+    token_delta,
+    track_job,
+)
+from CrewAI.utils.job_queue import JobQueue, JOB_DONE
+
+
+class FakeTokenProcess:
+    def __init__(self):
+        self.summary = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "successful_requests": 0}
+
+    def get_summary(self):
+        return dict(self.summary)
+
+
+class FakeAgent:
+    def __init__(self, role):
+        self.role = role
+        self._token_process = FakeTokenProcess()
+
+
+class FakeTask:
+    def __init__(self, agent, description="task"):
+        self.agent = agent
+        self.description = description
+
+
+class FakeCrew:
+    """Sequential crew calling task_callback after each task, like crewai"""
+
+    def __init__(self, agents, tasks, tokens_per_task):
+        self.agents = agents
+        self.tasks = tasks
+        self.tokens_per_task = tokens_per_task
+        self.task_callback = None
+
+    def kickoff(self):
+        for task in self.tasks:
+            task.agent._token_process.summary["total_tokens"] += self.tokens_per_task
+            if self.task_callback:
+                self.task_callback(SimpleNamespace(description=task.description, raw_output="done"))
+        return "done"
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_render_counters_and_histograms(self):
+        """Series are rendered in the Prometheus text format"""
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.describe("calls_total", "Calls")
+        metrics.inc("calls_total", tool="search")
+        metrics.inc("calls_total", 2, tool="search")
+        metrics.observe("run_seconds", 0.5, name='a"b')
+
+        text = metrics.render()
+        self.assertIn("# HELP calls_total Calls", text)
+        self.assertIn("# TYPE calls_total counter", text)
+        self.assertIn('calls_total{tool="search"} 3', text)
+        self.assertIn("# TYPE run_seconds histogram", text)
+        self.assertIn('run_seconds_bucket{name="a\\"b",le="0.1"} 0', text)
+        self.assertIn('run_seconds_bucket{name="a\\"b",le="1"} 1', text)
+        self.assertIn('run_seconds_bucket{name="a\\"b",le="+Inf"} 1', text)
+        self.assertIn('run_seconds_sum{name="a\\"b"} 0.5', text)
+        self.assertEqual(metrics.value("run_seconds", name='a"b'), 1)
+
+    def test_token_delta(self):
+        self.assertEqual(token_delta({"total_tokens": 5}, {"total_tokens": 12}), {"total_tokens": 7})
+        self.assertEqual(token_delta(None, None), {})
+
+
+class TestJobTracking(unittest.TestCase):
+    def test_records_reach_job_through_bound_threads(self):
+        """Work submitted with context_bound reports to the submitting job"""
+        with track_job("job-1") as timings:
+            record_bytes("snapshot", 100)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                list(pool.map(context_bound(lambda hit: record_cache("tts", hit)), [True, False, True]))
+        self.assertIsNone(current_job())
+
+        summary = timings.summary()
+        self.assertEqual(summary["bytes_fetched"], {"snapshot": 100})
+        self.assertEqual(summary["cache"], {"tts": {"hits": 2, "misses": 1}})
+
+    def test_bound_function_runs_concurrently(self):
+        """One bound function can run in several pool threads at once"""
+        barrier = threading.Barrier(3)
+        bound = context_bound(lambda _: barrier.wait(timeout=5))
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            self.assertEqual(len(list(pool.map(bound, range(3)))), 3)
+
+    def test_instrument_tool_times_run(self):
+        """Decorated tools record a span and keep _run's metadata"""
+        @instrument_tool
+        class EchoTool:
+            name = "Echo Tool"
+
+            def _run(self, text: str) -> str:
+                """Echo the text"""
+                return text
+
+        with track_job() as timings:
+            self.assertEqual(EchoTool()._run(text="hi"), "hi")
+
+        self.assertEqual(EchoTool._run.__annotations__, {"text": str, "return": str})
+        self.assertEqual(timings.summary()["totals"]["tool"]["Echo Tool"]["calls"], 1)
+        self.assertGreaterEqual(registry.value("gista_tool_calls_total", name="Echo Tool", status="ok"), 1)
+
+    def test_timed_task_attributes_agent_tokens(self):
+        """A task's span carries the tokens its agent used during the task"""
+        agent = FakeAgent("Writer")
+        agent._token_process.summary["total_tokens"] = 40
+        with track_job() as timings:
+            with timed_task(FakeTask(agent)):
+                agent._token_process.summary["total_tokens"] = 55
+                agent._token_process.summary["prompt_tokens"] = 10
+
+        span = timings.summary()["spans"][0]
+        self.assertEqual(span["kind"], "task")
+        self.assertEqual(span["name"], "Writer")
+        self.assertEqual(span["llm_tokens"]["total_tokens"], 15)
+        self.assertEqual(timings.summary()["llm_tokens"]["prompt_tokens"], 10)
+
+    def test_timed_crew_counts_only_this_kickoff(self):
+        """Pooled agents keep their totals; spans get per-task and per-crew deltas"""
+        agent = FakeAgent("Validator")
+        agent._token_process.summary["total_tokens"] = 500
+        crew = FakeCrew([agent], [FakeTask(agent, "read"), FakeTask(agent, "validate")], tokens_per_task=20)
+
+        with track_job() as timings:
+            with timed_crew(crew, "approval"):
+                crew.kickoff()
+
+        spans = timings.summary()["spans"]
+        self.assertEqual([span["kind"] for span in spans], ["task", "task", "crew"])
+        self.assertEqual([span["llm_tokens"]["total_tokens"] for span in spans], [20, 20, 40])
+        self.assertEqual(timings.summary()["llm_tokens"]["total_tokens"], 40)
+        self.assertIsNone(crew.task_callback)
+
+    def test_job_result_includes_timings(self):
+        """Queued jobs expose their timing breakdown"""
+        queue = JobQueue(max_workers=1, max_pending=1)
+        try:
+            job = queue.submit(lambda: record_bytes("serper", 7), name="fetch")
+            self.assertTrue(job.wait(5))
+        finally:
+            queue.shutdown(wait=True)
+
+        self.assertEqual(job.status, JOB_DONE)
+        self.assertEqual(job.to_dict()["timings"]["bytes_fetched"], {"serper": 7})
+
+
+if __name__ == "__main__":
+    unittest.main()
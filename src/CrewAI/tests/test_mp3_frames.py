@@ -0,0 +1,70 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.gista_tools.mp3_frames import (
+    iter_frames,
+    mp3_duration,
+    parse_frame_header,
+    silence_frames,
+    silent_frame,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, joint stereo, no CRC
+HEADER_128K = bytes([0xFF, 0xFB, 0x90, 0x44])
+FRAME_SECONDS = 1152 / 44100
+
+def make_frames(count: int) -> bytes:
+    template = parse_frame_header(HEADER_128K)
+    return silent_frame(template) * count
+
+class TestMp3Frames(unittest.TestCase):
+    def test_parse_header(self):
+        header = parse_frame_header(HEADER_128K)
+
+        self.assertEqual(header.bitrate_kbps, 128)
+        self.assertEqual(header.sample_rate, 44100)
+        self.assertEqual(header.layer, 3)
+        self.assertEqual(header.frame_length, 417)
+        self.assertAlmostEqual(header.duration, FRAME_SECONDS)
+
+    def test_rejects_invalid_header(self):
+        self.assertIsNone(parse_frame_header(b"\x00\x00\x00\x00"))
+        self.assertIsNone(parse_frame_header(b"\xFF\xFB\xF0\x44"))  # bad bitrate index
+
+    def test_duration_counts_frames(self):
+        audio = make_frames(100)
+        self.assertAlmostEqual(mp3_duration(io.BytesIO(audio)), 100 * FRAME_SECONDS)
+
+    def test_skips_id3_tags_and_garbage(self):
+        """ID3v2 tags, stray bytes and ID3v1 trailers do not add duration"""
+        id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x0A" + b"\x00" * 10
+        id3v1 = b"TAG" + b"\x00" * 125
+        audio = id3v2 + make_frames(10) + b"\x00\x01" + make_frames(5) + id3v1
+
+        frames = list(iter_frames(io.BytesIO(audio)))
+        self.assertEqual(len(frames), 15)
+        self.assertAlmostEqual(mp3_duration(io.BytesIO(audio)), 15 * FRAME_SECONDS)
+
+    def test_skips_info_frame(self):
+        """A leading Xing/Info frame is metadata, not audio"""
+        template = parse_frame_header(HEADER_128K)
+        info = bytearray(silent_frame(template))
+        offset = 4 + template.side_info_length
+        info[offset:offset + 4] = b"Info"
+        audio = bytes(info) + make_frames(3)
+
+        self.assertEqual(len(list(iter_frames(io.BytesIO(audio)))), 3)
+
+    def test_silence_frames(self):
+        template = parse_frame_header(HEADER_128K)
+        frames = list(silence_frames(template, 1.0))
+
+        self.assertEqual(len(frames), round(1.0 / FRAME_SECONDS))
+        self.assertTrue(all(parse_frame_header(f).padding == 0 for f in frames))
+
+if __name__ == '__main__':
+    unittest.main()
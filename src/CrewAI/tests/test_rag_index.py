@@ -0,0 +1,159 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.rag_index import RAGIndex
+
+
+class FakeDB:
+    def __init__(self):
+        self.chunks = 0
+
+    def count(self):
+        return self.chunks
+
+
+class FakeApp:
+    """Stands in for an embedchain app; collections are shared by name"""
+
+    def __init__(self, config, collections, adds):
+        self.name = config["vectordb"]["config"]["collection_name"]
+        self.db = collections.setdefault(self.name, FakeDB())
+        self.adds = adds
+
+    def add(self, source, data_type=None):
+        time.sleep(0.01)
+        self.adds.append((source, data_type))
+        self.db.chunks += 3
+
+
+class TestRAGIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.collections = {}
+        self.adds = []
+        self.dropped = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_index(self, **kwargs):
+        def drop(db_dir, name):
+            self.dropped.append(name)
+            self.collections.pop(name, None)
+
+        return RAGIndex(
+            path=os.path.join(self.tmp.name, "rag_index.sqlite3"),
+            db_dir=self.tmp.name,
+            app_factory=lambda config: FakeApp(config, self.collections, self.adds),
+            drop_collection=drop,
+            **kwargs
+        )
+
+    def write_file(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w") as handle:
+            handle.write(content)
+        return path
+
+    def test_document_is_embedded_once_across_instances(self):
+        path = self.write_file("report.pdf", "quarterly numbers")
+        self.make_index().get_app(path, "pdf_file")
+        app = self.make_index().get_app(path, "pdf_file")
+
+        self.assertEqual(len(self.adds), 1)
+        self.assertEqual(app.db.count(), 3)
+
+    def test_key_follows_content_and_chunking(self):
+        first = self.write_file("a.pdf", "same text")
+        second = self.write_file("b.pdf", "same text")
+        index = self.make_index()
+
+        self.assertEqual(index.document_key(first, "pdf_file"), index.document_key(second, "pdf_file"))
+        self.assertNotEqual(
+            index.document_key(first, "pdf_file"),
+            self.make_index(chunk_size=500).document_key(first, "pdf_file")
+        )
+        self.write_file("b.pdf", "edited text")
+        self.assertNotEqual(index.document_key(first, "pdf_file"), index.document_key(second, "pdf_file"))
+
+    def test_extracted_text_is_indexed_once_per_digest(self):
+        index = self.make_index()
+        index.get_text_app("body text", "abc123", "uploads/a.docx")
+        index.get_text_app("body text", "abc123", "uploads/copy.docx")
+
+        self.assertEqual(self.adds, [("body text", "text")])
+        self.assertEqual(index.entries()[0]["source"], "uploads/a.docx")
+
+    def test_concurrent_requests_embed_once(self):
+        path = self.write_file("shared.csv", "a,b\n1,2\n")
+        index = self.make_index()
+        threads = [threading.Thread(target=index.get_app, args=(path, "csv")) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.adds), 1)
+
+    def test_missing_collection_is_rebuilt(self):
+        path = self.write_file("report.docx", "body")
+        index = self.make_index()
+        index.get_app(path, "docx")
+        self.collections.clear()
+
+        self.make_index().get_app(path, "docx")
+        self.assertEqual(len(self.adds), 2)
+
+    def test_urls_are_reindexed_after_web_ttl(self):
+        index = self.make_index(web_ttl=0)
+        index.get_app("https://example.org/page", "web_page")
+        index.get_app("https://example.org/page/", "web_page")
+
+        self.assertEqual(len(self.adds), 2)
+        self.assertEqual(len(self.dropped), 1)
+
+    def test_compact_drops_expired_then_least_recently_used(self):
+        index = self.make_index(max_chunks=100)
+        paths = [self.write_file(f"doc{i}.pdf", f"content {i}") for i in range(3)]
+        for path in paths:
+            index.get_app(path, "pdf_file")
+        index.get_app(paths[0], "pdf_file")
+
+        index.max_chunks = 6
+        self.assertEqual(len(index.compact()), 1)
+        self.assertFalse(index.is_indexed(paths[1], "pdf_file"))
+        self.assertTrue(index.is_indexed(paths[0], "pdf_file"))
+
+        dropped = index.compact(now=time.time() + index.ttl + 1)
+        self.assertEqual(len(dropped), 2)
+        self.assertEqual(index.stats(), {"documents": 0, "chunks": 0})
+
+    def test_document_over_chunk_limit_is_kept_while_in_use(self):
+        index = self.make_index(max_chunks=2)
+        old = self.write_file("old.pdf", "old content")
+        new = self.write_file("new.pdf", "new content")
+        index.get_app(old, "pdf_file")
+        app = index.get_app(new, "pdf_file")
+
+        self.assertTrue(index.is_indexed(new, "pdf_file"))
+        self.assertFalse(index.is_indexed(old, "pdf_file"))
+        self.assertIn(app.name, self.collections)
+
+    def test_expired_url_is_replaced_under_its_build_lock(self):
+        index = self.make_index(web_ttl=0)
+        index.get_app("https://example.org/page", "web_page")
+        # Removal re-enters the lock the rebuild already holds
+        app = index.get_app("https://example.org/page", "web_page")
+
+        self.assertEqual(app.db.count(), 3)
+        self.assertEqual(index.stats()["documents"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
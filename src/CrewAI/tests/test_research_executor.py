@@ -0,0 +1,76 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.gista_tools.research_executor import ConcurrentResearchExecutor
+
+def sleeper(seconds: float, value: str):
+    def call():
+        time.sleep(seconds)
+        return value
+    return call
+
+class TestConcurrentResearchExecutor(unittest.TestCase):
+    def test_runs_sources_concurrently(self):
+        """Latency tracks the slowest source, not the sum"""
+        executor = ConcurrentResearchExecutor(max_workers=4, source_timeout=2, deadline=5)
+        calls = [(f"source_{i}", sleeper(0.2, f"result_{i}")) for i in range(4)]
+
+        started = time.monotonic()
+        outcomes = executor.run(calls)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual([o.value for o in outcomes.values()], [f"result_{i}" for i in range(4)])
+        self.assertTrue(all(o.ok for o in outcomes.values()))
+
+    def test_slow_source_times_out_with_partial_results(self):
+        release = threading.Event()
+        executor = ConcurrentResearchExecutor(max_workers=4, source_timeout=0.2, deadline=5)
+
+        started = time.monotonic()
+        outcomes = executor.run([
+            ("fast", sleeper(0.01, "quick")),
+            ("slow", lambda: release.wait(5)),
+        ])
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(outcomes["fast"].value, "quick")
+        self.assertEqual(outcomes["slow"].status, "timeout")
+        self.assertTrue(outcomes["slow"].value_or_error().startswith("Error: timed out"))
+
+    def test_global_deadline_covers_queued_calls(self):
+        """Calls still queued behind slow ones expire at the run deadline"""
+        release = threading.Event()
+        executor = ConcurrentResearchExecutor(max_workers=1, source_timeout=10, deadline=0.3)
+
+        started = time.monotonic()
+        outcomes = executor.run([
+            ("blocking", lambda: release.wait(5)),
+            ("queued", sleeper(0.01, "never")),
+        ])
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(outcomes["blocking"].status, "timeout")
+        self.assertEqual(outcomes["queued"].status, "timeout")
+
+    def test_errors_are_reported_per_source(self):
+        def failing():
+            raise ValueError("bad response")
+
+        outcomes = ConcurrentResearchExecutor().run([("ok", lambda: 1), ("broken", failing)])
+
+        self.assertEqual(outcomes["ok"].value, 1)
+        self.assertEqual(outcomes["broken"].status, "error")
+        self.assertEqual(outcomes["broken"].value_or_error(), "Error: bad response")
+
+if __name__ == '__main__':
+    unittest.main()
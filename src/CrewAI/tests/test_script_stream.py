@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.gista_tools.script_stream import ScriptStream, iter_segments
+
+SAMPLE_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "sample_podcast_script.md"
+)
+
+class TestScriptStream(unittest.TestCase):
+    def test_sample_script(self):
+        stream = ScriptStream(SAMPLE_SCRIPT)
+        segments = list(stream)
+
+        self.assertEqual(stream.metadata["title"], "Understanding Quantum Computing Basics")
+        self.assertTrue(stream.metadata["source"].startswith('"Introduction to Quantum Computing"'))
+        self.assertEqual(len(segments), 12)
+        self.assertEqual([s.index for s in segments], list(range(12)))
+        self.assertEqual(segments[0].voice_role, "host")
+        self.assertEqual(segments[0].section, "Readout Segment")
+        self.assertEqual(segments[1].voice_role, "readout")
+        self.assertEqual(segments[5].section, "Segment 1: Understanding Qubits")
+        # Editorial notes and attribution lists are not spoken
+        self.assertTrue(segments[-1].text.endswith("join us next time on Gista."))
+        self.assertFalse(any("Continue with" in s.text for s in segments))
+
+    def test_pause_and_emphasis_markers(self):
+        script = "[Host Voice]\nThis is *really* big. // Truly.\n[Expert Voice]\nAgreed.\n"
+        first, second = iter_segments(script)
+
+        self.assertEqual(first.pause_markers, [first.text.index("//")])
+        self.assertEqual(len(first.emphasis_markers), 1)
+        span = first.emphasis_markers[0]
+        self.assertEqual(first.text[span["start"]:span["end"]], "really")
+        self.assertEqual(second.pause_markers, [])
+        self.assertEqual(second.voice_role, "expert")
+
+    def test_segments_are_yielded_lazily(self):
+        """A segment is available before later lines have been read"""
+        consumed = []
+
+        def lines():
+            for line in ["[Host Voice]", "Hello.", "[Expert Voice]", "Hi.", "[Host Voice]", "Bye."]:
+                consumed.append(line)
+                yield line
+
+        segments = iter_segments(lines())
+        first = next(segments)
+        self.assertEqual(first.text, "Hello.")
+        self.assertEqual(len(consumed), 3)
+
+if __name__ == '__main__':
+    unittest.main()
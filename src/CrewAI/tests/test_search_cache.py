@@ -0,0 +1,130 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools import search_cache
+from CrewAI.tools.search_cache import SearchCache, cached_scrape, normalize_query, normalize_url
+
+class TestNormalization(unittest.TestCase):
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  Quantum   Computing\nBasics "), "quantum computing basics")
+
+    def test_normalize_url(self):
+        self.assertEqual(
+            normalize_url("HTTPS://Example.com:443/Article/?b=2&utm_source=x&a=1#comments"),
+            "https://example.com/Article?a=1&b=2"
+        )
+        self.assertEqual(normalize_url("http://example.com"), "http://example.com/")
+        self.assertEqual(normalize_url("http://example.com:8080/x"), "http://example.com:8080/x")
+
+class TestSearchCache(unittest.TestCase):
+    def test_ttl_per_namespace(self):
+        cache = SearchCache(ttls={"news": 60, "academic": 3600})
+        now = time.time()
+        cache.set("news", "ai", "headlines")
+        cache.set("academic", "ai", "papers")
+
+        with mock.patch("CrewAI.tools.search_cache.time.time", return_value=now + 120):
+            self.assertIsNone(cache.get("news", "ai"))
+            self.assertEqual(cache.get("academic", "ai"), "papers")
+
+    def test_lru_eviction(self):
+        cache = SearchCache(max_entries=2)
+        cache.set("scrape", "a", "A")
+        cache.set("scrape", "b", "B")
+        cache.get("scrape", "a")
+        cache.set("scrape", "c", "C")
+
+        self.assertIsNone(cache.get("scrape", "b"))
+        self.assertEqual(cache.get("scrape", "a"), "A")
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_concurrent_requests_are_merged(self):
+        """Identical in-flight requests share one underlying call"""
+        cache = SearchCache()
+        calls = []
+        gate = threading.Event()
+
+        def compute():
+            calls.append(1)
+            gate.wait(2)
+            return "results"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("web_search", "q", compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["results"] * 5)
+        self.assertEqual(cache.stats()["merged"], 4)
+
+    def test_rejected_values_and_errors_are_not_cached(self):
+        cache = SearchCache()
+        cache.get_or_compute("web_search", "q", lambda: {"message": "quota"}, should_cache=lambda v: isinstance(v, str))
+        self.assertIsNone(cache.get("web_search", "q"))
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_compute("web_search", "q", mock.Mock(side_effect=RuntimeError("down")))
+        self.assertEqual(cache.get_or_compute("web_search", "q", lambda: "ok"), "ok")
+
+    def test_sqlite_backend_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "search_cache.db")
+            SearchCache(db_path=db_path).set("news", "ai", "headlines")
+
+            reopened = SearchCache(db_path=db_path)
+            self.assertEqual(reopened.get("news", "ai"), "headlines")
+            reopened._db.close()
+
+class TestCachedScrape(unittest.TestCase):
+    def setUp(self):
+        patch = mock.patch.object(search_cache, "_search_cache", SearchCache())
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_failed_scrape_is_not_cached(self):
+        scraper = mock.Mock()
+        scraper._run.side_effect = [RuntimeError("503 Server Error"), "Page text"]
+
+        with self.assertRaises(RuntimeError):
+            cached_scrape(scraper, "https://example.com/page")
+        self.assertEqual(cached_scrape(scraper, "https://example.com/page"), "Page text")
+        self.assertEqual(cached_scrape(scraper, "https://example.com/page"), "Page text")
+        self.assertEqual(scraper._run.call_count, 2)
+
+    def test_pooled_scraper_raises_for_error_status(self):
+        try:
+            import requests
+            from CrewAI.tools import pooled_web_tools
+        except ImportError as e:
+            self.skipTest(f"scraper dependencies not available: {e}")
+
+        response = requests.Response()
+        response.status_code = 429
+        response.url = "https://example.com/page"
+        response._content = b"<html><body>Too Many Requests</body></html>"
+        session = mock.Mock()
+        session.get.return_value = response
+        scraper = pooled_web_tools.PooledScrapeWebsiteTool()
+
+        with mock.patch.object(pooled_web_tools, "get_http_session", return_value=session):
+            with self.assertRaises(requests.HTTPError):
+                cached_scrape(scraper, "https://example.com/page")
+        self.assertIsNone(search_cache.get_search_cache().get("scrape", "https://example.com/page"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.config import settings
+
+
+class TestSettings(unittest.TestCase):
+    def setUp(self):
+        # Skip reading .env; the tests control the environment
+        self._loaded = settings._environment_loaded
+        settings._environment_loaded = True
+        settings.reset_settings()
+
+    def tearDown(self):
+        settings._environment_loaded = self._loaded
+        settings.reset_settings()
+
+    def test_settings_are_read_once(self):
+        with mock.patch.dict(os.environ, {"CONTENT_APPROVAL_MAX_WORKERS": "3"}):
+            first = settings.get_settings()
+            self.assertEqual(first.content_approval_max_workers, 3)
+            self.assertEqual(first.content_approval_pool_size, 3)
+
+        with mock.patch.dict(os.environ, {"CONTENT_APPROVAL_MAX_WORKERS": "5"}):
+            self.assertIs(settings.get_settings(), first)
+            settings.reset_settings()
+            self.assertEqual(settings.get_settings().content_approval_max_workers, 5)
+
+    def test_module_constants_resolve_to_settings(self):
+        with mock.patch.dict(os.environ, {"CONTENT_APPROVAL_BATCH_WAIT": "2.5"}):
+            self.assertEqual(settings.CONTENT_APPROVAL_BATCH_WAIT, 2.5)
+        with self.assertRaises(AttributeError):
+            settings.NOT_A_SETTING
+
+    def test_validate_settings(self):
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "", "SERPER_API_KEY": "key"}):
+            with self.assertRaises(ValueError):
+                settings.validate_settings()
+
+        settings.reset_settings()
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "key", "SERPER_API_KEY": "key"}):
+            settings.validate_settings()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.utils.task_scheduler import TaskGraph
+
+class FakeTask:
+    """Stands in for a crewai Task: context, agent and execute()"""
+
+    def __init__(self, name, agent=None, context=None, duration=0.05, log=None, fail=False):
+        self.name = name
+        self.agent = agent
+        self.context = context
+        self.duration = duration
+        self.log = log if log is not None else []
+        self.fail = fail
+
+    def execute(self):
+        self.log.append(("start", self.name, time.monotonic()))
+        time.sleep(self.duration)
+        self.log.append(("end", self.name, time.monotonic()))
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return f"{self.name} done"
+
+def build_research_graph(log):
+    """The research department's shape: one fan-out and one join"""
+    analysis = FakeTask("content_analysis", agent="analyst", log=log)
+    terminology = FakeTask("terminology_analysis", agent="technical", context=[analysis], log=log)
+    background = FakeTask("background_research", agent="researcher", context=[analysis], log=log)
+    presentation = FakeTask(
+        "content_presentation", agent="analyst", context=[analysis, terminology, background], log=log
+    )
+    return [analysis, terminology, background, presentation]
+
+def times(log, name):
+    return next(t for kind, n, t in log if n == name and kind == "start"), \
+        next(t for kind, n, t in log if n == name and kind == "end")
+
+class TestTaskGraph(unittest.TestCase):
+    def test_levels_follow_context(self):
+        graph = TaskGraph(build_research_graph([]))
+        self.assertEqual(graph.levels(), [[0], [1, 2], [3]])
+        self.assertAlmostEqual(graph.critical_path({0: 1.0, 1: 2.0, 2: 3.0, 3: 1.0}), 5.0)
+
+    def test_independent_tasks_overlap_and_dependencies_wait(self):
+        log = []
+        graph = TaskGraph(build_research_graph(log))
+        outputs = graph.run(max_workers=4)
+
+        self.assertEqual(outputs[3], "content_presentation done")
+        term_start, term_end = times(log, "terminology_analysis")
+        back_start, back_end = times(log, "background_research")
+        self.assertLess(term_start, back_end)
+        self.assertLess(back_start, term_end)
+        pres_start, _ = times(log, "content_presentation")
+        self.assertGreaterEqual(pres_start, max(term_end, back_end))
+
+        stats = graph.stats()
+        self.assertLess(stats["elapsed_seconds"], stats["serial_seconds"])
+
+    def test_tasks_sharing_an_agent_do_not_overlap(self):
+        log = []
+        first = FakeTask("readout", agent="voice_alpha", log=log)
+        second = FakeTask("qa_early", agent="voice_alpha", log=log)
+        other = FakeTask("qa_middle", agent="voice_beta", log=log)
+        TaskGraph([first, second, other]).run(max_workers=3)
+
+        _, first_end = times(log, "readout")
+        second_start, _ = times(log, "qa_early")
+        self.assertGreaterEqual(second_start, first_end)
+
+    def test_failure_stops_dependents(self):
+        log = []
+        failing = FakeTask("parse_script", fail=True, log=log)
+        dependent = FakeTask("readout", context=[failing], log=log)
+        with self.assertRaises(RuntimeError):
+            TaskGraph([failing, dependent]).run()
+        self.assertNotIn("readout", [name for _, name, _ in log])
+
+    def test_invalid_graphs(self):
+        with self.assertRaises(TypeError):
+            TaskGraph([FakeTask("voice", context=[{"depends_on": "parse_script"}])])
+
+        a = FakeTask("a")
+        b = FakeTask("b", context=[a])
+        a.context = [b]
+        with self.assertRaises(ValueError):
+            TaskGraph([a, b])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.agents.gistaApp_agents.content_approval_team.content_snapshot import ContentSnapshot
+from CrewAI.agents.gistaApp_agents.content_approval_team.team_pool import ContentApprovalTeamPool
+
+
+class FakeTeam:
+    def __init__(self):
+        self.warmed = 0
+        self.released = 0
+
+    def warm(self):
+        self.warmed += 1
+
+    def release(self):
+        self.released += 1
+
+
+class TestContentApprovalTeamPool(unittest.TestCase):
+    def test_released_team_is_reused(self):
+        pool = ContentApprovalTeamPool(max_size=2, factory=FakeTeam)
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(first.warmed, 1)
+        self.assertEqual(first.released, 2)
+
+    def test_concurrent_leases_get_separate_teams(self):
+        pool = ContentApprovalTeamPool(max_size=2, factory=FakeTeam)
+        with pool.lease() as first, pool.lease() as second:
+            self.assertIsNot(first, second)
+        self.assertEqual(pool.created, 2)
+
+    def test_lease_times_out_when_all_teams_are_busy(self):
+        pool = ContentApprovalTeamPool(max_size=1, factory=FakeTeam)
+        leased = threading.Event()
+        done = threading.Event()
+
+        def hold():
+            with pool.lease():
+                leased.set()
+                done.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        try:
+            self.assertTrue(leased.wait(5))
+            with self.assertRaises(TimeoutError):
+                with pool.lease(timeout=0.05):
+                    pass
+        finally:
+            done.set()
+            holder.join()
+
+        with pool.lease(timeout=1) as team:
+            self.assertIsInstance(team, FakeTeam)
+        self.assertEqual(pool.created, 1)
+
+
+class TestPooledTeamToolCache(unittest.TestCase):
+    """A reused crew must not answer a new job from the previous job's tool cache"""
+
+    def setUp(self):
+        try:
+            from crewai.tools.tool_calling import ToolCalling
+            from CrewAI.agents.gistaApp_agents.content_approval_team.content_approval_team import (
+                ContentApprovalTeam
+            )
+        except ImportError as e:
+            self.skipTest(f"crewai not available: {e}")
+        self.ToolCalling = ToolCalling
+        patch = mock.patch.dict(os.environ, {"OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "test-key")})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        def build_team():
+            # Skip the .env lookup in __init__; everything else is the real team
+            team = ContentApprovalTeam.__new__(ContentApprovalTeam)
+            team.verbose = False
+            team.agents = {}
+            team.tasks = []
+            team.crew = None
+            team.task_callback = None
+            team.guidelines_prompt = None
+            team.guidelines = team._load_approval_guidelines()
+            return team
+
+        self.pool = ContentApprovalTeamPool(max_size=1, factory=build_team)
+
+    def read_page(self, team, snapshot):
+        """Run the website tool through the agent's tool handler, as crewai does"""
+        agent = team.agents["content_validator"]
+        tool = agent.tools[0]
+        calling = self.ToolCalling(tool_name=tool.name, arguments={})
+        cached = agent.tools_handler.cache.read(tool=calling.tool_name, input=calling.arguments)
+        if cached is not None:
+            return cached
+        output = tool._run()
+        agent.tools_handler.on_tool_use(calling=calling, output=output)
+        return output
+
+    def test_consecutive_leases_see_their_own_page(self):
+        first = ContentSnapshot("https://a.site/post", status_code=200, text="Article about owls.")
+        second = ContentSnapshot("https://b.site/post", status_code=200, text="Article about whales.")
+
+        with self.pool.lease() as team:
+            team.start_podcast_production_flow(first.source, snapshot=first)
+            self.assertIn("owls", self.read_page(team, first))
+        with self.pool.lease() as team:
+            team.start_podcast_production_flow(second.source, snapshot=second)
+            page = self.read_page(team, second)
+
+        self.assertIn("whales", page)
+        self.assertNotIn("owls", page)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.tool_registry import (
+    DEFAULT_TOOL_SPECS,
+    ToolRegistry,
+    preload_tools_from_env,
+    spec_factory,
+)
+from CrewAI.tools import tool_registry
+
+
+class FakeTool:
+    builds = 0
+
+    def __init__(self):
+        FakeTool.builds += 1
+
+
+class TestToolRegistry(unittest.TestCase):
+    def setUp(self):
+        FakeTool.builds = 0
+        self.registry = ToolRegistry({"fake": FakeTool, "other": object})
+
+    def test_builds_on_first_use_and_shares_instance(self):
+        self.assertFalse(self.registry.is_built("fake"))
+        tool = self.registry.get("fake")
+
+        self.assertIs(self.registry.get("fake"), tool)
+        self.assertTrue(self.registry.is_built("fake"))
+        self.assertFalse(self.registry.is_built("other"))
+        self.assertEqual(FakeTool.builds, 1)
+
+    def test_concurrent_first_use_builds_once(self):
+        def slow_build():
+            time.sleep(0.05)
+            return FakeTool()
+
+        self.registry.register("slow", slow_build)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.registry.get("slow"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(FakeTool.builds, 1)
+        self.assertEqual(len({id(tool) for tool in results}), 1)
+
+    def test_unknown_and_duplicate_names(self):
+        with self.assertRaises(KeyError):
+            self.registry.get("missing")
+        with self.assertRaises(ValueError):
+            self.registry.register("fake", FakeTool)
+
+        self.registry.get("fake")
+        self.registry.register("fake", object, replace=True)
+        self.assertNotIsInstance(self.registry.get("fake"), FakeTool)
+
+    def test_preload_builds_subset_and_reports_failures(self):
+        def broken():
+            raise RuntimeError("no api key")
+
+        self.registry.register("broken", broken)
+        errors = self.registry.preload(["fake", "broken"])
+
+        self.assertTrue(self.registry.is_built("fake"))
+        self.assertFalse(self.registry.is_built("other"))
+        self.assertEqual(errors, {"broken": "RuntimeError: no api key"})
+
+    def test_reset_rebuilds(self):
+        first = self.registry.get("fake")
+        self.registry.reset(["fake"])
+        self.assertIsNot(self.registry.get("fake"), first)
+        self.assertEqual(FakeTool.builds, 2)
+
+    def test_preload_from_env(self):
+        with mock.patch.object(tool_registry, "_tool_registry", self.registry), \
+                mock.patch.dict(os.environ, {"GISTA_PRELOAD_TOOLS": "fake, missing"}):
+            errors = preload_tools_from_env()
+
+        self.assertTrue(self.registry.is_built("fake"))
+        self.assertEqual(list(errors), ["missing"])
+
+    def test_spec_factory_imports_lazily(self):
+        build = spec_factory(".search_cache:SearchCache")
+        self.assertEqual(type(build()).__name__, "SearchCache")
+        self.assertIn("voiceover", DEFAULT_TOOL_SPECS)
+
+
+if __name__ == "__main__":
+    unittest.main()
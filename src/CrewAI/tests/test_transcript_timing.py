@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.gista_tools.mp3_frames import parse_frame_header, silent_frame
+from CrewAI.tools.gista_tools.transcript_timing import (
+    format_timestamp,
+    render_srt,
+    render_webvtt,
+    segment_timings,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, joint stereo, no CRC
+HEADER_128K = bytes([0xFF, 0xFB, 0x90, 0x44])
+FRAME_SECONDS = 1152 / 44100
+
+SEGMENTS = [
+    {"voice_role": "host", "text": "Welcome to Gista. // Today we discuss AI."},
+    {"voice_role": "expert", "text": "Thanks for having me."},
+    {"voice_role": "host", "text": "Let us begin with the basics of the topic."},
+]
+
+class TestTranscriptTiming(unittest.TestCase):
+    def test_durations_from_audio(self):
+        """MP3 files, bytes and reported durations all set cue lengths"""
+        frame = silent_frame(parse_frame_header(HEADER_128K))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "segment_000.mp3")
+            with open(path, "wb") as f:
+                f.write(frame * 100)
+
+            cues = segment_timings(SEGMENTS, [path, {"audio": frame * 50}, {"duration_seconds": 2.5}])
+
+        self.assertAlmostEqual(cues[0]["end"], 100 * FRAME_SECONDS)
+        self.assertAlmostEqual(cues[1]["start"], 100 * FRAME_SECONDS)
+        self.assertAlmostEqual(cues[2]["start"], 150 * FRAME_SECONDS)
+        self.assertAlmostEqual(cues[2]["end"], 150 * FRAME_SECONDS + 2.5)
+        self.assertEqual({c["source"] for c in cues}, {"audio"})
+
+    def test_word_rate_fallback(self):
+        """Missing or failed audio falls back to the words-per-minute estimate"""
+        cues = segment_timings(SEGMENTS, [None, {"error": "quota"}], words_per_minute=60)
+
+        self.assertEqual(cues[0]["end"], 7.0)
+        self.assertEqual(cues[1]["end"], 11.0)
+        self.assertEqual(cues[2]["source"], "estimate")
+        self.assertEqual(cues[0]["text"], "Welcome to Gista. Today we discuss AI.")
+
+    def test_timestamp_styles(self):
+        self.assertEqual(format_timestamp(75.5), "01:15")
+        self.assertEqual(format_timestamp(3725.25), "1:02:05")
+        self.assertEqual(format_timestamp(3725.25, "vtt"), "01:02:05.250")
+        self.assertEqual(format_timestamp(3725.25, "srt"), "01:02:05,250")
+
+    def test_webvtt_and_srt(self):
+        cues = segment_timings(SEGMENTS[:2], [1.5, 2.0])
+
+        vtt = render_webvtt(cues)
+        self.assertTrue(vtt.startswith("WEBVTT\n\n1\n00:00:00.000 --> 00:00:01.500\n<v HOST>"))
+        self.assertIn("00:00:01.500 --> 00:00:03.500\n<v EXPERT>Thanks for having me.", vtt)
+
+        srt = render_srt(cues)
+        self.assertTrue(srt.startswith("1\n00:00:00,000 --> 00:00:01,500\nHOST: Welcome"))
+        self.assertIn("2\n00:00:01,500 --> 00:00:03,500\nEXPERT: Thanks for having me.", srt)
+
+if __name__ == '__main__':
+    unittest.main()
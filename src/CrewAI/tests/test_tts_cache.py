@@ -0,0 +1,76 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from CrewAI.tools.gista_tools.tts_cache import TTSAudioCache
+
+class TestTTSAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = TTSAudioCache(self.tmp_dir.name, max_bytes=25)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_key_covers_synthesis_parameters(self):
+        """Any change in text, voice, model or settings yields a new key"""
+        base = TTSAudioCache.make_key("Welcome to Gista", "host", "model", {"stability": 0.75})
+        self.assertEqual(base, TTSAudioCache.make_key("Welcome to Gista", "host", "model", {"stability": 0.75}))
+        self.assertNotEqual(base, TTSAudioCache.make_key("Welcome to Gista!", "host", "model", {"stability": 0.75}))
+        self.assertNotEqual(base, TTSAudioCache.make_key("Welcome to Gista", "expert", "model", {"stability": 0.75}))
+        self.assertNotEqual(base, TTSAudioCache.make_key("Welcome to Gista", "host", "other", {"stability": 0.75}))
+        self.assertNotEqual(base, TTSAudioCache.make_key("Welcome to Gista", "host", "model", {"stability": 0.5}))
+
+    def test_hit_and_miss_counters(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", b"0123456789")
+
+        self.assertEqual(self.cache.get("a"), b"0123456789")
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["bytes"], 10)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted once over max_bytes"""
+        self.cache.put("a", b"a" * 10)
+        self.cache.put("b", b"b" * 10)
+        self.cache.get("a")  # "b" is now least recently used
+        self.cache.put("c", b"c" * 10)
+
+        self.assertIsNotNone(self.cache.get_path("a"))
+        self.assertIsNone(self.cache.get_path("b"))
+        self.assertIsNotNone(self.cache.get_path("c"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+        self.assertFalse(self.cache.path_for("b").exists())
+
+    def test_streaming_writer(self):
+        """Entries written chunk by chunk appear only after commit"""
+        writer = self.cache.open_writer("stream")
+        writer.write(b"abc")
+        writer.write(b"def")
+        self.assertIsNone(self.cache.get_path("stream"))
+        writer.commit()
+        self.assertEqual(self.cache.get("stream"), b"abcdef")
+
+        aborted = self.cache.open_writer("partial")
+        aborted.write(b"abc")
+        aborted.abort()
+        self.assertIsNone(self.cache.get_path("partial"))
+        self.assertEqual(list(Path(self.tmp_dir.name).glob("*.part")), [])
+
+    def test_put_file_and_reload(self):
+        """Entries written by one instance are visible to the next"""
+        source = Path(self.tmp_dir.name) / "segment.bin"
+        source.write_bytes(b"audio")
+        self.cache.put_file("seg", source)
+
+        reopened = TTSAudioCache(self.tmp_dir.name, max_bytes=25)
+        self.assertEqual(reopened.get("seg"), b"audio")
+
+if __name__ == '__main__':
+    unittest.main()
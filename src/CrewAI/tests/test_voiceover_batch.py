@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class FakeSynthesis:
+    """Stands in for ElevenLabsVoiceoverTool._run and tracks concurrent calls"""
+
+    def __init__(self, delays=None, fail_texts=()):
+        self.delays = delays or {}
+        self.fail_texts = set(fail_texts)
+        self.active = 0
+        self.peak = 0
+        self.finished = []
+        self._lock = threading.Lock()
+
+    def __call__(self, tool, text, voice_role, segment_type, output_path=None, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(text, 0.01))
+            if text in self.fail_texts:
+                raise RuntimeError(f"quota exceeded for {text}")
+            return {
+                "audio_data": text.encode(),
+                "segment_info": {"type": segment_type, "role": voice_role}
+            }
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.finished.append(text)
+
+
+class TestSynthesizeBatch(unittest.TestCase):
+    def setUp(self):
+        try:
+            from CrewAI.tools.gista_tools.elevenLabs_voiceover_tool import ElevenLabsVoiceoverTool
+        except ImportError as e:
+            self.skipTest(f"voiceover dependencies not available: {e}")
+        self.tool_class = ElevenLabsVoiceoverTool
+        env = mock.patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test-key"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def run_batch(self, synthesis, texts, **kwargs):
+        segments = [{"text": text, "voice_role": "host", "segment_type": "readout"} for text in texts]
+        with mock.patch.object(self.tool_class, "_run", synthesis):
+            return self.tool_class().synthesize_batch(segments, **kwargs)
+
+    def test_results_keep_input_order(self):
+        # Later segments finish first
+        synthesis = FakeSynthesis(delays={"one": 0.15, "two": 0.08, "three": 0.01})
+        batch = self.run_batch(synthesis, ["one", "two", "three"], max_concurrency=3)
+
+        self.assertEqual(synthesis.finished, ["three", "two", "one"])
+        self.assertEqual([r["audio_data"] for r in batch["segments"]], [b"one", b"two", b"three"])
+        self.assertEqual([r["segment_info"]["index"] for r in batch["segments"]], [0, 1, 2])
+        self.assertEqual(batch["status"], "success")
+
+    def test_failed_segment_is_reported_in_place(self):
+        synthesis = FakeSynthesis(fail_texts={"two"})
+        batch = self.run_batch(synthesis, ["one", "two", "three"], max_concurrency=2)
+
+        self.assertEqual(batch["status"], "partial")
+        self.assertEqual(batch["failed_indices"], [1])
+        self.assertIn("quota exceeded", batch["segments"][1]["error"])
+        self.assertEqual(batch["segments"][0]["audio_data"], b"one")
+        self.assertEqual(batch["segments"][2]["audio_data"], b"three")
+
+    def test_max_concurrency_is_respected(self):
+        synthesis = FakeSynthesis(delays={str(i): 0.03 for i in range(8)})
+        batch = self.run_batch(synthesis, [str(i) for i in range(8)], max_concurrency=2)
+
+        self.assertEqual(len(batch["segments"]), 8)
+        self.assertEqual(synthesis.peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
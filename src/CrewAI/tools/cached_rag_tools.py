@@ -0,0 +1,129 @@
+"""
+Cached RAG Tools
+================
+
+Drop-in versions of crewai_tools' ``PDFSearchTool``, ``DOCXSearchTool``,
+``CSVSearchTool`` and ``WebsiteSearchTool`` that keep each document in
+its own collection through ``tools.rag_index`` instead of embedding it
+into the shared default store on every construction.
+
+A tool built with a source (``CachedPDFSearchTool(pdf=path)``) searches
+only that document; a tool built without one searches the document
+named in each call. Either way a document already in the index is not
+loaded or embedded again.
+"""
+
+from typing import Any, Optional
+
+from crewai_tools import CSVSearchTool, DOCXSearchTool, PDFSearchTool, WebsiteSearchTool
+from crewai_tools.adapters.embedchain_adapter import EmbedchainAdapter
+from crewai_tools.tools.csv_search_tool.csv_search_tool import FixedCSVSearchToolSchema
+from crewai_tools.tools.docx_search_tool.docx_search_tool import FixedDOCXSearchToolSchema
+from crewai_tools.tools.pdf_search_tool.pdf_search_tool import FixedPDFSearchToolSchema
+from crewai_tools.tools.rag.rag_tool import Adapter
+from crewai_tools.tools.website_search.website_search_tool import FixedWebsiteSearchToolSchema
+from embedchain.models.data_type import DataType
+
+from .rag_index import get_rag_index
+
+NO_DOCUMENT = "No document to search: pass the {source} to search together with the query."
+
+
+class _UnboundAdapter(Adapter):
+    """Adapter of a tool built without a source; no default store is created"""
+    source_field: str
+
+    def query(self, question: str) -> str:
+        return NO_DOCUMENT.format(source=self.source_field)
+
+    def add(self, *args: Any, **kwargs: Any) -> None:
+        raise ValueError(
+            f"Documents are indexed when the tool is built or called: build the tool with "
+            f"{self.source_field}=<document> or pass the {self.source_field} with each query"
+        )
+
+
+def _document_adapter(source: str, data_type: DataType, summarize: bool) -> EmbedchainAdapter:
+    app = get_rag_index().get_app(source, data_type)
+    return EmbedchainAdapter(embedchain_app=app, summarize=summarize)
+
+
+def _search(tool: Any, query: str, source: Optional[str], data_type: DataType) -> str:
+    adapter = _document_adapter(source, data_type, tool.summarize) if source else tool.adapter
+    return f"Relevant Content:\n{adapter.query(query)}"
+
+
+class CachedPDFSearchTool(PDFSearchTool):
+    """PDFSearchTool over a per-document, reusable index"""
+
+    def __init__(self, pdf: Optional[str] = None, **kwargs):
+        summarize = kwargs.get("summarize", False)
+        if pdf is not None:
+            kwargs["adapter"] = _document_adapter(pdf, DataType.PDF_FILE, summarize)
+        else:
+            kwargs["adapter"] = _UnboundAdapter(source_field="pdf")
+        super().__init__(**kwargs)
+        if pdf is not None:
+            self.description = f"A tool that can be used to semantic search a query the {pdf} PDF's content."
+            self.args_schema = FixedPDFSearchToolSchema
+            self._generate_description()
+
+    def _run(self, query: str, **kwargs: Any) -> Any:
+        return _search(self, query, kwargs.get("pdf"), DataType.PDF_FILE)
+
+
+class CachedDOCXSearchTool(DOCXSearchTool):
+    """DOCXSearchTool over a per-document, reusable index"""
+
+    def __init__(self, docx: Optional[str] = None, **kwargs):
+        summarize = kwargs.get("summarize", False)
+        if docx is not None:
+            kwargs["adapter"] = _document_adapter(docx, DataType.DOCX, summarize)
+        else:
+            kwargs["adapter"] = _UnboundAdapter(source_field="docx")
+        super().__init__(**kwargs)
+        if docx is not None:
+            self.description = f"A tool that can be used to semantic search a query the {docx} DOCX's content."
+            self.args_schema = FixedDOCXSearchToolSchema
+            self._generate_description()
+
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        return _search(self, search_query, kwargs.get("docx"), DataType.DOCX)
+
+
+class CachedCSVSearchTool(CSVSearchTool):
+    """CSVSearchTool over a per-document, reusable index"""
+
+    def __init__(self, csv: Optional[str] = None, **kwargs):
+        summarize = kwargs.get("summarize", False)
+        if csv is not None:
+            kwargs["adapter"] = _document_adapter(csv, DataType.CSV, summarize)
+        else:
+            kwargs["adapter"] = _UnboundAdapter(source_field="csv")
+        super().__init__(**kwargs)
+        if csv is not None:
+            self.description = f"A tool that can be used to semantic search a query the {csv} CSV's content."
+            self.args_schema = FixedCSVSearchToolSchema
+            self._generate_description()
+
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        return _search(self, search_query, kwargs.get("csv"), DataType.CSV)
+
+
+class CachedWebsiteSearchTool(WebsiteSearchTool):
+    """WebsiteSearchTool over a per-page, reusable index"""
+
+    def __init__(self, website: Optional[str] = None, **kwargs):
+        summarize = kwargs.get("summarize", False)
+        if website is not None:
+            kwargs["adapter"] = _document_adapter(website, DataType.WEB_PAGE, summarize)
+        else:
+            kwargs["adapter"] = _UnboundAdapter(source_field="website")
+        super().__init__(**kwargs)
+        if website is not None:
+            self.description = f"A tool that can be used to semantic search a query from {website} website content."
+            self.args_schema = FixedWebsiteSearchToolSchema
+            self._generate_description()
+
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        return _search(self, search_query, kwargs.get("website"), DataType.WEB_PAGE)
@@ -38,53 +38,35 @@ Notes:
 - Tools assigned to Agent: Available for all tasks (discretionary use)
 - Tools assigned to Task: Exclusively used for that specific task
 """
-import os  # Import os to access environment variables
 from typing import Optional
 
 # Importing necessary tools from crewai_tools
 from crewai_tools import (
     SerperDevTool, 
     ScrapeWebsiteTool, 
-    WebsiteSearchTool, 
-    CSVSearchTool, 
-    DOCXSearchTool, 
-    YoutubeChannelSearchTool, 
-    GithubSearchTool, 
-    PDFSearchTool, 
     DirectoryReadTool
 )
 
-# Importing tools specific to CrewAI
-from CrewAI.tools.travel_guide_tool import TravelGuideTool
-
-# List of tool classes to instantiate
-TOOL_CLASSES = [
-    SerperDevTool,
-    ScrapeWebsiteTool,
-    WebsiteSearchTool,
-    CSVSearchTool,
-    DOCXSearchTool,
-    YoutubeChannelSearchTool,
-    GithubSearchTool,
-    PDFSearchTool,
-    DirectoryReadTool,
-    TravelGuideTool
+# Content research tools, built on first use by the shared tool registry
+from CrewAI.tools.tool_registry import get_tool_registry
+from CrewAI.tools.file_ingestion_tool import FileIngestionTool
+
+CONTENT_TOOL_NAMES = [
+    "serper",
+    "web_scraper",
+    "website_search",
+    "file_reader",
+    "youtube_channel_search",
+    "github_search",
+    "directory_reader",
+    "travel_guide"
 ]
 
 def create_research_tools():
     """
-    Create and return tools for content research.
+    Return the shared tools for content research.
     """
-    # Retrieve the Serper API key from environment variables
-    serper_api_key = os.getenv("SERPER_API_KEY")  # Ensure this environment variable is set
-
-    # Instantiate all tools from the TOOL_CLASSES list
-    research_tools = [
-        tool_class(api_key=serper_api_key) if tool_class == SerperDevTool else tool_class() 
-        for tool_class in TOOL_CLASSES
-    ]
-    
-    return research_tools
+    return get_tool_registry().get_many(CONTENT_TOOL_NAMES)
 
 def create_test_research_tools():
     """
@@ -105,12 +87,11 @@ def create_directory_tools(directory: str):
 def file_reader_tools(file_path: str):
     """
     Create and return tools for reading files.
+
+    One tool covers PDF, DOCX, CSV and text files: the type is detected
+    from the content and the file is extracted and indexed once.
     """
-    return [
-        CSVSearchTool(file_path=file_path),
-        DOCXSearchTool(file_path=file_path),
-        PDFSearchTool(file_path=file_path)
-    ]
+    return [FileIngestionTool(file_path=file_path)]
 
 def search_serper_search_tools(search_query: str, url: Optional[str] = None):
     """
@@ -131,5 +112,4 @@ def get_all_content_tools():
     """
     Get all tools needed for content creation.
     """
-    # Instantiate all tools from the TOOL_CLASSES list
-    return [tool_class() for tool_class in TOOL_CLASSES]
\ No newline at end of file
+    return get_tool_registry().get_many(CONTENT_TOOL_NAMES)
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+File Ingestion
+==============
+
+Type detection and streaming text extraction for uploaded files.
+
+The type comes from the file's leading bytes, not its name:
+
+    %PDF-                     pdf   pages read one at a time (pypdf)
+    PK + word/document.xml    docx  paragraphs streamed from the XML
+    text with a delimiter     csv   rows as "column: value" lines
+    other UTF-8 text          text
+
+Extraction results are cached by content hash, so every tool that reads
+the same file (the file reader, document verification) shares one
+extraction and, through ``tools.rag_index``, one index.
+
+    document = extract_file("uploads/brief.docx")
+    document.file_type, document.text
+
+Environment settings:
+    FILE_INGESTION_CACHE_ENTRIES    Extracted files kept in memory (default 32)
+"""
+
+import csv
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from typing import Iterator, Optional
+from xml.etree import ElementTree
+
+from .rag_index import file_digest
+
+DEFAULT_CACHE_ENTRIES = int(os.getenv("FILE_INGESTION_CACHE_ENTRIES", "32"))
+
+FILE_TYPES = ("pdf", "docx", "csv", "text")
+
+_SNIFF_BYTES = 8192
+_CSV_DELIMITERS = ",;\t|"
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _looks_like_text(sample: bytes) -> bool:
+    if b"\x00" in sample:
+        return False
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is fine
+        return e.start >= len(sample) - 3
+    return True
+
+
+def _looks_like_csv(sample: str) -> bool:
+    lines = [line for line in sample.splitlines()[:20] if line.strip()]
+    if len(lines) < 2:
+        return False
+    try:
+        dialect = csv.Sniffer().sniff("\n".join(lines), delimiters=_CSV_DELIMITERS)
+    except csv.Error:
+        return False
+    widths = {len(row) for row in csv.reader(lines, dialect)}
+    return len(widths) == 1 and widths.pop() > 1
+
+
+def detect_file_type(path: str) -> str:
+    """
+    Type of a file from its content
+
+    Raises:
+        ValueError: If the file is binary and neither PDF nor DOCX
+    """
+    with open(path, "rb") as handle:
+        sample = handle.read(_SNIFF_BYTES)
+
+    if sample.startswith(b"%PDF-"):
+        return "pdf"
+    if sample.startswith(b"PK\x03\x04"):
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return "docx"
+        raise ValueError(f"Unsupported archive format: {path}")
+    if _looks_like_text(sample):
+        text = sample.decode("utf-8", errors="ignore")
+        return "csv" if _looks_like_csv(text) else "text"
+    raise ValueError(f"Unsupported binary file: {path}")
+
+
+def iter_pdf_text(path: str) -> Iterator[str]:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ImportError("Reading PDF files requires pypdf: pip install pypdf")
+
+    for page in PdfReader(path).pages:
+        text = page.extract_text() or ""
+        if text.strip():
+            yield text.strip()
+
+
+def iter_docx_text(path: str) -> Iterator[str]:
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as document:
+        for _, element in ElementTree.iterparse(document, events=("end",)):
+            if element.tag != f"{_WORD_NS}p":
+                continue
+            parts = []
+            for node in element.iter():
+                if node.tag == f"{_WORD_NS}t" and node.text:
+                    parts.append(node.text)
+                elif node.tag == f"{_WORD_NS}tab":
+                    parts.append("\t")
+                elif node.tag in (f"{_WORD_NS}br", f"{_WORD_NS}cr"):
+                    parts.append("\n")
+            text = "".join(parts).strip()
+            if text:
+                yield text
+            element.clear()
+
+
+def iter_csv_text(path: str) -> Iterator[str]:
+    with open(path, newline="", encoding="utf-8", errors="replace") as handle:
+        sample = handle.read(_SNIFF_BYTES)
+        handle.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=_CSV_DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(handle, dialect)
+        header = next(reader, None)
+        if header is None:
+            return
+        for row in reader:
+            if any(cell.strip() for cell in row):
+                yield "; ".join(f"{column}: {value}" for column, value in zip(header, row))
+
+
+def iter_plain_text(path: str) -> Iterator[str]:
+    with open(path, encoding="utf-8", errors="replace") as handle:
+        paragraph = []
+        for line in handle:
+            if line.strip():
+                paragraph.append(line.rstrip("\n"))
+            elif paragraph:
+                yield "\n".join(paragraph)
+                paragraph = []
+        if paragraph:
+            yield "\n".join(paragraph)
+
+
+_READERS = {
+    "pdf": iter_pdf_text,
+    "docx": iter_docx_text,
+    "csv": iter_csv_text,
+    "text": iter_plain_text,
+}
+
+
+def iter_file_text(path: str, file_type: Optional[str] = None) -> Iterator[str]:
+    """Text blocks (pages, paragraphs or rows) of a file, read incrementally"""
+    return _READERS[file_type or detect_file_type(path)](path)
+
+
+class ExtractedFile:
+    """Text extracted from one file"""
+
+    def __init__(self, path: str, digest: str, file_type: str, text: str):
+        self.path = path
+        self.digest = digest
+        self.file_type = file_type
+        self.text = text
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "digest": self.digest,
+            "file_type": self.file_type,
+            "characters": len(self.text)
+        }
+
+
+class ExtractionCache:
+    """
+    Extracted files keyed by content hash, least recently used evicted first
+
+    Concurrent extractions of the same content run once.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ExtractedFile]" = OrderedDict()
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def extract(self, path: str) -> ExtractedFile:
+        digest = file_digest(path)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(digest, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                cached = self._entries.get(digest)
+                if cached is not None:
+                    self._entries.move_to_end(digest)
+                    return cached
+
+            file_type = detect_file_type(path)
+            text = "\n\n".join(iter_file_text(path, file_type))
+            extracted = ExtractedFile(path, digest, file_type, text)
+
+            with self._lock:
+                self._entries[digest] = extracted
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+        return extracted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_extraction_cache: Optional[ExtractionCache] = None
+_extraction_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    global _extraction_cache
+    if _extraction_cache is None:
+        with _extraction_cache_lock:
+            if _extraction_cache is None:
+                _extraction_cache = ExtractionCache()
+    return _extraction_cache
+
+
+def extract_file(path: str) -> ExtractedFile:
+    """Text of a file, extracted once per content"""
+    return get_extraction_cache().extract(path)
@@ -0,0 +1,90 @@
+"""
+File Ingestion Tool
+===================
+
+One semantic search tool for PDF, DOCX, CSV and text files.
+
+The file's type is detected from its content, its text extracted once
+(``tools.file_ingestion``) and embedded into a single collection keyed
+by the file's hash (``tools.rag_index``). This replaces building a CSV,
+a DOCX and a PDF search tool for the same path, which could ingest one
+file three times, twice with the wrong loader.
+
+A tool built with ``file_path`` ingests that file once and keeps its
+search adapter, so queries go straight to the index; a tool built
+without one takes the path with each query.
+"""
+
+from typing import Any, Optional, Tuple, Type
+
+from crewai_tools import BaseTool
+from crewai_tools.adapters.embedchain_adapter import EmbedchainAdapter
+from pydantic.v1 import BaseModel, Field
+
+from .file_ingestion import ExtractedFile, extract_file
+from .rag_index import get_rag_index
+
+
+class FixedFileIngestionToolSchema(BaseModel):
+    """Input for FileIngestionTool with a fixed file"""
+    search_query: str = Field(..., description="Mandatory query you want to use to search the file's content")
+
+
+class FileIngestionToolSchema(FixedFileIngestionToolSchema):
+    """Input for FileIngestionTool"""
+    file_path: str = Field(..., description="Mandatory path of the PDF, DOCX, CSV or text file to search")
+
+
+class FileIngestionTool(BaseTool):
+    """Semantic search over one file's extracted text"""
+    name: str = "Search a file's content"
+    description: str = (
+        "A tool that can be used to semantic search a query from a PDF, DOCX, CSV or text file's content."
+    )
+    args_schema: Type[BaseModel] = FileIngestionToolSchema
+    file_path: Optional[str] = None
+    summarize: bool = False
+    adapter: Optional[Any] = None
+
+    def __init__(self, file_path: Optional[str] = None, **kwargs):
+        super().__init__(file_path=file_path, **kwargs)
+        if file_path is not None:
+            document, app = self.ingest(file_path)
+            if app is not None:
+                self.adapter = EmbedchainAdapter(embedchain_app=app, summarize=self.summarize)
+            self.description = (
+                f"A tool that can be used to semantic search a query the {file_path} "
+                f"{document.file_type.upper()} file's content."
+            )
+            self.args_schema = FixedFileIngestionToolSchema
+            self._generate_description()
+
+    def ingest(self, file_path: str) -> Tuple[ExtractedFile, Any]:
+        """
+        Extract and index a file; both steps run once per content
+
+        Returns:
+            The extracted file and its embedchain app (None if the file has
+            no text)
+        """
+        document = extract_file(file_path)
+        app = None
+        if document.text.strip():
+            app = get_rag_index().get_text_app(document.text, document.digest, file_path)
+        return document, app
+
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        file_path = kwargs.get("file_path") or self.file_path
+        if not file_path:
+            return "No file to search: pass the file_path to search together with the query."
+
+        adapter = self.adapter if file_path == self.file_path else None
+        if adapter is None:
+            try:
+                document, app = self.ingest(file_path)
+            except (OSError, ValueError, ImportError) as e:
+                return f"Could not read {file_path}: {str(e)}"
+            if app is None:
+                return f"No text could be extracted from {file_path} ({document.file_type})."
+            adapter = EmbedchainAdapter(embedchain_app=app, summarize=self.summarize)
+        return f"Relevant Content:\n{adapter.query(search_query)}"
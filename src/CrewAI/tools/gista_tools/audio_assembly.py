@@ -0,0 +1,173 @@
+"""
+Podcast Audio Assembly
+======================
+
+Joins per-segment voiceover files into a single episode MP3.
+
+Segments are concatenated frame by frame without re-encoding: each input
+is read in fixed-size chunks, its ID3 tags and Xing/Info header frame are
+dropped, and the audio frames are copied to the output. Silence for ``//``
+pause markers is made of silent frames matching the surrounding audio, and
+all durations are summed from frame headers, so the reported
+``playback_duration`` values are exact.
+
+Typical flow:
+
+    parts = list(split_on_pauses(parsed_script["segments"]))
+    batch = voiceover.synthesize_batch(parts, output_dir=work_dir)
+    for part, audio in zip(parts, batch["segments"]):
+        part["file_path"] = audio.get("file_path")
+    episode = assemble_episode(parts, "episode.mp3")
+"""
+
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .mp3_frames import FrameHeader, iter_frames, parse_frame_header, silence_frames
+from .transcript_timing import segment_field
+
+PAUSE_MARKER = "//"
+DEFAULT_PAUSE_SECONDS = float(os.getenv("GISTA_PAUSE_SECONDS", "0.6"))
+
+
+def split_on_pauses(
+    segments: Iterable[Any],
+    pause_seconds: float = DEFAULT_PAUSE_SECONDS
+) -> Iterator[Dict[str, Any]]:
+    """
+    Split script segments at ``//`` markers into synthesizable parts
+
+    Each part keeps the voice role and segment type of its segment, the
+    index of the segment it came from, and how much silence should follow
+    it (one ``pause_seconds`` per marker). Parts are yielded as segments
+    are read, so a lazily parsed script can feed synthesis directly; a
+    part is held back only until its trailing pause is known.
+
+    Args:
+        segments: Parsed script segments (objects or dicts)
+        pause_seconds: Silence inserted for each pause marker
+
+    Yields:
+        Part dicts with ``text``, ``voice_role``, ``segment_type``,
+        ``segment_index`` and ``pause_after``
+    """
+    for segment_index, segment in enumerate(segments):
+        pieces = segment_field(segment, "text", "").split(PAUSE_MARKER)
+        previous: Optional[Dict[str, Any]] = None
+        for position, piece in enumerate(pieces):
+            text = piece.strip()
+            has_pause = position < len(pieces) - 1
+            if not text:
+                # Consecutive or leading markers lengthen the previous pause
+                if has_pause and previous is not None:
+                    previous["pause_after"] += pause_seconds
+                continue
+            if previous is not None:
+                yield previous
+            previous = {
+                "text": text,
+                "voice_role": segment_field(segment, "voice_role"),
+                "segment_type": segment_field(segment, "segment_type"),
+                "segment_index": segment_index,
+                "segment_title": segment_field(segment, "section"),
+                "pause_after": pause_seconds if has_pause else 0.0
+            }
+        if previous is not None:
+            yield previous
+
+
+def assemble_episode(
+    parts: Iterable[Dict[str, Any]],
+    output_path: str,
+    gap_seconds: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Concatenate segment audio files into one episode file
+
+    Memory use is constant: frames are streamed from each input file to
+    the output, which is written to a temporary file and moved into place
+    once complete.
+
+    Args:
+        parts: Dicts with ``file_path`` and optional ``pause_after``
+            (seconds), ``segment_index`` and ``segment_title``
+        output_path: Destination MP3 path
+        gap_seconds: Extra silence inserted between consecutive segments
+
+    Returns:
+        Dict with ``file_path``, ``size_bytes``, ``playback_duration`` and
+        per-segment ``segments`` entries (index, title, offset, duration)
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".part")
+
+    segments: Dict[int, Dict[str, Any]] = {}
+    template: Optional[FrameHeader] = None
+    pending_silence = 0.0
+    total_duration = 0.0
+    size_bytes = 0
+    previous_index: Optional[int] = None
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+
+            def write_silence(seconds: float) -> float:
+                nonlocal size_bytes
+                written = 0.0
+                for frame in silence_frames(template, seconds):
+                    out.write(frame)
+                    size_bytes += len(frame)
+                    written += template.samples / template.sample_rate
+                return written
+
+            for position, part in enumerate(parts):
+                segment_index = part.get("segment_index", position)
+                if previous_index is not None and segment_index != previous_index:
+                    pending_silence += gap_seconds
+                previous_index = segment_index
+
+                entry = segments.setdefault(segment_index, {
+                    "segment_index": segment_index,
+                    "segment_title": part.get("segment_title"),
+                    "offset_seconds": None,
+                    "playback_duration": 0.0
+                })
+
+                with open(part["file_path"], "rb") as audio:
+                    for frame in iter_frames(audio):
+                        header = parse_frame_header(frame)
+                        if template is None:
+                            template = header
+                        if pending_silence > 0:
+                            silence = write_silence(pending_silence)
+                            total_duration += silence
+                            pending_silence = 0.0
+                        if entry["offset_seconds"] is None:
+                            entry["offset_seconds"] = total_duration
+                        out.write(frame)
+                        size_bytes += len(frame)
+                        total_duration += header.duration
+                        entry["playback_duration"] += header.duration
+
+                pause = part.get("pause_after") or 0.0
+                if pause > 0 and template is not None:
+                    # Silence is part of the segment it follows
+                    silence = write_silence(pause)
+                    total_duration += silence
+                    entry["playback_duration"] += silence
+
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return {
+        "file_path": output_path,
+        "size_bytes": size_bytes,
+        "playback_duration": total_duration,
+        "segments": [segments[index] for index in sorted(segments)]
+    }
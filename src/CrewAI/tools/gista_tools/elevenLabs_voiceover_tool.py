@@ -8,10 +8,27 @@ Handles both readout and Q&A segments with different voices.
 
 from crewai_tools import BaseTool
 from pydantic.v1 import BaseModel, Field
-from typing import List, Optional, Dict, Type, ClassVar
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Dict, Tuple, Type, ClassVar
+from concurrent.futures import ThreadPoolExecutor
 import os
+from elevenlabs import VoiceSettings
 from elevenlabs.client import ElevenLabs
 
+from .mp3_frames import mp3_duration
+from .tts_cache import TTSAudioCache, get_tts_cache
+from ...utils.http_pool import get_httpx_client
+from ...utils.metrics import context_bound, instrument_tool, record_bytes, record_cache
+
+# Default number of segments synthesized at the same time by synthesize_batch
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("ELEVENLABS_MAX_CONCURRENCY", "4"))
+
+# Per-request TTS timeout in seconds (the SDK's own default). Long segments
+# take far longer than the shared httpx client's generic timeout allows
+TTS_TIMEOUT = float(os.getenv("ELEVENLABS_TIMEOUT", "240"))
+
+# Read size used when replaying cached audio as a stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
 class VoiceoverRequestSchema(BaseModel):
     """Schema for voiceover generation requests"""
     text: str = Field(..., description="Text to convert to speech")
@@ -21,10 +38,15 @@ class VoiceoverRequestSchema(BaseModel):
         default=None, 
         description="IDs of previous segments for prosody continuity"
     )
+    output_path: Optional[str] = Field(
+        default=None,
+        description="Optional file path to stream the audio into"
+    )
 
     class Config:
         orm_mode = True
 
+@instrument_tool
 class ElevenLabsVoiceoverTool(BaseTool):
     """Tool for generating podcast segment voiceovers"""
     
@@ -40,6 +62,9 @@ class ElevenLabsVoiceoverTool(BaseTool):
     # Instance variables need to be declared as class variables with types
     client: Optional[ElevenLabs] = None
     model_id: str = "eleven_monolingual_v1"
+    voice_settings: Optional[Dict[str, float]] = None
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    cache: Optional[TTSAudioCache] = None
 
     # Voice IDs with type annotation
     VOICE_IDS: ClassVar[Dict[str, str]] = {
@@ -56,14 +81,115 @@ class ElevenLabsVoiceoverTool(BaseTool):
         api_key = os.getenv("ELEVENLABS_API_KEY")
         if not api_key:
             raise ValueError("ELEVENLABS_API_KEY environment variable not set")
-        self.client = ElevenLabs(api_key=api_key)
+        # Instances share one pooled (HTTP/2 when available) connection pool;
+        # the SDK sends its timeout with each request, overriding the pool's
+        self.client = ElevenLabs(api_key=api_key, httpx_client=get_httpx_client(), timeout=TTS_TIMEOUT)
+        self.cache = get_tts_cache()
+
+    def _cache_key(self, text: str, voice_id: str) -> str:
+        """Cache key for a text/voice pair under the current model settings"""
+        return TTSAudioCache.make_key(
+            text=text,
+            voice_id=voice_id,
+            model_id=self.model_id,
+            voice_settings=self.voice_settings
+        )
+
+    def _resolve_voice_id(self, voice_role: str) -> str:
+        voice_id = self.VOICE_IDS.get(voice_role)
+        if not voice_id:
+            raise ValueError(f"Invalid voice role: {voice_role}")
+        return voice_id
+
+    def _open_audio_stream(self, text: str, voice_id: str) -> Tuple[Iterator[bytes], bool]:
+        """
+        Open a chunk iterator for the requested audio
+
+        Cached audio is read back from disk. Otherwise the ElevenLabs
+        response is streamed and written to the cache as it passes through.
+
+        Returns:
+            Tuple of (chunk iterator, whether the audio came from the cache)
+        """
+        cache_key = self._cache_key(text, voice_id)
+        cached_path = self.cache.get_path(cache_key) if self.cache else None
+        record_cache("tts", cached_path is not None)
+        if cached_path is not None:
+            return self._read_file_chunks(cached_path), True
+
+        if not self.client:
+            raise ValueError("ElevenLabs client not initialized")
+
+        # Send every setting that is part of the cache key, so cached audio
+        # always matches what the API would return
+        options: Dict[str, Any] = {"model": self.model_id}
+        if self.voice_settings:
+            options["voice_settings"] = VoiceSettings(**self.voice_settings)
+        response = self._count_bytes(self.client.generate(
+            text=text,
+            voice=voice_id,
+            **options
+        ))
+        if not self.cache:
+            return iter(response), False
+        return self._tee_to_cache(response, cache_key), False
+
+    @staticmethod
+    def _count_bytes(response: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass chunks through, recording the bytes downloaded from ElevenLabs"""
+        size_bytes = 0
+        try:
+            for chunk in response:
+                size_bytes += len(chunk)
+                yield chunk
+        finally:
+            record_bytes("elevenlabs", size_bytes)
+
+    def _tee_to_cache(self, response: Iterable[bytes], cache_key: str) -> Iterator[bytes]:
+        """Yield response chunks, committing them to the cache once complete"""
+        writer = self.cache.open_writer(cache_key)
+        try:
+            for chunk in response:
+                writer.write(chunk)
+                yield chunk
+        except BaseException:
+            # Failed or abandoned streams never become cache entries
+            writer.abort()
+            raise
+        writer.commit()
+
+    @staticmethod
+    def _read_file_chunks(path: str) -> Iterator[bytes]:
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def _write_audio(self, text: str, voice_id: str, output_path: str) -> Dict:
+        """Stream audio for ``text`` straight into ``output_path``"""
+        chunks, cached = self._open_audio_stream(text, voice_id)
+        size_bytes = 0
+        with open(output_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size_bytes += len(chunk)
+
+        return {
+            "file_path": output_path,
+            "size_bytes": size_bytes,
+            "duration_seconds": mp3_duration(output_path),
+            "cached": cached
+        }
 
     def _run(
         self, 
         text: str,
         voice_role: str,
         segment_type: str,
-        previous_segment_ids: Optional[List[str]] = None
+        previous_segment_ids: Optional[List[str]] = None,
+        output_path: Optional[str] = None
     ) -> Dict:
         """
         Generate voiceover for a segment
@@ -73,30 +199,34 @@ class ElevenLabsVoiceoverTool(BaseTool):
             voice_role: Role of the voice (host/expert)
             segment_type: Type of segment (readout/qa)
             previous_segment_ids: Optional IDs of previous segments
+            output_path: Optional file to stream the audio into. When set,
+                the result holds the file path, size and duration instead
+                of the audio bytes.
         """
+        segment_info = {
+            "type": segment_type,
+            "role": voice_role
+        }
         try:
             if not self.client:
                 raise ValueError("ElevenLabs client not initialized")
-            voice_id = self.VOICE_IDS.get(voice_role)
-            if not voice_id:
-                raise ValueError(f"Invalid voice role: {voice_role}")
-
-            # Generate audio using the client with minimal parameters
-            response = self.client.generate(
-                text=text,
-                voice=voice_id
-            )
+            voice_id = self._resolve_voice_id(voice_role)
+            segment_info["length"] = len(text)
+
+            if output_path:
+                written = self._write_audio(text, voice_id, output_path)
+                segment_info["cached"] = written.pop("cached")
+                return {**written, "segment_info": segment_info}
+
+            chunks, cached = self._open_audio_stream(text, voice_id)
 
             # Convert generator to bytes
-            audio_data = b''.join(response)
+            audio_data = b''.join(chunks)
+            segment_info["cached"] = cached
 
             return {
                 "audio": audio_data,
-                "segment_info": {
-                    "type": segment_type,
-                    "role": voice_role,
-                    "length": len(text)
-                }
+                "segment_info": segment_info
             }
 
         except Exception as e:
@@ -108,6 +238,138 @@ class ElevenLabsVoiceoverTool(BaseTool):
                 }
             }
 
+    def synthesize_to_file(
+        self,
+        text: str,
+        voice_role: str,
+        segment_type: str,
+        output_path: str
+    ) -> Dict:
+        """
+        Stream a segment's audio to disk as it arrives
+
+        Returns:
+            Dict with ``file_path``, ``size_bytes``, ``duration_seconds`` and
+            ``segment_info`` (or ``error``)
+        """
+        return self._run(
+            text=text,
+            voice_role=voice_role,
+            segment_type=segment_type,
+            output_path=output_path
+        )
+
+    def stream_to(self, sink: BinaryIO, text: str, voice_role: str) -> Dict:
+        """
+        Write a segment's audio chunks into a file-like sink as they arrive
+
+        Args:
+            sink: Writable binary object (socket wrapper, buffer, open file)
+            text: The text to convert to speech
+            voice_role: Role of the voice (host/expert/readout)
+
+        Returns:
+            Dict with ``size_bytes`` and ``cached``
+        """
+        chunks, cached = self._open_audio_stream(text, self._resolve_voice_id(voice_role))
+        size_bytes = 0
+        for chunk in chunks:
+            sink.write(chunk)
+            size_bytes += len(chunk)
+        return {
+            "size_bytes": size_bytes,
+            "cached": cached
+        }
+
+    def iter_audio(self, text: str, voice_role: str) -> Iterator[bytes]:
+        """
+        Yield audio chunks while synthesis is still running
+
+        Suitable for relaying audio through a streaming HTTP response,
+        e.g. ``Response(tool.iter_audio(text, "host"), mimetype="audio/mpeg")``.
+        """
+        chunks, _ = self._open_audio_stream(text, self._resolve_voice_id(voice_role))
+        return chunks
+
+    def synthesize_batch(
+        self,
+        segments: Iterable[Any],
+        max_concurrency: Optional[int] = None,
+        output_dir: Optional[str] = None
+    ) -> Dict:
+        """
+        Generate voiceovers for many segments concurrently
+
+        Segments are submitted to a bounded thread pool as they are read
+        from ``segments``, so a lazily parsed script can start synthesis
+        before parsing finishes. Results keep the input order, and a failed
+        segment is reported in place without failing the whole batch.
+
+        Args:
+            segments: Parsed segments (objects or dicts) with ``text``,
+                ``voice_role`` and ``segment_type``
+            max_concurrency: Maximum parallel API calls (defaults to
+                ``max_concurrency`` / ELEVENLABS_MAX_CONCURRENCY)
+            output_dir: Optional directory to stream each segment into as
+                ``segment_<index>.mp3``; results then carry file paths and
+                durations instead of audio bytes
+
+        Returns:
+            Dict with ordered ``segments``, ``failed_indices`` and an overall
+            ``status`` of success, partial or error
+        """
+        workers = max(1, max_concurrency or self.max_concurrency)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gista-tts") as executor:
+            futures = [
+                executor.submit(context_bound(self._synthesize_segment), index, segment, output_dir)
+                for index, segment in enumerate(segments)
+            ]
+            results = [future.result() for future in futures]
+
+        failed_indices = [
+            result["segment_info"]["index"] for result in results if "error" in result
+        ]
+        if not failed_indices:
+            status = "success"
+        elif len(failed_indices) < len(results):
+            status = "partial"
+        else:
+            status = "error"
+
+        return {
+            "status": status,
+            "segments": results,
+            "failed_indices": failed_indices
+        }
+
+    def _synthesize_segment(self, index: int, segment: Any, output_dir: Optional[str] = None) -> Dict:
+        """Synthesize one batch entry, tagging the result with its index"""
+        fields = segment if isinstance(segment, dict) else {
+            "text": getattr(segment, "text", None),
+            "voice_role": getattr(segment, "voice_role", None),
+            "segment_type": getattr(segment, "segment_type", None)
+        }
+        try:
+            result = self._run(
+                text=fields["text"],
+                voice_role=fields["voice_role"],
+                segment_type=fields["segment_type"],
+                output_path=(
+                    os.path.join(output_dir, f"segment_{index:03d}.mp3") if output_dir else None
+                )
+            )
+        except Exception as e:
+            result = {
+                "error": str(e),
+                "segment_info": {
+                    "type": fields.get("segment_type"),
+                    "role": fields.get("voice_role")
+                }
+            }
+        result["segment_info"]["index"] = index
+        return result
+
     def generate_conversation(
         self,
         qa_pairs: List[Dict[str, str]],
@@ -116,39 +378,38 @@ class ElevenLabsVoiceoverTool(BaseTool):
         """
         Generate a complete Q&A conversation
 
+        Host questions and expert answers are synthesized concurrently
+        through ``synthesize_batch`` and returned in conversation order.
+
         Args:
             qa_pairs: List of Q&A pairs with host questions and expert answers
             previous_ids: Optional IDs from previous segments
         """
-        conversation_segments = []
-        current_ids = previous_ids or []
-
+        conversation_turns = []
         for pair in qa_pairs:
-            # Generate host question
-            question_audio = self._run(
-                text=pair["question"],
-                voice_role="host",
-                segment_type="qa",
-                previous_segment_ids=current_ids
-            )
-            if "error" not in question_audio:
-                current_ids.append(question_audio["segment_info"]["request_id"])
-            conversation_segments.append(question_audio)
-
-            # Generate expert answer
-            answer_audio = self._run(
-                text=pair["answer"],
-                voice_role="expert",
-                segment_type="qa",
-                previous_segment_ids=current_ids
-            )
-            if "error" not in answer_audio:
-                current_ids.append(answer_audio["segment_info"]["request_id"])
-            conversation_segments.append(answer_audio)
+            conversation_turns.append({
+                "text": pair["question"],
+                "voice_role": "host",
+                "segment_type": "qa"
+            })
+            conversation_turns.append({
+                "text": pair["answer"],
+                "voice_role": "expert",
+                "segment_type": "qa"
+            })
+
+        batch = self.synthesize_batch(conversation_turns)
+
+        current_ids = list(previous_ids or [])
+        for segment in batch["segments"]:
+            request_id = segment["segment_info"].get("request_id")
+            if "error" not in segment and request_id:
+                current_ids.append(request_id)
 
         return {
-            "segments": conversation_segments,
-            "segment_ids": current_ids
+            "segments": batch["segments"],
+            "segment_ids": current_ids,
+            "failed_indices": batch["failed_indices"]
         }
 
     def get_voiceover_implementation_guidelines(self) -> Dict:
@@ -246,6 +507,35 @@ class ElevenLabsVoiceoverTool(BaseTool):
                         )
                     """
                 },
+                "streaming": {
+                    "method": "synthesize_to_file / iter_audio / stream_to",
+                    "parameters": {
+                        "text": "Content to be converted to speech",
+                        "voice_role": "Role of the speaker (host/expert/readout)",
+                        "output_path": "File the chunks are written to as they arrive"
+                    },
+                    "example": """
+                        tool.synthesize_to_file(
+                            text="Welcome to Gista.",
+                            voice_role="host",
+                            segment_type="qa",
+                            output_path="segment_000.mp3"
+                        )
+                    """
+                },
+                "batch": {
+                    "method": "synthesize_batch",
+                    "parameters": {
+                        "segments": "Parsed segments with text, voice_role and segment_type",
+                        "max_concurrency": "Optional cap on parallel API calls"
+                    },
+                    "example": """
+                        tool.synthesize_batch(
+                            segments=parsed_script["segments"],
+                            max_concurrency=4
+                        )
+                    """
+                },
                 "conversation": {
                     "method": "generate_conversation",
                     "parameters": {
@@ -316,22 +606,17 @@ class ElevenLabsVoiceoverTool(BaseTool):
             # Use provided voice_id or default to host voice
             voice_id = voice_id or self.VOICE_IDS["host"]
             
-            # Generate audio using the client with minimal parameters
-            response = self.client.generate(
-                text=text,
-                voice=voice_id
-            )
-
-            # Save the audio to file - handle generator response
-            with open(output_path, 'wb') as f:
-                for chunk in response:
-                    f.write(chunk)
+            # Stream the audio to file as it arrives (or copy it from the cache)
+            written = self._write_audio(text, voice_id, output_path)
 
             return {
                 "status": "success",
                 "file_path": output_path,
                 "message": f"Audio file saved to {output_path}",
-                "voice_id": voice_id
+                "voice_id": voice_id,
+                "size_bytes": written["size_bytes"],
+                "duration_seconds": written["duration_seconds"],
+                "cached": written["cached"]
             }
 
         except Exception as e:
@@ -0,0 +1,226 @@
+"""
+MP3 Frame Utilities
+===================
+
+Minimal MPEG audio frame parsing used by the voiceover and assembly tools.
+
+Durations are computed by walking frame headers (no decoding), which is
+exact for the CBR/VBR MP3 streams returned by ElevenLabs. Leading ID3v2
+tags and a trailing ID3v1 tag are skipped, and Xing/Info header frames
+are recognised so they are not counted as audio.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+# Bitrates in kbps indexed by [version_key][layer][bitrate_index]
+# version_key: 1 for MPEG-1, 2 for MPEG-2 and MPEG-2.5
+_BITRATES = {
+    1: {
+        1: [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+        2: [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+        3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    },
+    2: {
+        1: [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+        2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+        3: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    },
+}
+
+# Sample rates indexed by version bits (0: MPEG-2.5, 2: MPEG-2, 3: MPEG-1)
+_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000],
+}
+
+_LAYERS = {3: 1, 2: 2, 1: 3}
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class FrameHeader:
+    """Decoded 4-byte MPEG audio frame header"""
+
+    __slots__ = (
+        "raw", "version_bits", "layer", "bitrate_kbps", "sample_rate",
+        "padding", "channel_mode", "frame_length", "samples"
+    )
+
+    def __init__(self, raw: bytes, version_bits: int, layer: int, bitrate_kbps: int,
+                 sample_rate: int, padding: int, channel_mode: int):
+        self.raw = raw
+        self.version_bits = version_bits
+        self.layer = layer
+        self.bitrate_kbps = bitrate_kbps
+        self.sample_rate = sample_rate
+        self.padding = padding
+        self.channel_mode = channel_mode
+
+        is_mpeg1 = version_bits == 3
+        if layer == 1:
+            self.samples = 384
+            self.frame_length = (12 * bitrate_kbps * 1000 // sample_rate + padding) * 4
+        elif layer == 2 or is_mpeg1:
+            self.samples = 1152
+            self.frame_length = 144 * bitrate_kbps * 1000 // sample_rate + padding
+        else:
+            self.samples = 576
+            self.frame_length = 72 * bitrate_kbps * 1000 // sample_rate + padding
+
+    @property
+    def duration(self) -> float:
+        """Playback duration of this frame in seconds"""
+        return self.samples / self.sample_rate
+
+    @property
+    def side_info_length(self) -> int:
+        """Size of the Layer III side information following the header"""
+        mono = self.channel_mode == 3
+        if self.version_bits == 3:
+            return 17 if mono else 32
+        return 9 if mono else 17
+
+
+def parse_frame_header(data: bytes) -> Optional[FrameHeader]:
+    """
+    Decode a frame header from the first four bytes of ``data``
+
+    Returns:
+        FrameHeader, or None if the bytes are not a valid header
+    """
+    if len(data) < 4 or data[0] != 0xFF or (data[1] & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (data[1] >> 3) & 0x03
+    layer_bits = (data[1] >> 1) & 0x03
+    bitrate_index = (data[2] >> 4) & 0x0F
+    sample_rate_index = (data[2] >> 2) & 0x03
+
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    layer = _LAYERS[layer_bits]
+    version_key = 1 if version_bits == 3 else 2
+    return FrameHeader(
+        raw=bytes(data[:4]),
+        version_bits=version_bits,
+        layer=layer,
+        bitrate_kbps=_BITRATES[version_key][layer][bitrate_index],
+        sample_rate=_SAMPLE_RATES[version_bits][sample_rate_index],
+        padding=(data[2] >> 1) & 0x01,
+        channel_mode=(data[3] >> 6) & 0x03
+    )
+
+
+def _id3v2_size(data: bytes) -> int:
+    """Total size of an ID3v2 tag at the start of ``data`` (0 if absent)"""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def is_info_frame(header: FrameHeader, frame: bytes) -> bool:
+    """True if the frame carries a Xing/Info/VBRI header rather than audio"""
+    offset = 4 + header.side_info_length
+    marker = frame[offset:offset + 4]
+    return marker in (b"Xing", b"Info") or frame[36:40] == b"VBRI"
+
+
+def iter_frames(stream: BinaryIO, skip_info_frame: bool = True) -> Iterator[bytes]:
+    """
+    Yield complete MPEG audio frames from a binary stream
+
+    Reads in fixed-size chunks, so memory use does not depend on file size.
+
+    Args:
+        stream: Binary file-like object positioned at the start of the audio
+        skip_info_frame: Drop a leading Xing/Info/VBRI header frame
+    """
+    buffer = bytearray(stream.read(READ_CHUNK_SIZE))
+    eof = len(buffer) < READ_CHUNK_SIZE
+
+    def fill(needed: int) -> bool:
+        nonlocal eof
+        while len(buffer) < needed and not eof:
+            chunk = stream.read(READ_CHUNK_SIZE)
+            if not chunk:
+                eof = True
+                break
+            buffer.extend(chunk)
+        return len(buffer) >= needed
+
+    fill(10)
+    tag_size = _id3v2_size(bytes(buffer[:10]))
+    while tag_size > 0:
+        if not fill(tag_size):
+            return
+        del buffer[:tag_size]
+        fill(10)
+        tag_size = _id3v2_size(bytes(buffer[:10]))
+
+    first = True
+    while fill(4):
+        header = parse_frame_header(bytes(buffer[:4]))
+        if header is None or header.frame_length < 4:
+            # Resynchronise on the next byte (also skips a trailing ID3v1 tag)
+            del buffer[:1]
+            continue
+
+        if not fill(header.frame_length):
+            return
+        frame = bytes(buffer[:header.frame_length])
+        del buffer[:header.frame_length]
+
+        if first and skip_info_frame and is_info_frame(header, frame):
+            first = False
+            continue
+        first = False
+        yield frame
+
+
+def mp3_duration(source: Union[str, Path, BinaryIO]) -> float:
+    """
+    Exact duration in seconds of an MP3 file or stream, from frame headers
+
+    Args:
+        source: File path or binary file-like object
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            return mp3_duration(f)
+
+    total = 0.0
+    for frame in iter_frames(source):
+        header = parse_frame_header(frame)
+        total += header.duration
+    return total
+
+
+def silent_frame(template: FrameHeader) -> bytes:
+    """
+    Build a Layer III frame that decodes to silence
+
+    The frame reuses the template's version, bitrate, sample rate and
+    channel mode (without padding). Zeroed side information means no
+    Huffman data is coded, which decoders render as digital silence.
+    """
+    raw = bytearray(template.raw)
+    raw[1] |= 0x01  # no CRC
+    raw[2] &= ~0x02 & 0xFF  # no padding
+    header = parse_frame_header(bytes(raw))
+    return bytes(raw) + bytes(header.frame_length - 4)
+
+
+def silence_frames(template: FrameHeader, seconds: float) -> Iterator[bytes]:
+    """Yield enough silent frames to cover ``seconds`` of playback"""
+    frame = silent_frame(template)
+    frame_duration = parse_frame_header(frame).duration
+    count = int(round(seconds / frame_duration))
+    for _ in range(count):
+        yield frame
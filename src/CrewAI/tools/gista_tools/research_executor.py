@@ -0,0 +1,163 @@
+"""
+Concurrent Research Executor
+============================
+
+Runs independent research source calls (Serper queries, page scrapes,
+site searches) in parallel with a per-source timeout and a global
+deadline.
+
+Each call gets its own time budget measured from when it starts; the run
+as a whole never exceeds the deadline. Sources that are still running
+when their budget expires are reported as timed out and the run returns
+the results it has, so one slow site cannot hold up the rest. The worker
+pool is created per run and shut down without waiting, which means a
+timed-out call may finish in the background but its result is discarded.
+
+Example:
+    executor = ConcurrentResearchExecutor(source_timeout=5, deadline=15)
+    outcomes = executor.run([
+        (("news", "reuters"), lambda: serper._run(search_query="site:reuters.com AI")),
+        (("news", "bbc"), lambda: serper._run(search_query="site:bbc.com AI")),
+    ])
+    outcomes[("news", "bbc")].value_or_error()
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from ...utils.metrics import context_bound
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_TIMEOUT = "timeout"
+
+DEFAULT_MAX_WORKERS = int(os.getenv("RESEARCH_MAX_WORKERS", "8"))
+DEFAULT_SOURCE_TIMEOUT = float(os.getenv("RESEARCH_SOURCE_TIMEOUT", "10"))
+DEFAULT_DEADLINE = float(os.getenv("RESEARCH_DEADLINE", "25"))
+
+ResearchCall = Tuple[Hashable, Callable[[], Any]]
+
+
+class SourceOutcome:
+    """Result of one research source call"""
+
+    __slots__ = ("key", "status", "value", "error", "elapsed")
+
+    def __init__(self, key: Hashable, status: str, value: Any = None,
+                 error: Optional[str] = None, elapsed: float = 0.0):
+        self.key = key
+        self.status = status
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OUTCOME_OK
+
+    def value_or_error(self) -> Any:
+        """The call's value, or an "Error: ..." string like the tools return"""
+        if self.ok:
+            return self.value
+        return f"Error: {self.error}"
+
+
+class ConcurrentResearchExecutor:
+    """Fan research calls out over a bounded, per-run thread pool"""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        source_timeout: float = DEFAULT_SOURCE_TIMEOUT,
+        deadline: float = DEFAULT_DEADLINE
+    ):
+        """
+        Args:
+            max_workers: Maximum number of calls in flight
+            source_timeout: Seconds each call may run once started
+            deadline: Seconds the whole run may take
+        """
+        self.max_workers = max(1, max_workers)
+        self.source_timeout = source_timeout
+        self.deadline = deadline
+
+    def run(self, calls: Iterable[ResearchCall]) -> Dict[Hashable, SourceOutcome]:
+        """
+        Execute calls concurrently and collect their outcomes
+
+        Args:
+            calls: (key, zero-argument callable) pairs; keys must be unique
+
+        Returns:
+            Dict mapping each key to its SourceOutcome, in submission order
+        """
+        calls = list(calls)
+        if not calls:
+            return {}
+
+        run_deadline = time.monotonic() + self.deadline
+        outcomes: Dict[Hashable, SourceOutcome] = {}
+        started: Dict[Hashable, float] = {}
+        pending: Dict[Future, Hashable] = {}
+
+        def timed(key: Hashable, fn: Callable[[], Any]) -> Any:
+            started[key] = time.monotonic()
+            return fn()
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(calls)),
+            thread_name_prefix="gista-research"
+        )
+        try:
+            for key, fn in calls:
+                pending[pool.submit(context_bound(timed), key, fn)] = key
+
+            while pending:
+                now = time.monotonic()
+                # Queued calls have not started, so only the run deadline applies to them
+                expiries = [
+                    min(started[key] + self.source_timeout, run_deadline) if key in started else run_deadline
+                    for key in pending.values()
+                ]
+                timeout = max(0.0, min(expiries) - now)
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    key = pending.pop(future)
+                    elapsed = time.monotonic() - started.get(key, now)
+                    try:
+                        outcomes[key] = SourceOutcome(key, OUTCOME_OK, future.result(), elapsed=elapsed)
+                    except Exception as e:
+                        outcomes[key] = SourceOutcome(key, OUTCOME_ERROR, error=str(e), elapsed=elapsed)
+
+                now = time.monotonic()
+                for future, key in list(pending.items()):
+                    began = started.get(key)
+                    if now >= run_deadline or (began is not None and now - began >= self.source_timeout):
+                        future.cancel()
+                        del pending[future]
+                        limit = self.source_timeout if began is not None and now < run_deadline else self.deadline
+                        outcomes[key] = SourceOutcome(
+                            key,
+                            OUTCOME_TIMEOUT,
+                            error=f"timed out after {limit:g}s",
+                            elapsed=now - began if began is not None else 0.0
+                        )
+        finally:
+            # Do not wait for timed-out calls; their results are discarded
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return {key: outcomes[key] for key, _ in calls}
+
+
+_default_executor: Optional[ConcurrentResearchExecutor] = None
+
+
+def get_research_executor() -> ConcurrentResearchExecutor:
+    """Executor configured from RESEARCH_* environment settings"""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ConcurrentResearchExecutor()
+    return _default_executor
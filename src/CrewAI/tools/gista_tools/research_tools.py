@@ -0,0 +1,286 @@
+"""
+Gista Research Tools
+====================
+
+Website-specific research tools for Gista tasks (Wikipedia, dictionaries,
+academic sources, technical docs, news and general web search).
+
+Tools are built through the tool registry, which imports this module on
+first use; crewai_tools is only loaded then, and the embedchain-backed
+website search only when the Wikipedia tool is built.
+"""
+
+from crewai_tools import BaseTool
+from typing import Any, ClassVar, Dict, Type
+from pydantic.v1 import BaseModel, Field
+
+from ..search_cache import cached_scrape, cached_search
+from ..tool_registry import get_tool
+from .research_executor import SourceOutcome, get_research_executor
+from ...utils.metrics import instrument_tool
+
+# Base Schema
+class WebResearchSchema(BaseModel):
+    """Base schema for web research tools"""
+    query: str = Field(..., description="Search query")
+    max_results: int = Field(default=5, description="Maximum number of results to return")
+    language: str = Field(default="en", description="Language for results")
+
+    class Config:
+        orm_mode = True
+
+# Specialized Research Tools
+@instrument_tool
+class WikipediaResearchTool(BaseTool):
+    """Specialized tool for Wikipedia research"""
+    name: str = "Wikipedia Research Tool"
+    description: str = "Searches and extracts information from Wikipedia"
+    args_schema: Type[BaseModel] = WebResearchSchema
+    base_url: str = "https://wikipedia.org"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Initialize with fixed URLs for Wikipedia
+        # Loads embedchain, so only imported when this tool is built
+        from ..cached_rag_tools import CachedWebsiteSearchTool
+
+        self._scraper = get_tool("web_scraper")
+        self._web_search = CachedWebsiteSearchTool(website=self.base_url)
+
+    def _run(self, query: str, max_results: int = 5, language: str = "en") -> dict:
+        """Search Wikipedia and extract relevant information"""
+        calls = self.research_calls(query, max_results, language)
+        return self.combine_results(get_research_executor().run(calls))
+
+    def research_calls(self, query: str, max_results: int = 5, language: str = "en") -> list:
+        """Independent source calls for the research executor"""
+        return [("wikipedia", lambda: self._search_and_scrape(query, max_results, language))]
+
+    def combine_results(self, outcomes: Dict[str, SourceOutcome]) -> dict:
+        outcome = outcomes["wikipedia"]
+        if not outcome.ok:
+            return {"search_results": outcome.value_or_error(), "detailed_content": {}}
+        return outcome.value
+
+    def _search_and_scrape(self, query: str, max_results: int, language: str) -> dict:
+        # Scraping depends on the search hits, so this source stays sequential
+        wiki_url = f"https://{language}.wikipedia.org/wiki/"
+        search_results = self._web_search._run(
+            search_query=f"site:wikipedia.org {query}"
+        )
+        
+        detailed_content = {}
+        for url in search_results[:max_results]:
+            if wiki_url in url:
+                try:
+                    detailed_content[url] = cached_scrape(self._scraper, url)
+                except Exception as e:
+                    # One missing page should not discard the others
+                    detailed_content[url] = f"Error: {str(e)}"
+
+        return {
+            "search_results": search_results,
+            "detailed_content": detailed_content
+        }
+
+@instrument_tool
+class DictionaryTool(BaseTool):
+    """Tool for dictionary lookups using multiple sources"""
+    name: str = "Dictionary Tool"
+    description: str = "Looks up terms in various dictionaries"
+    args_schema: Type[BaseModel] = WebResearchSchema
+    
+    DICTIONARY_SOURCES: ClassVar[Dict[str, str]] = {
+        "merriam_webster": "https://www.merriam-webster.com/dictionary/",
+        "oxford": "https://www.lexico.com/definition/",
+        "cambridge": "https://dictionary.cambridge.org/dictionary/english/"
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._scraper = get_tool("web_scraper")
+        self._web_search = get_tool("website_search")
+
+    def _run(self, query: str, max_results: int = 3, language: str = "en") -> dict:
+        """
+        Look up terms in multiple dictionaries
+        """
+        calls = self.research_calls(query, max_results, language)
+        return self.combine_results(get_research_executor().run(calls))
+
+    def research_calls(self, query: str, max_results: int = 3, language: str = "en") -> list:
+        """Independent source calls for the research executor"""
+        term = query.lower().replace(' ', '-')
+        return [
+            (source, lambda url=f"{base_url}{term}": cached_scrape(self._scraper, url))
+            for source, base_url in self.DICTIONARY_SOURCES.items()
+        ]
+
+    def combine_results(self, outcomes: Dict[str, SourceOutcome]) -> dict:
+        return {"definitions": {source: outcome.value_or_error() for source, outcome in outcomes.items()}}
+
+@instrument_tool
+class AcademicSearchTool(BaseTool):
+    """Tool for academic and scholarly research"""
+    name: str = "Academic Search Tool"
+    description: str = "Searches academic sources and research papers"
+    args_schema: Type[BaseModel] = WebResearchSchema
+    
+    ACADEMIC_SOURCES: ClassVar[Dict[str, str]] = {
+        "google_scholar": "https://scholar.google.com",
+        "semantic_scholar": "https://www.semanticscholar.org",
+        "arxiv": "https://arxiv.org/search/"
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._serper_tool = get_tool("serper")
+        self._web_search = get_tool("website_search")
+
+    def _run(self, query: str, max_results: int = 5, language: str = "en") -> dict:
+        """
+        Search academic sources for scholarly content
+        """
+        calls = self.research_calls(query, max_results, language)
+        return self.combine_results(get_research_executor().run(calls))
+
+    def research_calls(self, query: str, max_results: int = 5, language: str = "en") -> list:
+        """Independent source calls for the research executor"""
+        return [
+            (source, lambda q=f"site:{site} {query}": cached_search(self._serper_tool, q, "academic"))
+            for source, site in self.ACADEMIC_SOURCES.items()
+        ]
+
+    def combine_results(self, outcomes: Dict[str, SourceOutcome]) -> dict:
+        return {"academic_results": {source: outcome.value_or_error() for source, outcome in outcomes.items()}}
+
+@instrument_tool
+class TechnicalDocsTool(BaseTool):
+    """Tool for searching technical documentation"""
+    name: str = "Technical Documentation Tool"
+    description: str = "Searches technical documentation and references"
+    args_schema: Type[BaseModel] = WebResearchSchema
+    
+    TECH_SOURCES: ClassVar[Dict[str, str]] = {
+        "stack_overflow": "https://stackoverflow.com/search?q=",
+        "developer_mozilla": "https://developer.mozilla.org/en-US/search?q=",
+        "github": "https://github.com/search?q=",
+        "readthedocs": "https://readthedocs.org/search/?q="
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._web_search = get_tool("website_search")
+        self._scraper = get_tool("web_scraper")
+
+    def _run(self, query: str, max_results: int = 5, language: str = "en") -> dict:
+        """
+        Search technical documentation sources
+        """
+        calls = self.research_calls(query, max_results, language)
+        return self.combine_results(get_research_executor().run(calls))
+
+    def research_calls(self, query: str, max_results: int = 5, language: str = "en") -> list:
+        """Independent source calls for the research executor"""
+        return [
+            (source, lambda q=f"site:{base_url} {query}": self._web_search._run(search_query=q))
+            for source, base_url in self.TECH_SOURCES.items()
+        ]
+
+    def combine_results(self, outcomes: Dict[str, SourceOutcome]) -> dict:
+        return {"technical_results": {source: outcome.value_or_error() for source, outcome in outcomes.items()}}
+
+@instrument_tool
+class NewsResearchTool(BaseTool):
+    """Tool for news and current events research"""
+    name: str = "News Research Tool"
+    description: str = "Searches news sources for current information"
+    args_schema: Type[BaseModel] = WebResearchSchema
+    
+    NEWS_SOURCES: ClassVar[Dict[str, str]] = {
+        "reuters": "https://www.reuters.com",
+        "ap_news": "https://apnews.com",
+        "bbc": "https://www.bbc.com/news",
+        "bloomberg": "https://www.bloomberg.com"
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._serper_tool = get_tool("serper")
+
+    def _run(self, query: str, max_results: int = 5, language: str = "en") -> dict:
+        """
+        Search reputable news sources
+        """
+        calls = self.research_calls(query, max_results, language)
+        return self.combine_results(get_research_executor().run(calls))
+
+    def research_calls(self, query: str, max_results: int = 5, language: str = "en") -> list:
+        """Independent source calls for the research executor"""
+        return [
+            (source, lambda q=f"site:{site} {query}": cached_search(self._serper_tool, q, "news"))
+            for source, site in self.NEWS_SOURCES.items()
+        ]
+
+    def combine_results(self, outcomes: Dict[str, SourceOutcome]) -> dict:
+        return {"news_results": {source: outcome.value_or_error() for source, outcome in outcomes.items()}}
+
+@instrument_tool
+class EnhancedWebSearchTool(BaseTool):
+    """Enhanced web search tool with better error handling and formatting"""
+    name: str = "Enhanced Web Search"
+    description: str = "An advanced tool that searches the internet using Google Search API to find relevant information about any topic, with improved error handling and result formatting."
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._serper_tool = get_tool("serper")
+
+    def _run(
+        self,
+        query: str,
+        max_results: int = 5,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Execute the web search with enhanced error handling and formatting
+        
+        Args:
+            query: The search query
+            max_results: Maximum number of results to return
+            
+        Returns:
+            Formatted string containing search results or error message
+        """
+        try:
+            # Use the base SerperDevTool to perform the search
+            raw_results = cached_search(self._serper_tool, query, "web_search")
+            
+            # If we got an error message back
+            if isinstance(raw_results, str) and "error" in raw_results.lower():
+                return raw_results
+                
+            # Extract and format the results
+            formatted_results = []
+            result_lines = raw_results.split('\n')
+            
+            current_result = []
+            for line in result_lines:
+                if line.strip() == "---":
+                    if current_result:
+                        formatted_results.append('\n'.join(current_result))
+                        current_result = []
+                    if len(formatted_results) >= max_results:
+                        break
+                elif line.strip():
+                    current_result.append(line)
+            
+            if not formatted_results:
+                return f"No results found for query: {query}"
+            
+            return (
+                f"\nTop {len(formatted_results)} search results for '{query}':\n\n" +
+                "\n\n".join(formatted_results)
+            )
+            
+        except Exception as e:
+            return f"Error performing enhanced web search: {str(e)}"
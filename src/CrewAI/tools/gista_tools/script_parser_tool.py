@@ -1,6 +1,9 @@
 from crewai_tools import BaseTool
 from pydantic.v1 import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
+
+from .script_stream import ParsedSegment, ScriptSource, ScriptStream, determine_segment_type
+from ...utils.metrics import instrument_tool
 
 class PodcastSegment(BaseModel):
     voice_role: str
@@ -8,47 +11,46 @@ class PodcastSegment(BaseModel):
     segment_type: str
     pause_markers: List[int] = []
     emphasis_markers: List[Dict[str, int]] = []
+    section: Optional[str] = None
 
+@instrument_tool
 class ScriptParserTool(BaseTool):
     name: str = "Script Parser Tool"
     description: str = "Converts markdown podcast scripts into structured segments"
 
     def _run(self, markdown_content: str) -> Dict[str, Any]:
-        segments = []
-        current_voice = None
-        current_text = []
-        
-        for line in markdown_content.split('\n'):
-            if line.strip().startswith('[') and line.strip().endswith(']'):
-                # Process previous segment if exists
-                if current_voice and current_text:
-                    segments.append(PodcastSegment(
-                        voice_role=current_voice.lower().replace(' voice', ''),
-                        text=' '.join(current_text),
-                        segment_type=self._determine_segment_type(current_voice, current_text)
-                    ))
-                # Start new segment
-                current_voice = line.strip()[1:-1]
-                current_text = []
-            elif current_voice and line.strip():
-                current_text.append(line.strip())
+        stream = self.stream(markdown_content)
+        return self.build_result(list(stream), stream.metadata)
+
+    def stream(self, source: ScriptSource) -> ScriptStream:
+        """
+        Parse a script lazily from a file path, text or line iterator
+
+        Segments are lightweight ParsedSegment objects yielded as soon as
+        they are complete; ``stream.metadata`` holds the title and source.
+        """
+        return ScriptStream(source)
 
+    def build_result(self, segments: Iterable[ParsedSegment], metadata: Dict[str, str]) -> Dict[str, Any]:
+        """Convert parsed segments into the validated tool result"""
         return {
-            "segments": segments,
+            "segments": [
+                PodcastSegment(
+                    voice_role=segment.voice_role,
+                    text=segment.text,
+                    segment_type=segment.segment_type,
+                    pause_markers=segment.pause_markers,
+                    emphasis_markers=segment.emphasis_markers,
+                    section=segment.section
+                )
+                for segment in segments
+            ],
             "metadata": {
-                "title": self._extract_title(markdown_content),
-                "source": self._extract_source(markdown_content)
+                "title": metadata.get("title", "Untitled"),
+                "source": metadata.get("source", "Unknown")
             }
         }
 
-    def _extract_title(self, content: str) -> str:
-        return "Untitled"
-
-    def _extract_source(self, content: str) -> str:
-        return "Unknown"
-
     def _determine_segment_type(self, voice: str, text: List[str]) -> str:
         # Logic to determine if segment is readout, qa, intro, etc.
-        if "host" in voice.lower():
-            return "qa"
-        return "readout"  # Default type 
\ No newline at end of file
+        return determine_segment_type(voice, text)
@@ -0,0 +1,185 @@
+"""
+Streaming Podcast Script Parser
+===============================
+
+Single-pass parser for Gista markdown podcast scripts.
+
+Scripts are read line by line from a file, a string or any iterator of
+lines, and segments are yielded as soon as the next voice switch or
+heading closes them. Downstream stages (voice synthesis in particular) can
+therefore start on the first segment while the rest of a long script is
+still being read.
+
+Script notation:
+
+    # Gista Podcast Episode: <title>
+    Source: <source>
+    ## <section> / ### Segment N: <title>
+    [Host Voice]            voice switch, starts a new segment
+    //                      natural pause
+    *text*                  emphasised words
+
+Bracketed lines that are not voice switches (editorial notes such as
+``[Continue with segments 3-9...]``) close the current segment and are
+otherwise ignored.
+"""
+
+import io
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+TITLE_PREFIX = "# Gista Podcast Episode:"
+SOURCE_PREFIX = "Source:"
+PAUSE_MARKER = "//"
+
+_VOICE_LINE = re.compile(r"^\[(?P<voice>[^\[\]]+?)\s+Voice\]$", re.IGNORECASE)
+_EMPHASIS = re.compile(r"\*(?!\s)([^*]+?)(?<!\s)\*")
+
+ScriptSource = Union[str, Path, io.TextIOBase, Iterable[str]]
+
+
+class ParsedSegment:
+    """One voice segment of a podcast script"""
+
+    __slots__ = (
+        "index", "voice_role", "text", "segment_type",
+        "pause_markers", "emphasis_markers", "section"
+    )
+
+    def __init__(self, index: int, voice_role: str, text: str, segment_type: str,
+                 pause_markers: List[int], emphasis_markers: List[Dict[str, int]],
+                 section: Optional[str] = None):
+        self.index = index
+        self.voice_role = voice_role
+        self.text = text
+        self.segment_type = segment_type
+        self.pause_markers = pause_markers
+        self.emphasis_markers = emphasis_markers
+        self.section = section
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"ParsedSegment(index={self.index}, voice_role={self.voice_role!r}, section={self.section!r})"
+
+
+def determine_segment_type(voice: str, text: List[str]) -> str:
+    """Classify a segment as qa (host turns) or readout"""
+    if "host" in voice.lower():
+        return "qa"
+    return "readout"
+
+
+def find_pause_markers(text: str) -> List[int]:
+    """Character offsets of every ``//`` pause marker in ``text``"""
+    offsets = []
+    position = text.find(PAUSE_MARKER)
+    while position != -1:
+        offsets.append(position)
+        position = text.find(PAUSE_MARKER, position + len(PAUSE_MARKER))
+    return offsets
+
+
+def find_emphasis_markers(text: str) -> List[Dict[str, int]]:
+    """Spans of ``*emphasised*`` words (offsets exclude the asterisks)"""
+    return [{"start": match.start(1), "end": match.end(1)} for match in _EMPHASIS.finditer(text)]
+
+
+def _iter_lines(source: ScriptSource) -> Iterator[str]:
+    """Yield lines from a path, script text, file object or line iterator"""
+    if isinstance(source, Path) or (
+        isinstance(source, str) and "\n" not in source and os.path.isfile(source)
+    ):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from f
+    elif isinstance(source, str):
+        yield from io.StringIO(source)
+    else:
+        yield from source
+
+
+class ScriptStream:
+    """
+    Lazy iterator over the segments of a podcast script
+
+    ``metadata`` (title and source) is filled in as the header lines are
+    read, so it is complete once the first segment has been yielded.
+
+    Example:
+        stream = ScriptStream("sample_podcast_script.md")
+        for segment in stream:
+            ...
+        print(stream.metadata["title"])
+    """
+
+    def __init__(self, source: ScriptSource):
+        self._lines = _iter_lines(source)
+        self.metadata: Dict[str, str] = {"title": "Untitled", "source": "Unknown"}
+        self.sections: List[str] = []
+
+    def __iter__(self) -> Iterator[ParsedSegment]:
+        index = 0
+        section: Optional[str] = None
+        voice: Optional[str] = None
+        text: List[str] = []
+
+        def flush() -> Optional[ParsedSegment]:
+            if voice is None or not text:
+                return None
+            joined = " ".join(text)
+            return ParsedSegment(
+                index=index,
+                voice_role=voice.lower(),
+                text=joined,
+                segment_type=determine_segment_type(voice, text),
+                pause_markers=find_pause_markers(joined),
+                emphasis_markers=find_emphasis_markers(joined),
+                section=section
+            )
+
+        for raw_line in self._lines:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if line.startswith("#"):
+                segment = flush()
+                if segment is not None:
+                    yield segment
+                    index += 1
+                voice, text = None, []
+
+                if line.startswith(TITLE_PREFIX):
+                    self.metadata["title"] = line[len(TITLE_PREFIX):].strip()
+                elif line.startswith("##"):
+                    section = line.lstrip("#").strip()
+                    self.sections.append(section)
+                continue
+
+            if line.startswith("[") and line.endswith("]"):
+                segment = flush()
+                if segment is not None:
+                    yield segment
+                    index += 1
+                match = _VOICE_LINE.match(line)
+                voice, text = (match.group("voice").strip() if match else None), []
+                continue
+
+            if voice is None:
+                if line.startswith(SOURCE_PREFIX) and not self.sections:
+                    self.metadata["source"] = line[len(SOURCE_PREFIX):].strip()
+                continue
+
+            text.append(line)
+
+        segment = flush()
+        if segment is not None:
+            yield segment
+
+
+def iter_segments(source: ScriptSource) -> Iterator[ParsedSegment]:
+    """Convenience wrapper: lazily yield the segments of a script"""
+    return iter(ScriptStream(source))
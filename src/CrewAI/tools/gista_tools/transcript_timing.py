@@ -0,0 +1,162 @@
+"""
+Transcript Timing
+=================
+
+Computes segment start/end times for podcast transcripts and renders
+them as timestamped text, WebVTT or SRT.
+
+Durations come from the synthesized audio whenever it is available
+(frame headers of the segment MP3, or a duration already reported by the
+voiceover/assembly tools). Segments without audio fall back to a
+words-per-minute estimate so a transcript can still be produced before
+the voiceover has run.
+"""
+
+import io
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from .mp3_frames import mp3_duration
+
+DEFAULT_WORDS_PER_MINUTE = float(os.getenv("GISTA_WORDS_PER_MINUTE", "150"))
+
+# Keys under which the voiceover and assembly tools report a duration
+_DURATION_KEYS = ("playback_duration", "duration_seconds")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def segment_field(segment: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a parsed segment (PodcastSegment or plain dict)"""
+    if isinstance(segment, dict):
+        return segment.get(name, default)
+    return getattr(segment, name, default)
+
+
+def clean_text(text: str) -> str:
+    """Strip pause markers and collapse whitespace"""
+    return _WHITESPACE.sub(" ", text.replace("//", " ")).strip()
+
+
+def estimate_duration(text: str, words_per_minute: float = DEFAULT_WORDS_PER_MINUTE) -> float:
+    """Estimate spoken duration in seconds from the word count"""
+    words = len(clean_text(text).split())
+    return words * 60.0 / words_per_minute
+
+
+def audio_duration(audio: Any) -> Optional[float]:
+    """
+    Duration in seconds of one segment's audio, if it can be determined
+
+    Args:
+        audio: A number of seconds, an MP3 file path, raw MP3 bytes, or a
+            voiceover/assembly result dict (``playback_duration``,
+            ``duration_seconds``, ``file_path`` or ``audio``)
+
+    Returns:
+        Duration in seconds, or None if no audio is available
+    """
+    if audio is None:
+        return None
+    if isinstance(audio, (int, float)):
+        return float(audio)
+    if isinstance(audio, (bytes, bytearray)):
+        return mp3_duration(io.BytesIO(audio))
+    if isinstance(audio, str):
+        return mp3_duration(audio) if os.path.exists(audio) else None
+    if isinstance(audio, dict):
+        if audio.get("error"):
+            return None
+        for key in _DURATION_KEYS:
+            if audio.get(key) is not None:
+                return float(audio[key])
+        for key in ("file_path", "audio"):
+            if audio.get(key):
+                return audio_duration(audio[key])
+    return None
+
+
+def segment_timings(
+    segments: Sequence[Any],
+    audio: Optional[Sequence[Any]] = None,
+    words_per_minute: float = DEFAULT_WORDS_PER_MINUTE
+) -> List[Dict[str, Any]]:
+    """
+    Lay segments out on the episode timeline
+
+    Args:
+        segments: Parsed script segments (objects or dicts)
+        audio: Optional per-segment audio, aligned with ``segments``
+            (see ``audio_duration`` for accepted forms)
+        words_per_minute: Speaking rate for segments without audio
+
+    Returns:
+        List of cue dicts with ``index``, ``speaker``, ``text``, ``start``,
+        ``end`` and ``source`` ("audio" or "estimate")
+    """
+    cues = []
+    position = 0.0
+    for index, segment in enumerate(segments):
+        text = segment_field(segment, "text", "")
+        duration = audio_duration(audio[index]) if audio and index < len(audio) else None
+        source = "audio"
+        if duration is None:
+            duration = estimate_duration(text, words_per_minute)
+            source = "estimate"
+
+        cues.append({
+            "index": index,
+            "speaker": (segment_field(segment, "voice_role") or "").upper(),
+            "text": clean_text(text),
+            "start": position,
+            "end": position + duration,
+            "source": source
+        })
+        position += duration
+    return cues
+
+
+def format_timestamp(seconds: float, style: str = "clock") -> str:
+    """
+    Format seconds as a timestamp
+
+    Args:
+        seconds: Time offset in seconds
+        style: "clock" (MM:SS, or H:MM:SS past an hour), "vtt"
+            (HH:MM:SS.mmm) or "srt" (HH:MM:SS,mmm)
+    """
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+
+    if style == "vtt":
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    if style == "srt":
+        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def render_webvtt(cues: List[Dict[str, Any]]) -> str:
+    """Render cues as a WebVTT document with voice spans"""
+    lines = ["WEBVTT", ""]
+    for cue in cues:
+        lines.append(str(cue["index"] + 1))
+        lines.append(f"{format_timestamp(cue['start'], 'vtt')} --> {format_timestamp(cue['end'], 'vtt')}")
+        lines.append(f"<v {cue['speaker']}>{cue['text']}" if cue["speaker"] else cue["text"])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_srt(cues: List[Dict[str, Any]]) -> str:
+    """Render cues as SubRip (SRT) subtitles"""
+    lines = []
+    for cue in cues:
+        lines.append(str(cue["index"] + 1))
+        lines.append(f"{format_timestamp(cue['start'], 'srt')} --> {format_timestamp(cue['end'], 'srt')}")
+        lines.append(f"{cue['speaker']}: {cue['text']}" if cue["speaker"] else cue["text"])
+        lines.append("")
+    return "\n".join(lines)
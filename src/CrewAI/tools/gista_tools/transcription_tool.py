@@ -1,6 +1,16 @@
 from crewai_tools import BaseTool
 from pydantic.v1 import BaseModel, Field
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Any
+
+from .transcript_timing import (
+    DEFAULT_WORDS_PER_MINUTE,
+    format_timestamp,
+    render_srt,
+    render_webvtt,
+    segment_field,
+    segment_timings,
+)
+from ...utils.metrics import instrument_tool
 
 class TranscriptionRequest(BaseModel):
     """Schema for transcription requests"""
@@ -8,9 +18,18 @@ class TranscriptionRequest(BaseModel):
     metadata: Dict = Field(..., description="Podcast metadata")
     format_type: str = Field(
         default="clean",
-        description="Transcript format type (clean/detailed/timestamped)"
+        description="Transcript format type (clean/detailed/timestamped/webvtt/srt)"
+    )
+    audio: Optional[list] = Field(
+        default=None,
+        description="Per-segment audio (file paths, bytes or voiceover results) used for timestamps"
+    )
+    words_per_minute: float = Field(
+        default=DEFAULT_WORDS_PER_MINUTE,
+        description="Speaking rate used to estimate timing for segments without audio"
     )
 
+@instrument_tool
 class TranscriptionTool(BaseTool):
     """Tool for generating podcast transcripts in various formats"""
     
@@ -22,7 +41,9 @@ class TranscriptionTool(BaseTool):
         self, 
         segments: list,
         metadata: Dict,
-        format_type: str = "clean"
+        format_type: str = "clean",
+        audio: Optional[List[Any]] = None,
+        words_per_minute: float = DEFAULT_WORDS_PER_MINUTE
     ) -> Dict:
         """
         Generate transcript from podcast segments
@@ -31,14 +52,26 @@ class TranscriptionTool(BaseTool):
             segments: List of podcast segments
             metadata: Podcast metadata
             format_type: Type of transcript format to generate
+            audio: Optional per-segment audio aligned with segments; timed
+                formats read durations from it and estimate the rest
+            words_per_minute: Speaking rate for segments without audio
         """
         try:
+            result = {}
             if format_type == "clean":
                 transcript = self._generate_clean_transcript(segments, metadata)
             elif format_type == "detailed":
                 transcript = self._generate_detailed_transcript(segments, metadata)
-            elif format_type == "timestamped":
-                transcript = self._generate_timestamped_transcript(segments, metadata)
+            elif format_type in ("timestamped", "webvtt", "srt"):
+                cues = segment_timings(segments, audio, words_per_minute)
+                if format_type == "webvtt":
+                    transcript = render_webvtt(cues)
+                elif format_type == "srt":
+                    transcript = render_srt(cues)
+                else:
+                    transcript = self._generate_timestamped_transcript(cues, metadata)
+                result["cues"] = cues
+                result["duration_seconds"] = cues[-1]["end"] if cues else 0.0
             else:
                 transcript = self._generate_clean_transcript(segments, metadata)
 
@@ -46,7 +79,8 @@ class TranscriptionTool(BaseTool):
                 "status": "success",
                 "transcript": transcript,
                 "metadata": metadata,
-                "format": format_type
+                "format": format_type,
+                **result
             }
 
         except Exception as e:
@@ -55,36 +89,43 @@ class TranscriptionTool(BaseTool):
                 "message": str(e)
             }
 
+    def _header(self, metadata: Dict) -> List[str]:
+        return [
+            f"# {metadata.get('title', 'Untitled')}\n",
+            f"Source: {metadata.get('source', 'Unknown')}\n\n"
+        ]
+
     def _generate_clean_transcript(self, segments: list, metadata: Dict) -> str:
         """Generate a clean, readable transcript"""
-        transcript = [f"# {metadata['title']}\n"]
-        transcript.append(f"Source: {metadata['source']}\n\n")
+        transcript = self._header(metadata)
         
         for segment in segments:
-            speaker = segment.voice_role.upper()
-            text = segment.text.replace("//", "")  # Remove pause markers
+            speaker = (segment_field(segment, "voice_role") or "").upper()
+            text = (segment_field(segment, "text") or "").replace("//", "")  # Remove pause markers
             transcript.append(f"{speaker}: {text}\n\n")
             
         return "".join(transcript)
 
     def _generate_detailed_transcript(self, segments: list, metadata: Dict) -> str:
         """Generate a detailed transcript with segment types and markers"""
-        transcript = [f"# {metadata['title']}\n"]
-        transcript.append(f"Source: {metadata['source']}\n\n")
+        transcript = self._header(metadata)
         
         for segment in segments:
-            transcript.append(f"[{segment.segment_type.upper()}]\n")
-            transcript.append(f"{segment.voice_role.upper()}: {segment.text}\n\n")
+            segment_type = (segment_field(segment, "segment_type") or "").upper()
+            speaker = (segment_field(segment, "voice_role") or "").upper()
+            text = segment_field(segment, "text") or ""
+            transcript.append(f"[{segment_type}]\n")
+            transcript.append(f"{speaker}: {text}\n\n")
             
         return "".join(transcript)
 
-    def _generate_timestamped_transcript(self, segments: list, metadata: Dict) -> str:
+    def _generate_timestamped_transcript(self, cues: List[Dict], metadata: Dict) -> str:
         """Generate a transcript with timestamp markers"""
-        transcript = [f"# {metadata['title']}\n"]
-        transcript.append(f"Source: {metadata['source']}\n\n")
+        transcript = self._header(metadata)
         
-        for i, segment in enumerate(segments):
-            timestamp = f"[{i * 30:02d}:00]"  # Simple timestamp estimation
-            transcript.append(f"{timestamp} {segment.voice_role.upper()}: {segment.text}\n\n")
+        for cue in cues:
+            timestamp = f"[{format_timestamp(cue['start'])}]"
+            transcript.append(f"{timestamp} {cue['speaker']}: {cue['text']}\n\n")
             
-        return "".join(transcript) 
\ No newline at end of file
+        return "".join(transcript)
+ 
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+TTS Audio Cache
+===============
+
+Content-addressed disk cache for synthesized voiceover audio.
+
+Each entry is stored as ``<sha256>.mp3`` where the hash covers the text,
+voice ID, model ID and voice settings used for synthesis, so identical
+requests (host intros, closing transitions, re-submitted gists) are served
+from disk instead of the ElevenLabs API.
+
+The cache is bounded by total size and evicts least recently used entries
+first. Hit, miss and eviction counters are kept per process.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "GISTA_TTS_CACHE_DIR",
+    str(Path(tempfile.gettempdir()) / "gista_tts_cache")
+)
+DEFAULT_MAX_MB = int(os.getenv("GISTA_TTS_CACHE_MAX_MB", "512"))
+
+AUDIO_SUFFIX = ".mp3"
+
+
+class TTSAudioCache:
+    """
+    Size-bounded LRU cache of audio files keyed by synthesis parameters.
+
+    Args:
+        directory: Directory holding the cached audio files
+        max_bytes: Total size above which least recently used entries
+            are evicted
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_existing()
+
+    @staticmethod
+    def make_key(
+        text: str,
+        voice_id: str,
+        model_id: str,
+        voice_settings: Optional[Dict[str, float]] = None
+    ) -> str:
+        """Hash the synthesis parameters into a cache key"""
+        payload = json.dumps(
+            [text, voice_id, model_id, voice_settings or {}],
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}{AUDIO_SUFFIX}"
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """
+        Return the cached file for ``key`` and mark it recently used,
+        or None on a miss
+        """
+        path = self.path_for(key)
+        with self._lock:
+            if key in self._entries and path.exists():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # Keep mtime as the access time so LRU order survives restarts
+                os.utime(path, None)
+                return path
+
+            if key in self._entries:
+                # File removed behind our back
+                self._total_bytes -= self._entries.pop(key)
+            self.misses += 1
+            return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio bytes for ``key``, or None on a miss"""
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> Path:
+        """Store audio bytes under ``key``"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return self._commit(key, Path(tmp_path))
+
+    def put_file(self, key: str, source_path: Union[str, Path]) -> Path:
+        """Store a copy of an existing audio file under ``key``"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        os.close(fd)
+        shutil.copyfile(source_path, tmp_path)
+        return self._commit(key, Path(tmp_path))
+
+    def open_writer(self, key: str) -> "CacheWriter":
+        """
+        Start writing an entry incrementally, e.g. while audio streams in.
+        The entry only becomes visible after ``commit``.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        return CacheWriter(self, key, os.fdopen(fd, "wb"), Path(tmp_path))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes
+            }
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _commit(self, key: str, tmp_path: Path) -> Path:
+        path = self.path_for(key)
+        size = tmp_path.stat().st_size
+        with self._lock:
+            os.replace(tmp_path, path)
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+        return path
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes. Caller holds the lock."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        self._total_bytes -= self._entries.pop(key)
+        try:
+            self.path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load_existing(self):
+        """Index files left by earlier processes, oldest access first"""
+        files = sorted(
+            self.directory.glob(f"*{AUDIO_SUFFIX}"),
+            key=lambda p: p.stat().st_mtime
+        )
+        for path in files:
+            size = path.stat().st_size
+            self._entries[path.stem] = size
+            self._total_bytes += size
+        with self._lock:
+            self._evict()
+
+
+class CacheWriter:
+    """Incremental writer for a single cache entry"""
+
+    def __init__(self, cache: TTSAudioCache, key: str, handle, tmp_path: Path):
+        self._cache = cache
+        self._key = key
+        self._handle = handle
+        self._tmp_path = tmp_path
+
+    def write(self, chunk: bytes):
+        self._handle.write(chunk)
+
+    def commit(self) -> Path:
+        """Publish the written data under the entry's key"""
+        self._handle.close()
+        return self._cache._commit(self._key, self._tmp_path)
+
+    def abort(self):
+        """Discard the partially written entry"""
+        self._handle.close()
+        try:
+            self._tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+_shared_cache: Optional[TTSAudioCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSAudioCache:
+    """Return the process-wide TTS cache configured from the environment"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = TTSAudioCache()
+    return _shared_cache
@@ -0,0 +1,82 @@
+"""
+Pooled Web Tools
+================
+
+Drop-in versions of crewai_tools' ``ScrapeWebsiteTool`` and
+``SerperDevTool`` that send their requests through the process-wide
+pooled session (``utils.http_pool``) instead of module-level
+``requests`` calls, which open a new connection every time.
+
+Output is identical to the originals, so the search cache and the
+research tools' result parsing are unaffected. The one difference is that
+the scraper raises ``requests.HTTPError`` for a non-2xx response instead
+of returning the error page's text, so a 404 or 429 page is never cached
+or read as content.
+"""
+
+import json
+import os
+from typing import Any
+
+from crewai_tools import ScrapeWebsiteTool, SerperDevTool
+
+from ..utils.http_pool import get_http_session
+from ..utils.metrics import record_bytes
+
+SCRAPE_TIMEOUT = 15
+SERPER_TIMEOUT = 15
+
+
+class PooledScrapeWebsiteTool(ScrapeWebsiteTool):
+    """ScrapeWebsiteTool over the shared keep-alive session"""
+
+    def _run(self, **kwargs: Any) -> Any:
+        from bs4 import BeautifulSoup
+
+        website_url = kwargs.get("website_url", self.website_url)
+        page = get_http_session().get(
+            website_url,
+            timeout=SCRAPE_TIMEOUT,
+            headers=self.headers,
+            cookies=self.cookies if self.cookies else {}
+        )
+        record_bytes("scrape", len(page.content))
+        page.raise_for_status()
+        parsed = BeautifulSoup(page.content, "html.parser")
+        text = parsed.get_text()
+        text = "\n".join([i for i in text.split("\n") if i.strip() != ""])
+        text = " ".join([i for i in text.split(" ") if i.strip() != ""])
+        return text
+
+
+class PooledSerperDevTool(SerperDevTool):
+    """SerperDevTool over the shared keep-alive session"""
+
+    def _run(self, search_query: str, **kwargs: Any) -> Any:
+        response = get_http_session().post(
+            self.search_url,
+            headers={
+                "X-API-KEY": os.environ["SERPER_API_KEY"],
+                "content-type": "application/json"
+            },
+            data=json.dumps({"q": search_query}),
+            timeout=SERPER_TIMEOUT
+        )
+        record_bytes("serper", len(response.content))
+        results = response.json()
+        if "organic" not in results:
+            return results
+
+        entries = []
+        for result in results["organic"]:
+            try:
+                entries.append("\n".join([
+                    f"Title: {result['title']}",
+                    f"Link: {result['link']}",
+                    f"Snippet: {result['snippet']}",
+                    "---"
+                ]))
+            except KeyError:
+                continue
+        content = "\n".join(entries)
+        return f"\nSearch results: {content}\n"
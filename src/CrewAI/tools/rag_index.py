@@ -0,0 +1,370 @@
+"""
+RAG Index
+=========
+
+Reusable embeddings for the RAG search tools (PDF, DOCX, CSV, website).
+
+Each document gets its own Chroma collection under ``db/``, named after a
+key built from the document and the indexing parameters:
+
+    local file   SHA-256 of the file content
+    URL          normalized URL; re-indexed after RAG_INDEX_WEB_TTL
+    parameters   data type, chunk size and overlap, embedding model
+
+A SQLite manifest records which keys are fully indexed. Asking for a
+document that is already in the manifest opens its collection without
+loading, chunking or embedding it again, in this process or any later
+one; concurrent requests for the same new document embed it once.
+
+    index = get_rag_index()
+    app = index.get_app("reports/q3.pdf", DataType.PDF_FILE)
+    app.query(...)
+
+Text extracted elsewhere (``tools.file_ingestion``) is indexed with
+``get_text_app(text, digest, source)``, keyed by the file's hash.
+
+The manifest is compacted after every newly indexed document: entries
+unused for RAG_INDEX_TTL are dropped first, then the least recently used
+ones until the indexed chunk count is under RAG_INDEX_MAX_CHUNKS. Their
+collections are deleted from Chroma.
+
+Environment settings:
+    RAG_INDEX_DB            Manifest SQLite file (default db/rag_index.sqlite3)
+    RAG_INDEX_DIR           Chroma directory (default db/)
+    RAG_CHUNK_SIZE          Characters per chunk (default 1000)
+    RAG_CHUNK_OVERLAP       Characters shared by neighbouring chunks (default 0)
+    RAG_EMBEDDER_PROVIDER   embedchain embedder provider (default openai)
+    RAG_EMBEDDING_MODEL     Embedding model (default text-embedding-ada-002)
+    RAG_INDEX_WEB_TTL       Seconds before a URL is re-indexed (default 1 day)
+    RAG_INDEX_TTL           Seconds an unused document is kept (default 30 days)
+    RAG_INDEX_MAX_CHUNKS    Indexed chunk limit across documents (default 200000)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .search_cache import normalize_url
+from ..utils.metrics import record_cache
+
+DB_DIR = Path(__file__).resolve().parents[3] / "db"
+DEFAULT_MANIFEST_PATH = DB_DIR / "rag_index.sqlite3"
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CHUNK_OVERLAP = 0
+DEFAULT_EMBEDDER_PROVIDER = "openai"
+DEFAULT_EMBEDDING_MODEL = "text-embedding-ada-002"
+DEFAULT_WEB_TTL = 24 * 3600
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_MAX_CHUNKS = 200000
+
+_HASH_BLOCK = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's content, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _data_type_name(data_type: Any) -> str:
+    # embedchain DataType members, or their plain string values
+    return str(getattr(data_type, "value", data_type))
+
+
+def _default_app_factory(config: Dict[str, Any]) -> Any:
+    from embedchain import App
+
+    return App.from_config(config=config)
+
+
+def _drop_chroma_collection(db_dir: str, collection: str) -> None:
+    import chromadb
+
+    try:
+        chromadb.PersistentClient(path=db_dir).delete_collection(collection)
+    except ValueError:
+        pass  # already gone
+
+
+class RAGIndex:
+    """
+    Manifest of indexed documents and their embedchain apps
+
+    Args:
+        path: Manifest SQLite file (":memory:" for a private in-memory manifest)
+        db_dir: Chroma directory holding the per-document collections
+        chunk_size: Characters per chunk
+        chunk_overlap: Characters shared by neighbouring chunks
+        embedder_provider: embedchain embedder provider
+        embedding_model: Embedding model name
+        web_ttl: Seconds before a URL's collection is rebuilt
+        ttl: Seconds an unused document is kept by compact()
+        max_chunks: Chunk limit enforced by compact()
+        app_factory: Builds an embedchain app from a config dict
+        drop_collection: Deletes a collection, given (db_dir, name)
+    """
+
+    def __init__(
+        self,
+        path: str = str(DEFAULT_MANIFEST_PATH),
+        db_dir: str = str(DB_DIR),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        embedder_provider: str = DEFAULT_EMBEDDER_PROVIDER,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        web_ttl: float = DEFAULT_WEB_TTL,
+        ttl: float = DEFAULT_TTL,
+        max_chunks: int = DEFAULT_MAX_CHUNKS,
+        app_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        drop_collection: Optional[Callable[[str, str], None]] = None
+    ):
+        self.path = path
+        self.db_dir = db_dir
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.embedder_provider = embedder_provider
+        self.embedding_model = embedding_model
+        self.web_ttl = web_ttl
+        self.ttl = ttl
+        self.max_chunks = max_chunks
+        self._app_factory = app_factory or _default_app_factory
+        self._drop_collection = drop_collection or _drop_chroma_collection
+        self._apps: Dict[str, Any] = {}
+        # Reentrant: a build that finds an expired URL removes it under the same lock
+        self._key_locks: Dict[str, threading.RLock] = {}
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS rag_index ("
+            "key TEXT PRIMARY KEY, collection TEXT NOT NULL, source TEXT NOT NULL, "
+            "data_type TEXT NOT NULL, by_url INTEGER NOT NULL, chunks INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def document_key(self, source: str, data_type: Any) -> str:
+        """
+        Index key of a document under the current chunking and embedder
+
+        Local files are keyed by content, anything else by normalized URL.
+        """
+        if os.path.isfile(source):
+            return self._key(f"sha256:{file_digest(source)}", data_type)
+        return self._key(f"url:{normalize_url(source)}", data_type)
+
+    def _key(self, identity: str, data_type: Any) -> str:
+        parameters = "|".join([
+            _data_type_name(data_type), str(self.chunk_size), str(self.chunk_overlap),
+            self.embedder_provider, self.embedding_model
+        ])
+        return hashlib.sha256(f"{identity}\x00{parameters}".encode("utf-8")).hexdigest()
+
+    def app_config(self, collection: str) -> Dict[str, Any]:
+        """embedchain config for one document's collection"""
+        return {
+            "vectordb": {
+                "provider": "chroma",
+                "config": {"collection_name": collection, "dir": self.db_dir, "allow_reset": True}
+            },
+            "chunker": {
+                "chunk_size": self.chunk_size,
+                "chunk_overlap": self.chunk_overlap,
+                "length_function": "len"
+            },
+            "embedder": {
+                "provider": self.embedder_provider,
+                "config": {"model": self.embedding_model}
+            }
+        }
+
+    def get_app(self, source: str, data_type: Any) -> Any:
+        """
+        embedchain app whose collection holds ``source``, indexing it if needed
+
+        Args:
+            source: File path or URL
+            data_type: embedchain DataType of the source
+
+        Returns:
+            The app; query it like any embedchain app
+        """
+        by_url = not os.path.isfile(source)
+        return self._get_app(
+            self.document_key(source, data_type), source, data_type, by_url,
+            lambda app: app.add(source, data_type=data_type)
+        )
+
+    def get_text_app(self, text: str, digest: str, source: str) -> Any:
+        """
+        embedchain app whose collection holds already extracted text
+
+        Args:
+            text: The extracted text
+            digest: SHA-256 of the file the text came from
+            source: Where the text came from, recorded in the manifest
+
+        Returns:
+            The app; query it like any embedchain app
+        """
+        return self._get_app(
+            self._key(f"sha256:{digest}", "text"), source, "text", False,
+            lambda app: app.add(text, data_type="text")
+        )
+
+    def _build_lock(self, key: str) -> threading.RLock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.RLock())
+
+    def _get_app(self, key: str, source: str, data_type: Any, by_url: bool, add: Callable[[Any], None]) -> Any:
+        with self._build_lock(key):
+            entry = self._entry(key)
+            if entry is not None and entry["by_url"] and entry["created_at"] <= time.time() - self.web_ttl:
+                self._remove(key, entry["collection"])
+                entry = None
+
+            collection = f"rag-{key[:32]}"
+            app = self._apps.get(key)
+            if app is None:
+                app = self._app_factory(self.app_config(collection))
+                self._apps[key] = app
+
+            if entry is not None and app.db.count() > 0:
+                record_cache("rag_index", True)
+                self._touch(key)
+                return app
+
+            record_cache("rag_index", False)
+            add(app)
+            self._save(key, collection, source, data_type, by_url, app.db.count())
+
+        # The document just indexed is about to be used, even if it alone
+        # is over the chunk limit
+        self.compact(exclude=(key,))
+        return app
+
+    def is_indexed(self, source: str, data_type: Any) -> bool:
+        return self._entry(self.document_key(source, data_type)) is not None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Manifest rows, most recently used first"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, collection, source, data_type, by_url, chunks, created_at, last_used "
+                "FROM rag_index ORDER BY last_used DESC"
+            ).fetchall()
+        return [self._row_dict(row) for row in rows]
+
+    def compact(self, now: Optional[float] = None, exclude: Iterable[str] = ()) -> List[str]:
+        """
+        Drop expired documents, then least recently used ones over the chunk limit
+
+        Args:
+            now: Current time (for tests)
+            exclude: Keys that are never dropped by this call
+
+        Returns:
+            Keys of the dropped documents
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, collection, chunks, last_used FROM rag_index ORDER BY last_used ASC"
+            ).fetchall()
+
+        excluded = set(exclude)
+        total = sum(row[2] for row in rows)
+        dropped = []
+        for key, collection, chunks, last_used in rows:
+            if last_used > now - self.ttl and total <= self.max_chunks:
+                break
+            if key in excluded:
+                continue
+            self._remove(key, collection)
+            total -= chunks
+            dropped.append(key)
+        if dropped:
+            print(f"RAG index compacted: dropped {len(dropped)} document(s)")
+        return dropped
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            documents, chunks = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(chunks), 0) FROM rag_index"
+            ).fetchone()
+        return {"documents": documents, "chunks": chunks}
+
+    def _entry(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT key, collection, source, data_type, by_url, chunks, created_at, last_used "
+                "FROM rag_index WHERE key = ?", (key,)
+            ).fetchone()
+        return self._row_dict(row) if row is not None else None
+
+    def _touch(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("UPDATE rag_index SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+    def _save(self, key: str, collection: str, source: str, data_type: Any, by_url: bool, chunks: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO rag_index "
+                "(key, collection, source, data_type, by_url, chunks, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, collection, source, _data_type_name(data_type), int(by_url), chunks, now, now)
+            )
+            self._db.commit()
+
+    def _remove(self, key: str, collection: str) -> None:
+        # Waits for a build of the same document to finish
+        with self._build_lock(key):
+            self._drop_collection(self.db_dir, collection)
+            with self._lock:
+                self._apps.pop(key, None)
+                self._db.execute("DELETE FROM rag_index WHERE key = ?", (key,))
+                self._db.commit()
+
+    @staticmethod
+    def _row_dict(row) -> Dict[str, Any]:
+        return {
+            "key": row[0], "collection": row[1], "source": row[2], "data_type": row[3],
+            "by_url": bool(row[4]), "chunks": row[5], "created_at": row[6], "last_used": row[7]
+        }
+
+
+_rag_index: Optional[RAGIndex] = None
+_rag_index_lock = threading.Lock()
+
+
+def get_rag_index() -> RAGIndex:
+    """Process-wide index configured from the environment"""
+    global _rag_index
+    if _rag_index is None:
+        with _rag_index_lock:
+            if _rag_index is None:
+                _rag_index = RAGIndex(
+                    path=os.getenv("RAG_INDEX_DB") or str(DEFAULT_MANIFEST_PATH),
+                    db_dir=os.getenv("RAG_INDEX_DIR") or str(DB_DIR),
+                    chunk_size=int(os.getenv("RAG_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE))),
+                    chunk_overlap=int(os.getenv("RAG_CHUNK_OVERLAP", str(DEFAULT_CHUNK_OVERLAP))),
+                    embedder_provider=os.getenv("RAG_EMBEDDER_PROVIDER", DEFAULT_EMBEDDER_PROVIDER),
+                    embedding_model=os.getenv("RAG_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL),
+                    web_ttl=float(os.getenv("RAG_INDEX_WEB_TTL", str(DEFAULT_WEB_TTL))),
+                    ttl=float(os.getenv("RAG_INDEX_TTL", str(DEFAULT_TTL))),
+                    max_chunks=int(os.getenv("RAG_INDEX_MAX_CHUNKS", str(DEFAULT_MAX_CHUNKS)))
+                )
+    return _rag_index
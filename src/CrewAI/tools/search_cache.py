@@ -0,0 +1,333 @@
+"""
+Search Result Cache
+===================
+
+Shared cache for web search (Serper) and scrape results used by the
+research, ticket and travel tools.
+
+Entries are keyed on a normalized query or URL within a namespace (one per
+tool), and each namespace has its own TTL. Results live in an in-memory
+LRU and, when SEARCH_CACHE_DB is set, are also written through to SQLite
+so they survive restarts and are shared between worker processes.
+
+Concurrent identical requests are merged: while one thread computes a
+value, other threads asking for the same key wait for that result instead
+of issuing their own API call.
+
+Environment settings:
+    SEARCH_CACHE_MAX_ENTRIES   In-memory LRU size (default 1024)
+    SEARCH_CACHE_DB            SQLite file path (default: memory only)
+    SEARCH_CACHE_TTL_<NS>      TTL in seconds for namespace <NS>, e.g.
+                               SEARCH_CACHE_TTL_NEWS=600
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..utils.metrics import record_cache
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024"))
+DEFAULT_TTL = 3600.0
+
+# Per-tool TTLs in seconds; news and ticket prices go stale much faster
+# than reference material
+DEFAULT_TTLS: Dict[str, float] = {
+    "web_search": 3600.0,
+    "academic": 86400.0,
+    "news": 900.0,
+    "scrape": 21600.0,
+    "tickets": 600.0,
+    "travel": 3600.0,
+}
+
+_TRACKING_PARAMS = re.compile(r"^(utm_[a-z]+|fbclid|gclid|mc_cid|mc_eid)$", re.IGNORECASE)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query"""
+    return " ".join(query.lower().split())
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for cache keys
+
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the query string.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "http"
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAMS.match(key)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class _Flight:
+    """A computation in progress that other callers can wait on"""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class SearchCache:
+    """TTL + LRU cache with optional SQLite persistence and request merging"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        db_path: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: Maximum entries held in memory
+            ttls: TTL in seconds per namespace
+            default_ttl: TTL for namespaces not listed in ``ttls``
+            db_path: Optional SQLite file for a persistent second tier
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "merged": 0, "evictions": 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._open_db(db_path)
+
+    def ttl_for(self, namespace: str) -> float:
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Cached value, or None if missing or expired"""
+        found, value = self._lookup((namespace, key))
+        return value if found else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value for ``ttl`` seconds (namespace TTL by default)"""
+        expires_at = time.time() + (self.ttl_for(namespace) if ttl is None else ttl)
+        self._store((namespace, key), value, expires_at)
+        self._persist(namespace, key, value, expires_at)
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+        should_cache: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """
+        Return the cached value for a key, computing it at most once
+
+        If another thread is already computing the same key, this call
+        waits for and returns that result. Exceptions are propagated to
+        every waiting caller and are never cached.
+
+        Args:
+            namespace: Tool namespace (selects the TTL)
+            key: Normalized query or URL
+            compute: Zero-argument function producing the value
+            ttl: Optional TTL override in seconds
+            should_cache: Predicate rejecting values that must not be
+                cached, such as API error payloads
+        """
+        cache_key = (namespace, key)
+        found, value = self._lookup(cache_key)
+        record_cache(f"search:{namespace}", found)
+        if found:
+            return value
+
+        with self._lock:
+            flight = self._inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[cache_key] = _Flight()
+            else:
+                self._stats["merged"] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+            if should_cache(flight.value):
+                self.set(namespace, key, flight.value, ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[cache_key]
+            flight.event.set()
+
+    def invalidate(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._entries.pop((namespace, key), None)
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM search_cache WHERE namespace = ? AND key = ?", (namespace, key))
+                self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM search_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def _lookup(self, cache_key: Tuple[str, str]) -> Tuple[bool, Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(cache_key)
+                    self._stats["hits"] += 1
+                    return True, value
+                del self._entries[cache_key]
+
+        loaded = self._load(cache_key, now)
+        if loaded is not None:
+            expires_at, value = loaded
+            self._store(cache_key, value, expires_at)
+            with self._lock:
+                self._stats["hits"] += 1
+            return True, value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return False, None
+
+    def _store(self, cache_key: Tuple[str, str], value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[cache_key] = (expires_at, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _open_db(self, db_path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._db.execute("DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),))
+        self._db.commit()
+
+    def _load(self, cache_key: Tuple[str, str], now: float) -> Optional[Tuple[float, Any]]:
+        if self._db is None:
+            return None
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM search_cache WHERE namespace = ? AND key = ?",
+                cache_key
+            ).fetchone()
+        if row is None or row[1] <= now:
+            return None
+        return row[1], json.loads(row[0])
+
+    def _persist(self, namespace: str, key: str, value: Any, expires_at: float) -> None:
+        if self._db is None:
+            return
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            return  # Not JSON-serializable; keep it in memory only
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, expires_at)
+            )
+            self._db.commit()
+
+
+def _is_search_text(value: Any) -> bool:
+    # SerperDevTool returns formatted text on success and the raw JSON
+    # payload (a dict) for errors such as an invalid key or exhausted quota
+    return isinstance(value, str)
+
+
+def cached_search(search_tool: Any, query: str, namespace: str = "web_search") -> Any:
+    """Run ``search_tool._run(search_query=query)`` through the shared cache"""
+    return get_search_cache().get_or_compute(
+        namespace,
+        normalize_query(query),
+        lambda: search_tool._run(search_query=query),
+        should_cache=_is_search_text
+    )
+
+
+def cached_scrape(scraper: Any, url: str, namespace: str = "scrape") -> Any:
+    """
+    Run ``scraper._run(website_url=url)`` through the shared cache
+
+    Only non-empty page text is cached; a scraper that raises for an
+    error response (``PooledScrapeWebsiteTool`` does for non-2xx) is
+    called again on the next request.
+    """
+    return get_search_cache().get_or_compute(
+        namespace,
+        normalize_url(url),
+        lambda: scraper._run(website_url=url),
+        should_cache=lambda value: isinstance(value, str) and bool(value.strip())
+    )
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Process-wide cache configured from SEARCH_CACHE_* environment settings"""
+    global _search_cache
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                ttls = dict(DEFAULT_TTLS)
+                for name, value in os.environ.items():
+                    if name.startswith("SEARCH_CACHE_TTL_"):
+                        ttls[name[len("SEARCH_CACHE_TTL_"):].lower()] = float(value)
+                _search_cache = SearchCache(
+                    max_entries=DEFAULT_MAX_ENTRIES,
+                    ttls=ttls,
+                    db_path=os.getenv("SEARCH_CACHE_DB") or None
+                )
+    return _search_cache
@@ -3,13 +3,9 @@ from typing import List, Optional, Type, Dict
 from pydantic import BaseModel, Field, EmailStr
 from pydantic.v1 import BaseModel as V1BaseModel  # Import V1BaseModel
 import os
-from dotenv import load_dotenv
 
-load_dotenv()  # Load environment variables from .env file
-
-print("Current Environment Variables:")
-for key, value in os.environ.items():
-    print(f"{key}: {value}")
+from ..config.settings import load_environment
+from .search_cache import cached_search
 
 class TicketSearchSchema(V1BaseModel):  # Use V1BaseModel
     """Schema for the ticket search tool - defines all required and optional fields for ticket search"""
@@ -49,6 +45,7 @@ class TicketSearchTool(BaseTool):
             description=self.description
         )
         self.args_schema = TicketSearchSchema
+        load_environment()
         self.search_tool = SerperDevTool()
         if not os.getenv("SERPER_API_KEY"):
             os.environ["SERPER_API_KEY"] = os.getenv("SERPER_API_KEY", "your-default-key")
@@ -67,7 +64,7 @@ class TicketSearchTool(BaseTool):
             self.search_tool = SerperDevTool()
             
         search_query = f"flights from {kwargs['traveling_from']} to {kwargs['traveling_to']} on {kwargs['travel_date']}"
-        search_results = self.search_tool._run(search_query=search_query)
+        search_results = cached_search(self.search_tool, search_query, "tickets")
         
         return [
             f"Found tickets from {kwargs['traveling_from']} to {kwargs['traveling_to']} on {kwargs['travel_date']}:",
@@ -0,0 +1,188 @@
+"""
+Tool Registry
+=============
+
+Process-wide, lazily built tool instances.
+
+Tools are registered by name with a factory and built the first time they
+are asked for; later calls (from any crew or thread) get the same
+instance. Creating a toolbox or a task list therefore only pays for the
+tools it actually touches, and embedding-backed RAG tools or the
+ElevenLabs client are built once per process instead of once per crew.
+
+    registry = get_tool_registry()
+    registry.get("voiceover")
+    registry.preload(["script_parsing", "transcription"])
+
+Default tools are registered as ``module:ClassName`` specs and imported
+only when built. The shared RAG search tools have no fixed source; each
+call names its document, which is indexed once by ``tools.rag_index``.
+
+Environment settings:
+    GISTA_PRELOAD_TOOLS    Comma-separated tool names built by preload_tools_from_env()
+"""
+
+import importlib
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Name -> "module:ClassName", relative to this package
+DEFAULT_TOOL_SPECS: Dict[str, str] = {
+    # Gista research tools
+    "wikipedia": ".gista_tools.research_tools:WikipediaResearchTool",
+    "dictionary": ".gista_tools.research_tools:DictionaryTool",
+    "academic": ".gista_tools.research_tools:AcademicSearchTool",
+    "technical": ".gista_tools.research_tools:TechnicalDocsTool",
+    "news": ".gista_tools.research_tools:NewsResearchTool",
+    "web_search": ".gista_tools.research_tools:EnhancedWebSearchTool",
+    # Podcast generation tools
+    "script_parsing": ".gista_tools.script_parser_tool:ScriptParserTool",
+    "transcription": ".gista_tools.transcription_tool:TranscriptionTool",
+    "voiceover": ".gista_tools.elevenLabs_voiceover_tool:ElevenLabsVoiceoverTool",
+    # Content extraction tools
+    "web_scraper": ".pooled_web_tools:PooledScrapeWebsiteTool",
+    "csv_reader": ".cached_rag_tools:CachedCSVSearchTool",
+    "docx_reader": ".cached_rag_tools:CachedDOCXSearchTool",
+    "pdf_reader": ".cached_rag_tools:CachedPDFSearchTool",
+    "file_reader": ".file_ingestion_tool:FileIngestionTool",
+    "directory_reader": "crewai_tools:DirectoryReadTool",
+    # Content generation tools
+    "serper": ".pooled_web_tools:PooledSerperDevTool",
+    "website_search": ".cached_rag_tools:CachedWebsiteSearchTool",
+    "youtube_channel_search": "crewai_tools:YoutubeChannelSearchTool",
+    "github_search": "crewai_tools:GithubSearchTool",
+    "travel_guide": ".travel_guide_tool:TravelGuideTool",
+}
+
+
+def spec_factory(spec: str) -> Callable[[], Any]:
+    """Factory importing ``module:ClassName`` (relative to this package) and calling it"""
+    module_name, _, attribute = spec.partition(":")
+
+    def build() -> Any:
+        module = importlib.import_module(module_name, package=__package__)
+        return getattr(module, attribute)()
+    return build
+
+
+class ToolRegistry:
+    """
+    Named tool factories with one lazily built instance each
+
+    Building one tool never blocks callers of another; concurrent first
+    requests for the same tool build it once.
+    """
+
+    def __init__(self, factories: Optional[Dict[str, Callable[[], Any]]] = None):
+        self._factories: Dict[str, Callable[[], Any]] = dict(factories or {})
+        self._instances: Dict[str, Any] = {}
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any], replace: bool = False) -> None:
+        """
+        Add a tool factory
+
+        Raises:
+            ValueError: If ``name`` is taken and ``replace`` is False
+        """
+        with self._lock:
+            if name in self._factories and not replace:
+                raise ValueError(f"Tool already registered: {name}")
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._factories)
+
+    def is_built(self, name: str) -> bool:
+        with self._lock:
+            return name in self._instances
+
+    def get(self, name: str) -> Any:
+        """
+        Shared instance of a tool, built on first use
+
+        Raises:
+            KeyError: If no factory is registered under ``name``
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._factories:
+                raise KeyError(f"Unknown tool: {name}")
+            build_lock = self._build_locks.setdefault(name, threading.Lock())
+
+        with build_lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                instance = self._factories[name]()
+                with self._lock:
+                    self._instances[name] = instance
+        return instance
+
+    def get_many(self, names: Iterable[str]) -> List[Any]:
+        return [self.get(name) for name in names]
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Build tools ahead of the first request
+
+        Args:
+            names: Tools to build (all registered tools by default)
+
+        Returns:
+            Error message per tool that failed to build; the others are ready
+        """
+        errors: Dict[str, str] = {}
+        for name in (self.names() if names is None else names):
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"Failed to preload tool {name}: {str(e)}")
+                errors[name] = f"{type(e).__name__}: {str(e)}"
+        return errors
+
+    def reset(self, names: Optional[Iterable[str]] = None) -> None:
+        """Drop built instances so the next get() builds them again"""
+        with self._lock:
+            if names is None:
+                self._instances.clear()
+            else:
+                for name in names:
+                    self._instances.pop(name, None)
+
+
+_tool_registry: Optional[ToolRegistry] = None
+_tool_registry_lock = threading.Lock()
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Process-wide registry with the default tools registered"""
+    global _tool_registry
+    if _tool_registry is None:
+        with _tool_registry_lock:
+            if _tool_registry is None:
+                _tool_registry = ToolRegistry(
+                    {name: spec_factory(spec) for name, spec in DEFAULT_TOOL_SPECS.items()}
+                )
+    return _tool_registry
+
+
+def get_tool(name: str) -> Any:
+    """Shared instance of a registered tool"""
+    return get_tool_registry().get(name)
+
+
+def preload_tools_from_env() -> Dict[str, str]:
+    """Build the tools listed in GISTA_PRELOAD_TOOLS; returns build errors"""
+    names = [name.strip() for name in os.getenv("GISTA_PRELOAD_TOOLS", "").split(",") if name.strip()]
+    if not names:
+        return {}
+    errors = get_tool_registry().preload(names)
+    print(f"✓ Preloaded {len(names) - len(errors)} of {len(names)} tools")
+    return errors
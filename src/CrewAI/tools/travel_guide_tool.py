@@ -3,6 +3,8 @@ from crewai_tools import BaseTool, SerperDevTool
 from pydantic.v1 import BaseModel, Field  # Change to v1 explicitly
 from typing import List, Optional, Type
 
+from .search_cache import cached_search
+
 class TravelGuideSchema(BaseModel):
     """Schema for the travel guide tool - defines required and optional fields"""
     location: str = Field(..., description="The location to search for accommodations and attractions.")
@@ -34,14 +36,11 @@ class TravelGuideTool(BaseTool):
         location = kwargs['location']
         travel_date = kwargs['travel_date']
         
-        weather_results = self.search_tool._run(
-            search_query=f"weather in {location} on {travel_date}")
+        weather_results = cached_search(self.search_tool, f"weather in {location} on {travel_date}", "travel")
         
-        hotel_results = self.search_tool._run(
-            search_query=f"hotels in {location} on {travel_date}")
+        hotel_results = cached_search(self.search_tool, f"hotels in {location} on {travel_date}", "travel")
         
-        attractions_results = self.search_tool._run(
-            search_query=f"tourist attractions in {location}")
+        attractions_results = cached_search(self.search_tool, f"tourist attractions in {location}", "travel")
 
         return [
             f"Weather in {location} on {travel_date}: {weather_results}",
@@ -0,0 +1,109 @@
+"""
+Batch Approval Module
+=====================
+
+Request planning for ``POST /api/content/approve/batch``.
+
+A batch is a list of ``{userId, gistId, gistData}`` items, the same shape
+the single approval endpoint accepts. Items are validated one by one so a
+bad entry does not fail the whole batch, and items pointing at the same
+link (after URL normalization) share a single approval job:
+
+    plan = plan_batch(items)
+    for link, indexes in plan.groups.items():
+        ...one job per link, reported for every index...
+"""
+
+import math
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from ..tools.search_cache import normalize_url
+
+
+def normalize_link(link: str) -> str:
+    """Key used to detect duplicate links within a batch"""
+    link = link.strip()
+    if link.lower().startswith(("http://", "https://")):
+        return normalize_url(link)
+    return link
+
+
+class BatchPlan:
+    """Validated batch items grouped by normalized link"""
+
+    def __init__(self):
+        self.items: List[Dict[str, Any]] = []
+        # normalized link -> indexes of the items that share it
+        self.groups: "OrderedDict[str, List[int]]" = OrderedDict()
+        # normalized link -> link as first submitted, passed to the job
+        self.links: Dict[str, str] = {}
+        self.errors: Dict[int, str] = {}
+
+    @property
+    def duplicates(self) -> int:
+        """Number of valid items that reuse another item's job"""
+        return sum(len(indexes) - 1 for indexes in self.groups.values())
+
+
+def plan_batch(items: List[Any]) -> BatchPlan:
+    """
+    Validate batch items and group them by link
+
+    Args:
+        items: Request items, each ``{"userId", "gistId", "gistData": {"link"}}``
+
+    Returns:
+        BatchPlan with per-index validation errors and link groups
+    """
+    plan = BatchPlan()
+    for index, item in enumerate(items):
+        plan.items.append(item if isinstance(item, dict) else {})
+        if not isinstance(item, dict):
+            plan.errors[index] = "Item must be an object"
+            continue
+
+        gist_data = item.get("gistData") or {}
+        link = gist_data.get("link") if isinstance(gist_data, dict) else None
+        if not all([gist_data, item.get("userId"), item.get("gistId")]):
+            plan.errors[index] = "Missing required data"
+            continue
+        if not isinstance(link, str) or not link.strip():
+            plan.errors[index] = "Missing gistData.link"
+            continue
+
+        key = normalize_link(link)
+        if key not in plan.groups:
+            plan.groups[key] = []
+            plan.links[key] = link.strip()
+        plan.groups[key].append(index)
+    return plan
+
+
+def parse_wait_timeout(data: Dict[str, Any], max_wait: float) -> Optional[float]:
+    """
+    Read the batch request's ``wait`` and ``timeout`` options
+
+    Called before any job is queued, so a bad value is rejected without
+    leaving jobs running that a client retry would queue again.
+
+    Args:
+        data: Request body
+        max_wait: Longest wait allowed (CONTENT_APPROVAL_BATCH_WAIT)
+
+    Returns:
+        Seconds to wait for results, capped at ``max_wait``, or None when
+        the client does not wait
+
+    Raises:
+        ValueError: If ``wait`` is not a boolean or ``timeout`` is not a
+            non-negative number
+    """
+    wait = data.get("wait", False)
+    if not isinstance(wait, bool):
+        raise ValueError("wait must be true or false")
+    timeout = data.get("timeout", max_wait)
+    if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) \
+            or not math.isfinite(timeout) or timeout < 0:
+        raise ValueError("timeout must be a non-negative number of seconds")
+    return min(float(timeout), max_wait) if wait else None
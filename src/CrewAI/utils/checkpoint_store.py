@@ -0,0 +1,132 @@
+"""
+Checkpoint Store
+================
+
+SQLite persistence for Gista pipeline progress.
+
+Each finished unit of work is saved under ``(gist_id, stage, item)``:
+a whole stage uses the empty item, and stages that fan out (voice
+generation) save one item per segment. A re-run loads what is already
+there and only executes what is missing.
+
+    store = get_checkpoint_store()
+    store.save("gist-1", "script_production", script_text)
+    store.load("gist-1", "script_production")
+    store.first_incomplete("gist-1", PIPELINE_STAGES)
+
+Environment settings:
+    GISTA_CHECKPOINT_DB    SQLite file (default db/gista_checkpoints.sqlite3)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_CHECKPOINT_PATH = Path(__file__).resolve().parents[3] / "db" / "gista_checkpoints.sqlite3"
+
+STAGE_ITEM = ""
+
+
+class CheckpointStore:
+    """
+    Saved stage and item outputs keyed by gist ID
+
+    Args:
+        path: SQLite file path (":memory:" for a private in-memory store)
+    """
+
+    def __init__(self, path: str = str(DEFAULT_CHECKPOINT_PATH)):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "gist_id TEXT NOT NULL, stage TEXT NOT NULL, item TEXT NOT NULL, "
+            "output TEXT NOT NULL, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (gist_id, stage, item))"
+        )
+        self._db.commit()
+
+    def save(self, gist_id: str, stage: str, output: Any, item: str = STAGE_ITEM) -> None:
+        """
+        Record a finished stage (or one item of it)
+
+        Outputs are stored as JSON; values JSON cannot represent, such as
+        crew result objects, are stored as their string form.
+        """
+        payload = json.dumps(output, default=str)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints (gist_id, stage, item, output, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (gist_id, stage, item, payload, time.time())
+            )
+            self._db.commit()
+
+    def load(self, gist_id: str, stage: str, item: str = STAGE_ITEM) -> Optional[Any]:
+        """Saved output, or None if the stage or item has not finished"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT output FROM checkpoints WHERE gist_id = ? AND stage = ? AND item = ?",
+                (gist_id, stage, item)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def is_complete(self, gist_id: str, stage: str, item: str = STAGE_ITEM) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM checkpoints WHERE gist_id = ? AND stage = ? AND item = ?",
+                (gist_id, stage, item)
+            ).fetchone()
+        return row is not None
+
+    def items(self, gist_id: str, stage: str) -> Dict[str, Any]:
+        """Saved per-item outputs of a stage, excluding the stage entry"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT item, output FROM checkpoints WHERE gist_id = ? AND stage = ? AND item != ?",
+                (gist_id, stage, STAGE_ITEM)
+            ).fetchall()
+        return {item: json.loads(output) for item, output in rows}
+
+    def first_incomplete(self, gist_id: str, stages: Iterable[str]) -> Optional[str]:
+        """First stage without a stage checkpoint, or None if all finished"""
+        for stage in stages:
+            if not self.is_complete(gist_id, stage):
+                return stage
+        return None
+
+    def clear(self, gist_id: str, stage: Optional[str] = None) -> None:
+        """Forget a gist's checkpoints, or only those of one stage"""
+        with self._lock:
+            if stage is None:
+                self._db.execute("DELETE FROM checkpoints WHERE gist_id = ?", (gist_id,))
+            else:
+                self._db.execute(
+                    "DELETE FROM checkpoints WHERE gist_id = ? AND stage = ?", (gist_id, stage)
+                )
+            self._db.commit()
+
+
+_checkpoint_store: Optional[CheckpointStore] = None
+_checkpoint_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Process-wide store at GISTA_CHECKPOINT_DB"""
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        with _checkpoint_store_lock:
+            if _checkpoint_store is None:
+                _checkpoint_store = CheckpointStore(
+                    os.getenv("GISTA_CHECKPOINT_DB") or str(DEFAULT_CHECKPOINT_PATH)
+                )
+    return _checkpoint_store
@@ -0,0 +1,148 @@
+"""
+HTTP Connection Pools
+=====================
+
+Process-wide HTTP clients shared by the Gista tools, so scraping, search
+and TTS calls reuse keep-alive TCP/TLS connections instead of paying a
+new handshake on every request.
+
+    - ``get_http_session()``: a ``requests.Session`` with pooled adapters,
+      used for scraping, Serper and content snapshots.
+    - ``get_httpx_client()``: an ``httpx.Client`` for the ElevenLabs SDK;
+      HTTP/2 is used when the optional ``h2`` package is installed, so
+      concurrent segment syntheses share one connection.
+
+Both are created on first use and are safe to use from worker threads.
+The requests session carries no cookies between calls; tools pass any
+cookies per request.
+
+Environment settings:
+    HTTP_POOL_HOSTS          Hosts with a kept connection pool (default 32)
+    HTTP_POOL_PER_HOST       Connections kept per host (default 16)
+    HTTP_POOL_RETRIES        Retries for failed connects (default 2)
+    HTTP_POOL_HTTP2          Use HTTP/2 for httpx when h2 is available (default 1)
+    HTTP_POOL_TIMEOUT        Default httpx timeout in seconds (default 60);
+                             callers with their own setting, such as
+                             ELEVENLABS_TIMEOUT for TTS, override it per request
+"""
+
+import importlib.util
+import os
+import threading
+from typing import Any, Dict, Optional
+
+POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", "32"))
+POOL_PER_HOST = int(os.getenv("HTTP_POOL_PER_HOST", "16"))
+POOL_RETRIES = int(os.getenv("HTTP_POOL_RETRIES", "2"))
+POOL_HTTP2 = os.getenv("HTTP_POOL_HTTP2", "1").lower() not in ("0", "false", "no")
+POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "60"))
+
+
+def http2_available() -> bool:
+    """True when httpx can negotiate HTTP/2 (the ``h2`` package is installed)"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class _NoCookies:
+    """Cookie policy that stores nothing, so sessions do not leak state between tools"""
+
+    def set_ok(self, cookie: Any, request: Any) -> bool:
+        return False
+
+    def return_ok(self, cookie: Any, request: Any) -> bool:
+        return False
+
+    def domain_return_ok(self, domain: str, request: Any) -> bool:
+        return False
+
+    def path_return_ok(self, path: str, request: Any) -> bool:
+        return False
+
+
+def create_http_session(
+    pool_hosts: int = POOL_HOSTS,
+    pool_per_host: int = POOL_PER_HOST,
+    retries: int = POOL_RETRIES
+):
+    """
+    Build a ``requests.Session`` with keep-alive pools for http and https
+
+    Args:
+        pool_hosts: Number of hosts whose connection pools are kept
+        pool_per_host: Connections kept open per host
+        retries: Retries for connection failures (never for sent requests)
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.cookies.set_policy(_NoCookies())
+    adapter = HTTPAdapter(
+        pool_connections=pool_hosts,
+        pool_maxsize=pool_per_host,
+        max_retries=Retry(total=retries, connect=retries, read=0, status=0, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_httpx_client(
+    http2: Optional[bool] = None,
+    pool_per_host: int = POOL_PER_HOST,
+    timeout: float = POOL_TIMEOUT
+):
+    """
+    Build an ``httpx.Client`` with keep-alive limits
+
+    Args:
+        http2: Force HTTP/2 on or off (default: HTTP_POOL_HTTP2 and h2 installed)
+        pool_per_host: Keep-alive connections kept open
+        timeout: Default request timeout in seconds
+    """
+    import httpx
+
+    if http2 is None:
+        http2 = POOL_HTTP2 and http2_available()
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=POOL_HOSTS * pool_per_host,
+            max_keepalive_connections=pool_per_host
+        ),
+        timeout=timeout
+    )
+
+
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _shared(name: str, factory) -> Any:
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                client = _clients[name] = factory()
+    return client
+
+
+def get_http_session():
+    """Process-wide pooled ``requests.Session``"""
+    return _shared("requests", create_http_session)
+
+
+def get_httpx_client():
+    """Process-wide pooled ``httpx.Client`` (HTTP/2 when available)"""
+    return _shared("httpx", create_httpx_client)
+
+
+def close_http_clients() -> None:
+    """Close the shared clients; the next call to a getter creates new ones"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,176 @@
+"""
+Import Budget
+=============
+
+Measures what importing a module costs, using ``python -X importtime``
+in a fresh interpreter, and checks it against a budget.
+
+The report lists the slowest modules (cumulative time, including their
+own imports) and the cost per top-level package. The check fails when
+the target takes longer than the budget or pulls in a package that
+should only load on first use (crewai, langchain, provider SDKs):
+
+    python -m CrewAI.utils.import_budget CrewAI.main --budget-ms 1500
+
+Run from ``src/``. Exits with status 1 when the budget is exceeded.
+
+Environment settings:
+    IMPORT_BUDGET_MS    Default budget in milliseconds (default 1500)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_TARGET = "CrewAI.main"
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+
+# Packages that must not load while importing the app
+DEFAULT_DEFERRED = (
+    "crewai", "crewai_tools", "embedchain", "langchain", "langchain_core",
+    "langchain_community", "langchain_openai", "openai", "elevenlabs",
+    "cohere", "huggingface_hub"
+)
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+
+class ImportRecord:
+    """One ``-X importtime`` line"""
+
+    def __init__(self, name: str, self_us: int, cumulative_us: int, depth: int):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+    @property
+    def package(self) -> str:
+        return self.name.split(".")[0]
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` stderr into records, skipping other lines"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        records.append(ImportRecord(name, int(parts[0]), int(parts[1]), depth))
+    return records
+
+
+class ImportReport:
+    """Import cost of one target module"""
+
+    def __init__(self, target: str, records: List[ImportRecord]):
+        self.target = target
+        self.records = records
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of the target itself"""
+        for record in self.records:
+            if record.name == self.target:
+                return record.cumulative_us / 1000
+        return sum(record.self_us for record in self.records) / 1000
+
+    def slowest(self, limit: int = 15) -> List[ImportRecord]:
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:limit]
+
+    def by_package(self) -> Dict[str, float]:
+        """Milliseconds of self time per top-level package, slowest first"""
+        totals: Dict[str, float] = {}
+        for record in self.records:
+            totals[record.package] = totals.get(record.package, 0.0) + record.self_us / 1000
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def loaded(self, packages: Iterable[str]) -> List[str]:
+        """Which of ``packages`` were imported"""
+        present = {record.package for record in self.records}
+        return [package for package in packages if package in present]
+
+    def to_dict(self, limit: int = 15) -> Dict[str, object]:
+        return {
+            "target": self.target,
+            "total_ms": round(self.total_ms, 2),
+            "modules": len(self.records),
+            "slowest": [
+                {"module": r.name, "self_ms": round(r.self_us / 1000, 2), "cumulative_ms": round(r.cumulative_us / 1000, 2)}
+                for r in self.slowest(limit)
+            ],
+            "packages": {name: round(ms, 2) for name, ms in self.by_package().items()}
+        }
+
+
+def measure_imports(target: str = DEFAULT_TARGET, python: str = sys.executable) -> ImportReport:
+    """
+    Import ``target`` in a fresh interpreter with ``-X importtime``
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, cwd=str(SRC_DIR), env=env
+    )
+    if completed.returncode != 0:
+        errors = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {target} failed:\n" + "\n".join(errors[-15:]))
+    return ImportReport(target, parse_importtime(completed.stderr))
+
+
+def check_budget(
+    report: ImportReport,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    deferred: Iterable[str] = DEFAULT_DEFERRED
+) -> List[str]:
+    """Budget violations of a report; empty when within budget"""
+    violations = []
+    if report.total_ms > budget_ms:
+        violations.append(f"{report.target} took {report.total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    for package in report.loaded(deferred):
+        violations.append(f"{report.target} imports {package}, which should load on first use")
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report and check the import cost of a module")
+    parser.add_argument("target", nargs="?", default=DEFAULT_TARGET, help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Allowed import time")
+    parser.add_argument("--deferred", default=",".join(DEFAULT_DEFERRED),
+                        help="Comma-separated packages that must not be imported (empty to allow all)")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    args = parser.parse_args(argv)
+
+    report = measure_imports(args.target)
+    print(f"Import of {args.target}: {report.total_ms:.1f} ms, {len(report.records)} modules")
+    print("\nSlowest modules (cumulative ms / self ms):")
+    for record in report.slowest(args.top):
+        print(f"  {record.cumulative_us / 1000:>9.1f}  {record.self_us / 1000:>8.1f}  {record.name}")
+    print("\nSelf time by package (ms):")
+    for package, ms in list(report.by_package().items())[:args.top]:
+        print(f"  {ms:>9.1f}  {package}")
+
+    deferred = [name.strip() for name in args.deferred.split(",") if name.strip()]
+    violations = check_budget(report, args.budget_ms, deferred)
+    for violation in violations:
+        print(f"✗ {violation}")
+    if violations:
+        return 1
+    print(f"\n✓ Within budget ({args.budget_ms:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
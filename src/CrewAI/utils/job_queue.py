@@ -0,0 +1,228 @@
+"""
+Job Queue Module
+================
+
+Bounded background execution for long-running crew work.
+
+The Flask endpoints hand crew runs to a ``JobQueue`` instead of executing
+them inside the request thread. Each submission returns a ``Job`` whose
+state moves through:
+
+    queued → running → done | failed
+
+Finished jobs are kept for ``result_ttl`` seconds so clients can poll
+``GET /api/content/jobs/<id>`` for the outcome, including a ``timings``
+breakdown of the tools, tasks and crews the job ran.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .metrics import track_job
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the queue already holds ``max_pending`` unfinished jobs"""
+
+
+class Job:
+    """State and outcome of a single queued unit of work"""
+
+    def __init__(self, name: str, metadata: Optional[Dict[str, Any]] = None):
+        self.job_id = uuid.uuid4().hex
+        self.name = name
+        self.metadata = metadata or {}
+        self.status = JOB_QUEUED
+        self.result: Any = None
+        self.error: Optional[Dict[str, str]] = None
+        self.timings: Optional[Dict[str, Any]] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._finished = threading.Event()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JOB_DONE, JOB_FAILED)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; False if the timeout expired first"""
+        return self._finished.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the job"""
+        return {
+            "jobId": self.job_id,
+            "name": self.name,
+            "status": self.status,
+            "metadata": self.metadata,
+            "result": self.result,
+            "error": self.error,
+            "timings": self.timings,
+            "createdAt": self.created_at,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at
+        }
+
+
+class JobQueue:
+    """
+    Runs submitted callables on a bounded worker pool.
+
+    Args:
+        max_workers: Number of jobs allowed to run at the same time
+        max_pending: Maximum number of queued + running jobs before
+            ``submit`` starts rejecting work
+        result_ttl: Seconds a finished job stays available for polling
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 50, result_ttl: int = 3600):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="gista-job"
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        name: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> Job:
+        """
+        Queue ``fn(*args, **kwargs)`` for background execution
+
+        Returns:
+            Job: The queued job, already registered for polling
+
+        Raises:
+            JobQueueFullError: If ``max_pending`` unfinished jobs exist
+        """
+        job = Job(name=name or getattr(fn, "__name__", "job"), metadata=metadata)
+
+        with self._lock:
+            self._prune()
+            pending = sum(1 for j in self._jobs.values() if not j.is_finished)
+            if pending >= self.max_pending:
+                raise JobQueueFullError(
+                    f"Job queue is full ({pending} pending, limit {self.max_pending})"
+                )
+            self._jobs[job.job_id] = job
+
+        self._executor.submit(self._execute, job, fn, args, kwargs)
+        return job
+
+    def submit_many(
+        self,
+        fn: Callable[..., Any],
+        args_list: Sequence[tuple],
+        name: Optional[str] = None,
+        metadata: Optional[Sequence[Dict[str, Any]]] = None
+    ) -> List[Job]:
+        """
+        Queue ``fn(*args)`` once per entry of ``args_list``, all or nothing
+
+        Returns:
+            List[Job]: One job per entry, in order
+
+        Raises:
+            JobQueueFullError: If the batch does not fit in ``max_pending``;
+                no job of the batch is queued in that case
+        """
+        name = name or getattr(fn, "__name__", "job")
+        jobs = [
+            Job(name=name, metadata=metadata[i] if metadata else None)
+            for i in range(len(args_list))
+        ]
+
+        with self._lock:
+            self._prune()
+            pending = sum(1 for j in self._jobs.values() if not j.is_finished)
+            if pending + len(jobs) > self.max_pending:
+                raise JobQueueFullError(
+                    f"Job queue cannot take {len(jobs)} jobs "
+                    f"({pending} pending, limit {self.max_pending})"
+                )
+            for job in jobs:
+                self._jobs[job.job_id] = job
+
+        for job, args in zip(jobs, args_list):
+            self._executor.submit(self._execute, job, fn, tuple(args), {})
+        return jobs
+
+    def wait(self, jobs: Sequence[Job], timeout: Optional[float] = None) -> bool:
+        """
+        Wait for several jobs, sharing one overall timeout
+
+        Returns:
+            bool: True if every job finished before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job in jobs:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not job.wait(remaining):
+                return False
+        return True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by ID, or None if unknown or expired"""
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Count known jobs by status"""
+        with self._lock:
+            counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_DONE: 0, JOB_FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and optionally wait for running jobs"""
+        self._executor.shutdown(wait=wait)
+
+    def _execute(self, job: Job, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        timings = None
+        try:
+            with track_job(job.job_id) as timings:
+                job.result = fn(*args, **kwargs)
+            job.status = JOB_DONE
+        except Exception as e:
+            print(f"Job {job.job_id} ({job.name}) failed: {str(e)}")
+            job.error = {
+                "error_message": str(e),
+                "error_type": type(e).__name__
+            }
+            job.status = JOB_FAILED
+        finally:
+            if timings is not None:
+                job.timings = timings.summary()
+            job.finished_at = time.time()
+            job._finished.set()
+
+    def _prune(self):
+        """Drop finished jobs older than ``result_ttl``. Caller holds the lock."""
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.is_finished and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
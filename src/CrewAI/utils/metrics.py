@@ -0,0 +1,409 @@
+"""
+Metrics Module
+==============
+
+Latency, token, byte and cache instrumentation for crews and tools.
+
+Measurements go to two places:
+
+    - A process-wide registry of counters and latency histograms, served
+      in the Prometheus text format by ``GET /metrics``.
+    - The collector of the job currently running (if any), which becomes
+      the per-job ``timings`` breakdown in the job result.
+
+The current job is tracked with a context variable. Work handed to a
+thread pool keeps reporting to its job when submitted through
+``context_bound``:
+
+    executor.submit(context_bound(fn), *args)
+
+Example:
+    @instrument_tool
+    class MyTool(BaseTool):
+        def _run(self, query: str) -> str: ...
+
+    with track_job("job-1") as timings:
+        ...
+    timings.summary()
+"""
+
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms with Prometheus text output"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def inc(self, metric: str, value: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(metric, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, metric: str, value: float, **labels: Any) -> None:
+        """Record one observation; stored as bucket counts, then sum and count"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(metric, {})
+            state = series.get(key)
+            if state is None:
+                state = series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def value(self, metric: str, **labels: Any) -> float:
+        """Current counter value, or a histogram's observation count"""
+        key = _label_key(labels)
+        with self._lock:
+            if metric in self._counters:
+                return self._counters[metric].get(key, 0.0)
+            state = self._histograms.get(metric, {}).get(key)
+            return state[-1] if state else 0.0
+
+    def render(self) -> str:
+        """All series in the Prometheus text exposition format"""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {value:g}")
+            for name in sorted(self._histograms):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, state in sorted(self._histograms[name].items()):
+                    for i, bound in enumerate(self.buckets):
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {state[i]:g}")
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {state[-1]:g}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {state[-2]:g}")
+                    lines.append(f"{name}_count{_format_labels(key)} {state[-1]:g}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+registry = MetricsRegistry()
+registry.describe("gista_tool_seconds", "Wall time of tool runs")
+registry.describe("gista_tool_calls_total", "Tool runs by outcome")
+registry.describe("gista_task_seconds", "Wall time of crew tasks by agent role")
+registry.describe("gista_crew_seconds", "Wall time of crew runs")
+registry.describe("gista_llm_tokens_total", "LLM tokens used by crews")
+registry.describe("gista_bytes_fetched_total", "Bytes downloaded from external sources")
+registry.describe("gista_cache_requests_total", "Cache lookups by result")
+
+
+class JobTimings:
+    """Per-job collector of spans, tokens, bytes and cache lookups"""
+
+    def __init__(self, job_id: Optional[str] = None):
+        self.job_id = job_id
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.tokens: Dict[str, int] = {}
+        self.bytes_fetched: Dict[str, int] = {}
+        self.cache: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, kind: str, name: str, seconds: float, **details: Any) -> None:
+        with self._lock:
+            self.spans.append({
+                "kind": kind,
+                "name": name,
+                "offset_seconds": round(time.monotonic() - seconds - self.started, 4),
+                "seconds": round(seconds, 4),
+                **details
+            })
+
+    def add_tokens(self, usage: Dict[str, Any]) -> None:
+        with self._lock:
+            for key, value in usage.items():
+                if isinstance(value, (int, float)):
+                    self.tokens[key] = self.tokens.get(key, 0) + int(value)
+
+    def add_bytes(self, source: str, size: int) -> None:
+        with self._lock:
+            self.bytes_fetched[source] = self.bytes_fetched.get(source, 0) + size
+
+    def add_cache(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            counts = self.cache.setdefault(cache, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Breakdown for the job result, totals per kind and name"""
+        with self._lock:
+            totals: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for span in self.spans:
+                entry = totals.setdefault(span["kind"], {}).setdefault(
+                    span["name"], {"calls": 0, "seconds": 0.0}
+                )
+                entry["calls"] += 1
+                entry["seconds"] = round(entry["seconds"] + span["seconds"], 4)
+            end = self.finished if self.finished is not None else time.monotonic()
+            return {
+                "total_seconds": round(end - self.started, 4),
+                "totals": totals,
+                "spans": list(self.spans),
+                "llm_tokens": dict(self.tokens),
+                "bytes_fetched": dict(self.bytes_fetched),
+                "cache": {name: dict(counts) for name, counts in self.cache.items()}
+            }
+
+
+_current_job: contextvars.ContextVar[Optional[JobTimings]] = contextvars.ContextVar(
+    "gista_current_job", default=None
+)
+
+
+def current_job() -> Optional[JobTimings]:
+    return _current_job.get()
+
+
+@contextmanager
+def track_job(job_id: Optional[str] = None) -> Iterator[JobTimings]:
+    """Collect everything recorded in this context (and bound threads) for one job"""
+    timings = JobTimings(job_id)
+    token = _current_job.set(timings)
+    try:
+        yield timings
+    finally:
+        timings.finished = time.monotonic()
+        _current_job.reset(token)
+
+
+def context_bound(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``fn`` to run in a copy of the caller's context (for thread pools)"""
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        # A context can only be entered by one thread at a time, so each
+        # call runs in its own copy
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+
+def record_bytes(source: str, size: int) -> None:
+    registry.inc("gista_bytes_fetched_total", size, source=source)
+    job = _current_job.get()
+    if job is not None:
+        job.add_bytes(source, size)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    registry.inc("gista_cache_requests_total", cache=cache, result="hit" if hit else "miss")
+    job = _current_job.get()
+    if job is not None:
+        job.add_cache(cache, hit)
+
+
+def record_tokens(scope: str, usage: Optional[Dict[str, Any]]) -> None:
+    """Record a crewai token summary (prompt_tokens, completion_tokens, ...)"""
+    if not usage:
+        return
+    for kind in ("prompt_tokens", "completion_tokens"):
+        if usage.get(kind):
+            registry.inc("gista_llm_tokens_total", usage[kind], scope=scope, type=kind[:-len("_tokens")])
+    job = _current_job.get()
+    if job is not None:
+        job.add_tokens(usage)
+
+
+@contextmanager
+def timed(kind: str, name: str, **details: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block as a span of ``kind`` (tool, task, crew, ...)
+
+    The yielded dict can be filled with extra span details, e.g. tokens.
+    """
+    started = time.monotonic()
+    status = "ok"
+    try:
+        yield details
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record_span(kind, name, time.monotonic() - started, status, **details)
+
+
+def record_span(kind: str, name: str, seconds: float, status: str = "ok", **details: Any) -> None:
+    """Record a span measured elsewhere, e.g. from a crewai callback"""
+    registry.observe(f"gista_{kind}_seconds", seconds, name=name)
+    if kind == "tool":
+        registry.inc("gista_tool_calls_total", name=name, status=status)
+    job = _current_job.get()
+    if job is not None:
+        job.add_span(kind, name, seconds, status=status, **details)
+
+
+def _token_summary(agent: Any) -> Optional[Dict[str, Any]]:
+    process = getattr(agent, "_token_process", None)
+    try:
+        return dict(process.get_summary()) if process is not None else None
+    except Exception:
+        return None
+
+
+def token_delta(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    if not after:
+        return {}
+    before = before or {}
+    return {
+        key: int(value) - int(before.get(key, 0))
+        for key, value in after.items() if isinstance(value, (int, float))
+    }
+
+
+@contextmanager
+def timed_task(task: Any) -> Iterator[None]:
+    """
+    Time a crew task and attribute its agent's LLM tokens to it
+
+    Token counts are the change in the agent's running totals, which is
+    exact as long as the agent runs one task at a time.
+    """
+    agent = getattr(task, "agent", None)
+    name = getattr(agent, "role", None) or "unassigned"
+    before = _token_summary(agent)
+    with timed("task", name) as details:
+        try:
+            yield
+        finally:
+            usage = token_delta(before, _token_summary(agent))
+            if usage:
+                details["llm_tokens"] = usage
+                record_tokens(f"task:{name}", usage)
+
+
+def crew_token_summary(crew: Any) -> Dict[str, int]:
+    """Running token totals of all the crew's agents"""
+    totals: Dict[str, int] = {}
+    for agent in getattr(crew, "agents", None) or []:
+        for key, value in (_token_summary(agent) or {}).items():
+            if isinstance(value, (int, float)):
+                totals[key] = totals.get(key, 0) + int(value)
+    return totals
+
+
+def record_crew(name: str, crew: Any, seconds: float, usage: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Record a finished crew run
+
+    Tokens are counted by the crew's task spans; the crew span only
+    carries their sum, ``usage`` (default: the crew's ``usage_metrics``).
+    """
+    registry.observe("gista_crew_seconds", seconds, name=name)
+    if usage is None:
+        usage = getattr(crew, "usage_metrics", None)
+    job = _current_job.get()
+    if job is not None:
+        job.add_span("crew", name, seconds, llm_tokens=dict(usage or {}))
+
+
+@contextmanager
+def timed_crew(crew: Any, name: str) -> Iterator[None]:
+    """
+    Time a sequential ``crew.kickoff`` with a span per task
+
+    A ``task_callback`` closes each task's span as it finishes, with the
+    tokens its agent used since its previous task. Token counts are
+    changes in the agents' running totals, so agents reused across
+    kickoffs (e.g. from a team pool) are not counted again.
+    """
+    agents = getattr(crew, "agents", None) or []
+    agent_tokens = {id(agent): _token_summary(agent) for agent in agents}
+    pending = list(getattr(crew, "tasks", None) or [])
+    crew_before = crew_token_summary(crew)
+    previous_callback = crew.task_callback
+    last_finished = [time.monotonic()]
+
+    def on_task_finished(output: Any) -> None:
+        description = getattr(output, "description", None)
+        task = next((t for t in pending if t.description == description), pending[0] if pending else None)
+        if task is not None:
+            pending.remove(task)
+        agent = getattr(task, "agent", None)
+        role = getattr(agent, "role", None) or "unassigned"
+        now = time.monotonic()
+        details: Dict[str, Any] = {}
+        if agent is not None:
+            after = _token_summary(agent)
+            usage = token_delta(agent_tokens.get(id(agent)), after)
+            agent_tokens[id(agent)] = after
+            if usage:
+                details["llm_tokens"] = usage
+                record_tokens(f"task:{role}", usage)
+        record_span("task", role, now - last_finished[0], **details)
+        last_finished[0] = now
+        if previous_callback is not None:
+            previous_callback(output)
+
+    crew.task_callback = on_task_finished
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        crew.task_callback = previous_callback
+    record_crew(name, crew, time.monotonic() - started, token_delta(crew_before, crew_token_summary(crew)))
+
+
+def instrument_tool(cls):
+    """
+    Class decorator timing every ``_run`` of a tool
+
+    The wrapper keeps ``_run``'s signature and annotations, which
+    crewai_tools uses to build the tool's argument schema.
+    """
+    run = cls.__dict__["_run"]
+
+    @functools.wraps(run)
+    def _run(self, *args: Any, **kwargs: Any) -> Any:
+        with timed("tool", getattr(self, "name", None) or cls.__name__):
+            return run(self, *args, **kwargs)
+
+    cls._run = _run
+    return cls
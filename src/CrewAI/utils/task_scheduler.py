@@ -0,0 +1,236 @@
+"""
+Task Scheduler
+==============
+
+Runs crew tasks as a dependency graph instead of one after another.
+
+Edges come from each task's ``context``: a task starts once every task in
+its context has finished, and tasks with no path between them run at the
+same time on a worker pool. Episode time then approaches the critical
+path (e.g. content_analysis → terminology_analysis | background_research
+→ content_presentation) instead of the sum of all tasks.
+
+Two rules keep this safe with crewai agents:
+
+    - Tasks that share an agent never run concurrently; an agent holds a
+      single executor whose state is replaced on every task.
+    - Only declared context is passed on. A task without ``context``
+      starts immediately and does not see the previous task's output the
+      way it would in a sequential crew.
+
+Example:
+    result = run_crew(crew)                 # drop-in for crew.kickoff()
+    graph = TaskGraph(tasks)
+    graph.levels()                          # tasks that can run together
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .metrics import context_bound, crew_token_summary, record_crew, timed_task, token_delta
+
+DEFAULT_MAX_WORKERS = int(os.getenv("TASK_SCHEDULER_MAX_WORKERS", "4"))
+
+
+class TaskGraph:
+    """
+    Dependency graph over a list of tasks
+
+    Context entries that are not in ``tasks`` are treated as already
+    finished (their output is read by the task itself).
+
+    Args:
+        tasks: Tasks in declaration order; ties are started in this order
+
+    Raises:
+        TypeError: If a context entry is not a task (e.g. a dict)
+        ValueError: If the context edges form a cycle
+    """
+
+    def __init__(self, tasks: Sequence[Any]):
+        self.tasks = list(tasks)
+        positions = {id(task): index for index, task in enumerate(self.tasks)}
+
+        self.dependencies: List[Set[int]] = []
+        self.dependents: List[List[int]] = [[] for _ in self.tasks]
+        for index, task in enumerate(self.tasks):
+            deps = set()
+            for upstream in getattr(task, "context", None) or []:
+                if isinstance(upstream, dict) or not hasattr(upstream, "execute"):
+                    raise TypeError(
+                        f"Task {index} has a context entry that is not a task: {type(upstream).__name__}"
+                    )
+                if id(upstream) in positions:
+                    deps.add(positions[id(upstream)])
+            self.dependencies.append(deps)
+            for dep in deps:
+                self.dependents[dep].append(index)
+
+        self.timings: Dict[int, Dict[str, float]] = {}
+        self._check_acyclic()
+
+    def levels(self) -> List[List[int]]:
+        """Task indexes grouped by dependency depth; each group can run together"""
+        depth: Dict[int, int] = {}
+        for index in self._topological_order():
+            depth[index] = max((depth[dep] + 1 for dep in self.dependencies[index]), default=0)
+        groups: List[List[int]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for index in range(len(self.tasks)):
+            groups[depth[index]].append(index)
+        return groups
+
+    def critical_path(self, durations: Optional[Dict[int, float]] = None) -> float:
+        """
+        Longest dependency chain, in seconds
+
+        Args:
+            durations: Seconds per task index (the last run's timings by default)
+        """
+        if durations is None:
+            durations = {i: t["end"] - t["start"] for i, t in self.timings.items()}
+        finish: Dict[int, float] = {}
+        for index in self._topological_order():
+            start = max((finish[dep] for dep in self.dependencies[index]), default=0.0)
+            finish[index] = start + durations.get(index, 0.0)
+        return max(finish.values(), default=0.0)
+
+    def run(self, max_workers: int = DEFAULT_MAX_WORKERS) -> List[Any]:
+        """
+        Execute every task, honoring dependencies and agent exclusivity
+
+        If a task raises, no new tasks are started; running tasks are
+        allowed to finish and the first error is re-raised.
+
+        Returns:
+            Task outputs in task order
+        """
+        outputs: List[Any] = [None] * len(self.tasks)
+        remaining = [len(deps) for deps in self.dependencies]
+        ready = [index for index, count in enumerate(remaining) if count == 0]
+        busy_agents: Set[int] = set()
+        running: Dict[Future, int] = {}
+        error: Optional[BaseException] = None
+        self.timings = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="gista-task") as executor:
+            while ready or running:
+                if error is None:
+                    for index in sorted(ready):
+                        agent = getattr(self.tasks[index], "agent", None)
+                        if agent is not None and id(agent) in busy_agents:
+                            continue
+                        ready.remove(index)
+                        if agent is not None:
+                            busy_agents.add(id(agent))
+                        running[executor.submit(context_bound(self._execute), index)] = index
+
+                if not running:
+                    # Everything finished, or an error stopped new work
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    agent = getattr(self.tasks[index], "agent", None)
+                    if agent is not None:
+                        busy_agents.discard(id(agent))
+                    try:
+                        outputs[index] = future.result()
+                    except BaseException as e:
+                        print(f"Task {index} failed: {str(e)}")
+                        if error is None:
+                            error = e
+                        continue
+                    for dependent in self.dependents[index]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            ready.append(dependent)
+
+        if error is not None:
+            raise error
+        return outputs
+
+    def stats(self) -> Dict[str, float]:
+        """Wall time of the last run compared with its serial and critical-path time"""
+        if not self.timings:
+            return {"elapsed_seconds": 0.0, "serial_seconds": 0.0, "critical_path_seconds": 0.0}
+        starts = [t["start"] for t in self.timings.values()]
+        ends = [t["end"] for t in self.timings.values()]
+        return {
+            "elapsed_seconds": max(ends) - min(starts),
+            "serial_seconds": sum(t["end"] - t["start"] for t in self.timings.values()),
+            "critical_path_seconds": self.critical_path()
+        }
+
+    def _execute(self, index: int) -> Any:
+        task = self.tasks[index]
+        started = time.monotonic()
+        try:
+            with timed_task(task):
+                result = task.execute()
+                if getattr(task, "async_execution", False) and getattr(task, "thread", None) is not None:
+                    task.thread.join()
+                    result = task.output.exported_output if task.output else None
+            return result
+        finally:
+            self.timings[index] = {"start": started, "end": time.monotonic()}
+
+    def _topological_order(self) -> List[int]:
+        remaining = [len(deps) for deps in self.dependencies]
+        queue = [index for index, count in enumerate(remaining) if count == 0]
+        order: List[int] = []
+        while queue:
+            index = queue.pop(0)
+            order.append(index)
+            for dependent in self.dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+        return order
+
+    def _check_acyclic(self) -> None:
+        order = self._topological_order()
+        if len(order) != len(self.tasks):
+            cyclic = sorted(set(range(len(self.tasks))) - set(order))
+            raise ValueError(f"Task context forms a cycle between tasks {cyclic}")
+
+
+def run_crew(crew: Any, max_workers: int = DEFAULT_MAX_WORKERS, name: str = "crew") -> Any:
+    """
+    Run a sequential crew's tasks through a TaskGraph
+
+    Prepares the agents the way ``Crew.kickoff`` does, then executes the
+    graph and records ``usage_metrics`` on the crew. Inputs are not
+    interpolated; put them in the task descriptions.
+
+    Args:
+        crew: Crew to run
+        max_workers: Tasks that may run at the same time
+        name: Label for the crew's latency and token metrics
+
+    Returns:
+        Output of the last task, like ``kickoff`` for a sequential crew
+    """
+    from crewai.utilities import I18N
+
+    i18n = I18N(language=crew.language, language_file=crew.language_file)
+    for agent in crew.agents:
+        agent.i18n = i18n
+        agent.crew = crew
+        if not agent.function_calling_llm:
+            agent.function_calling_llm = crew.function_calling_llm
+        if not agent.step_callback:
+            agent.step_callback = crew.step_callback
+        agent.create_agent_executor()
+
+    graph = TaskGraph(crew.tasks)
+    tokens_before = crew_token_summary(crew)
+    started = time.monotonic()
+    outputs = graph.run(max_workers=max_workers)
+    print(f"Task graph finished: {graph.stats()}")
+
+    # Agents keep running totals, so only this run's share is reported
+    crew.usage_metrics = token_delta(tokens_before, crew_token_summary(crew))
+    record_crew(name, crew, time.monotonic() - started)
+    return outputs[-1] if outputs else ""